@@ -0,0 +1,111 @@
+import importlib.util
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import torch
+from transformers import pipeline
+
+logger = logging.getLogger("py-ai-service")
+
+TORCH = "torch"
+TORCH_INT8 = "torch-int8"
+ONNX = "onnx"
+INFERENCE_BACKENDS = {TORCH, TORCH_INT8, ONNX}
+
+ONNX_CACHE_DIR = Path(os.getenv("ONNX_CACHE_DIR", str(Path(__file__).resolve().parent / ".onnx-cache")))
+
+_ORT_MODEL_CLASSES = {
+    "text-classification": "ORTModelForSequenceClassification",
+    "summarization": "ORTModelForSeq2SeqLM",
+    "translation": "ORTModelForSeq2SeqLM",
+}
+
+
+def onnx_available() -> bool:
+    try:
+        return importlib.util.find_spec("optimum.onnxruntime") is not None
+    except ImportError:  # "optimum" itself is missing
+        return False
+
+
+def backend_for(name: str, default: str) -> str:
+    """
+    Backend for one model: <NAME>_BACKEND (e.g. SUMMARIZER_BACKEND) overrides
+    the service-wide default. ONNX falls back to torch here, at startup, when
+    optimum[onnxruntime] is not installed.
+    """
+    backend = os.getenv(f"{name.upper()}_BACKEND", default).lower()
+    if backend not in INFERENCE_BACKENDS:
+        logger.warning("Unknown inference backend %s for %s; using %s", backend, name, TORCH)
+        return TORCH
+    if backend == ONNX and not onnx_available():
+        logger.warning("optimum[onnxruntime] not installed; using %s for %s", TORCH, name)
+        return TORCH
+    return backend
+
+
+def loaded_backend(pipe: Any) -> str:
+    """The backend a build_pipeline result actually runs on."""
+    return getattr(pipe, "inference_backend", TORCH)
+
+
+def _quantize_dynamic(pipe: Any, model_name: str) -> Any:
+    # Dynamic int8 quantization swaps nn.Linear weights for int8 kernels; CPU only.
+    pipe.model = torch.quantization.quantize_dynamic(pipe.model, {torch.nn.Linear}, dtype=torch.qint8)
+    logger.info("Applied dynamic int8 quantization model=%s", model_name)
+    return pipe
+
+
+def _load_onnx(task: str, model_name: str, device: int, **kwargs: Any) -> Any:
+    # Optional dependency: only needed when a model is configured for ONNX Runtime.
+    import optimum.onnxruntime as ort
+    from transformers import AutoTokenizer
+
+    model_class = getattr(ort, _ORT_MODEL_CLASSES[task])
+    export_dir = ONNX_CACHE_DIR / re.sub(r"[^\w.-]+", "__", model_name)
+    provider = "CUDAExecutionProvider" if device >= 0 else "CPUExecutionProvider"
+
+    if (export_dir / "config.json").exists():
+        model = model_class.from_pretrained(export_dir, provider=provider)
+        tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    else:
+        logger.info("Exporting %s to ONNX at %s", model_name, export_dir)
+        model = model_class.from_pretrained(model_name, export=True, provider=provider)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model.save_pretrained(export_dir)
+        tokenizer.save_pretrained(export_dir)
+
+    return pipeline(task, model=model, tokenizer=tokenizer, **kwargs)
+
+
+def build_pipeline(task: str, model_name: str, backend: str, device: int, **kwargs: Any) -> Any:
+    """
+    Same call signature and outputs as transformers.pipeline, backed by plain
+    torch, dynamically quantized torch, or ONNX Runtime. Falls back to torch
+    when the requested backend cannot be used; the backend actually loaded is
+    recorded on the pipeline (see loaded_backend).
+    """
+    if backend == ONNX:
+        try:
+            pipe = _load_onnx(task, model_name, device, **kwargs)
+            pipe.inference_backend = ONNX
+            return pipe
+        except ImportError:
+            logger.warning("optimum[onnxruntime] not installed; loading %s with torch", model_name)
+        except Exception:
+            logger.exception("ONNX Runtime load failed for %s; loading with torch", model_name)
+
+    pipe = pipeline(task, model=model_name, device=device, **kwargs)
+    pipe.inference_backend = TORCH
+
+    if backend == TORCH_INT8:
+        if device >= 0:
+            logger.warning("Dynamic int8 quantization is CPU only; keeping fp32 for %s on GPU", model_name)
+        else:
+            pipe = _quantize_dynamic(pipe, model_name)
+            pipe.inference_backend = TORCH_INT8
+
+    return pipe
@@ -0,0 +1,140 @@
+import asyncio
+import inspect
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Set, Tuple
+
+from executors import ExecutorSaturated
+
+logger = logging.getLogger("py-ai-service")
+
+
+class MicroBatcher:
+    """
+    Collects items submitted by concurrent requests for a short window and
+    hands them to `handler` as one batch. `handler` receives a list of items
+    and must return (or be a coroutine returning) a list of results in the
+    same order.
+
+    At most `max_concurrency` batches run at once (0 = no limit); further
+    batches wait here, so one large request never overflows the executors
+    the handler calls. Admission counts requests: a request is rejected
+    with ExecutorSaturated only if `max_queued_items` items from earlier
+    requests are still unfinished, never because of its own size.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_concurrency: int = 0,
+        max_queued_items: int = 0,
+        retry_after_s: int = 1,
+    ):
+        self.name = name
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000
+        self.max_concurrency = max(0, max_concurrency)
+        self.max_queued_items = max(0, max_queued_items)
+        self.retry_after_s = retry_after_s
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        # Flushed batches waiting for a free concurrency slot
+        self._ready: Deque[List[Tuple[Any, asyncio.Future]]] = deque()
+        self._active = 0
+        self._flush_timer: Optional[asyncio.Task] = None
+        # Keep references so running batches are not garbage collected mid-flight.
+        self._running: Set[asyncio.Task] = set()
+        # Admitted items whose batch has not finished running. Released per batch rather
+        # than per request, so items still queued after a failed or cancelled request count.
+        self._unfinished = 0
+        self.batches_run = 0
+        self.items_run = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending) + sum(len(batch) for batch in self._ready)
+
+    def _admit(self, count: int) -> None:
+        if self.max_queued_items and self._unfinished >= self.max_queued_items:
+            self.rejected += 1
+            logger.warning(
+                "[Batch][%s] saturated unfinished=%s maxQueuedItems=%s", self.name, self._unfinished, self.max_queued_items
+            )
+            raise ExecutorSaturated(self.name, self.retry_after_s)
+        self._unfinished += count
+
+    def _enqueue(self, item: Any) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(self.max_batch_size)
+        elif self._flush_timer is None:
+            self._flush_timer = loop.create_task(self._flush_after_wait())
+        return future
+
+    async def submit(self, item: Any) -> Any:
+        return (await self.submit_many([item]))[0]
+
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        self._admit(len(items))
+        return list(await asyncio.gather(*(self._enqueue(item) for item in items)))
+
+    async def _flush_after_wait(self) -> None:
+        try:
+            await asyncio.sleep(self.max_wait_s)
+        finally:
+            self._flush_timer = None
+        while self._pending:
+            self._flush(self.max_batch_size)
+
+    def _flush(self, limit: int) -> None:
+        batch = self._pending[:limit]
+        self._pending = self._pending[limit:]
+        if batch:
+            self._ready.append(batch)
+            self._start_ready()
+
+    def _start_ready(self) -> None:
+        while self._ready and (not self.max_concurrency or self._active < self.max_concurrency):
+            self._active += 1
+            task = asyncio.get_running_loop().create_task(self._run_batch(self._ready.popleft()))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            await self._run_handler(batch)
+        finally:
+            self._active -= 1
+            self._unfinished -= len(batch)
+            self._start_ready()
+
+    async def _run_handler(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        logger.debug("[Batch][%s] running size=%s", self.name, len(items))
+        try:
+            results = self.handler(items)
+            if inspect.isawaitable(results):
+                results = await results
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch handler {self.name} returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as exc:
+            logger.exception("[Batch][%s] failed size=%s", self.name, len(items))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches_run += 1
+        self.items_run += len(items)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
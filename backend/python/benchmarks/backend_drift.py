@@ -0,0 +1,130 @@
+"""
+Compares a candidate inference backend (torch-int8 or onnx) against the
+fp32 torch pipelines on the same inputs and reports accuracy drift and
+per-item latency for each model.
+
+Run from backend/python:
+    python -m benchmarks.backend_drift --backend torch-int8
+    python -m benchmarks.backend_drift --backend onnx --texts scenes.txt --min-agreement 0.97
+"""
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from backends import INFERENCE_BACKENDS, TORCH, build_pipeline, loaded_backend  # noqa: E402
+from benchmarks.screenplay_gen import generate_screenplay  # noqa: E402
+from screenplay import parse_scenes  # noqa: E402
+
+MODEL_SPECS = {
+    "sentiment": ("text-classification", main.SENTIMENT_MODEL, {}),
+    "emotion": ("text-classification", main.EMOTION_MODEL, {"return_all_scores": True}),
+    "summarizer": ("summarization", main.SUMMARIZATION_MODEL, {}),
+}
+
+
+def load_texts(path: str, samples: int) -> List[str]:
+    if path:
+        # One sample per blank-line separated block
+        blocks = Path(path).read_text(encoding="utf-8").split("\n\n")
+        texts = [block.strip() for block in blocks if block.strip()]
+    else:
+        texts = [scene["raw_text"] for scene in parse_scenes(generate_screenplay(scenes=samples))]
+    return [text[:1024] for text in texts[:samples]]
+
+
+def timed(fn: Callable[[str], Any], texts: List[str]):
+    outputs = []
+    start = time.perf_counter()
+    for text in texts:
+        outputs.append(fn(text))
+    return outputs, (time.perf_counter() - start) * 1000 / max(1, len(texts))
+
+
+def unigram_f1(reference: str, candidate: str) -> float:
+    ref, cand = Counter(reference.lower().split()), Counter(candidate.lower().split())
+    overlap = sum((ref & cand).values())
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / sum(cand.values()), overlap / sum(ref.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def compare(name: str, reference: List[Any], candidate: List[Any]) -> Dict[str, Any]:
+    if name == "summarizer":
+        scores = [unigram_f1(r[0]["summary_text"], c[0]["summary_text"]) for r, c in zip(reference, candidate)]
+        return {
+            "agreement": sum(score >= 0.8 for score in scores) / len(scores),
+            "meanUnigramF1": sum(scores) / len(scores),
+        }
+
+    if name == "emotion":
+        ref_dists = [{x["label"]: x["score"] for x in r[0]} for r in reference]
+        cand_dists = [{x["label"]: x["score"] for x in c[0]} for c in candidate]
+        diffs = [sum(abs(r[label] - c.get(label, 0.0)) for label in r) for r, c in zip(ref_dists, cand_dists)]
+        agree = [max(r, key=r.get) == max(c, key=c.get) for r, c in zip(ref_dists, cand_dists)]
+        return {
+            "agreement": sum(agree) / len(agree),
+            "meanL1": sum(diffs) / len(diffs),
+            "maxL1": max(diffs),
+        }
+
+    diffs = [abs(r[0]["score"] - c[0]["score"]) for r, c in zip(reference, candidate)]
+    agree = [r[0]["label"] == c[0]["label"] for r, c in zip(reference, candidate)]
+    return {
+        "agreement": sum(agree) / len(agree),
+        "meanScoreDiff": sum(diffs) / len(diffs),
+        "maxScoreDiff": max(diffs),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Check accuracy drift and latency of an inference backend.")
+    parser.add_argument("--backend", required=True, choices=sorted(INFERENCE_BACKENDS - {TORCH}))
+    parser.add_argument("--models", default="sentiment,emotion,summarizer", help="Comma-separated model names")
+    parser.add_argument("--texts", default="", help="Text file with blank-line separated samples (default: synthetic scenes)")
+    parser.add_argument("--samples", type=int, default=32)
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="Exit non-zero below this agreement")
+    args = parser.parse_args()
+
+    texts = load_texts(args.texts, args.samples)
+    report = {"backend": args.backend, "samples": len(texts), "models": {}}
+    ok = True
+    for name in args.models.split(","):
+        task, model_name, kwargs = MODEL_SPECS[name]
+        reference_pipe = build_pipeline(task, model_name, TORCH, main.device, **kwargs)
+        candidate_pipe = build_pipeline(task, model_name, args.backend, main.device, **kwargs)
+        if loaded_backend(candidate_pipe) != args.backend:
+            # A silent fallback would compare torch with torch and always pass
+            report["models"][name] = {
+                "error": f"requested {args.backend} but the model loaded with {loaded_backend(candidate_pipe)}",
+            }
+            ok = False
+            continue
+        call_kwargs = {"max_length": 60, "min_length": 5, "do_sample": False} if task == "summarization" else {}
+        inputs = texts if task == "summarization" else [text[:512] for text in texts]
+
+        reference, reference_ms = timed(lambda text: reference_pipe(text, **call_kwargs), inputs)
+        candidate, candidate_ms = timed(lambda text: candidate_pipe(text, **call_kwargs), inputs)
+        result = compare(name, reference, candidate)
+        result.update({
+            "referenceMsPerItem": round(reference_ms, 2),
+            "candidateMsPerItem": round(candidate_ms, 2),
+            "speedup": round(reference_ms / max(candidate_ms, 1e-9), 2),
+        })
+        ok = ok and result["agreement"] >= args.min_agreement
+        report["models"][name] = result
+
+    report["passed"] = ok
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,214 @@
+"""
+In-process load generator for the FastAPI app. Requests go through the
+full ASGI stack (middleware, validation, executors, batching) via httpx's
+ASGI transport, so no server or network is involved. Models are replaced
+by stubs with a configurable per-call and per-item delay unless
+--real-models is given.
+
+Run from backend/python (needs httpx):
+    python -m benchmarks.load
+    python -m benchmarks.load --requests 2000 --concurrency 64 --endpoints analyze_scene,translate
+    python -m benchmarks.load --real-models --requests 200 --output results/load-real.json
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.report import summarize_ms, write_report  # noqa: E402
+from benchmarks.screenplay_gen import generate_screenplay  # noqa: E402
+from screenplay import parse_scenes  # noqa: E402
+
+ENDPOINTS = ("parse", "analyze_scene", "analyze_scenes", "analyze_emotion", "translate", "analyze_network", "analyze_script")
+
+
+class StubPipeline:
+    """Stands in for a transformers pipeline: sleeps, then returns outputs of the right shape."""
+
+    def __init__(self, task: str, call_ms: float, item_ms: float):
+        self.task = task
+        self.call_ms = call_ms
+        self.item_ms = item_ms
+
+    def _output(self, text: str) -> Any:
+        if self.task == "summarizer":
+            return {"summary_text": text[:120]}
+        if self.task == "sentiment":
+            return {"label": "POSITIVE" if len(text) % 2 else "NEGATIVE", "score": 0.9}
+        if self.task == "emotion":
+            return [{"label": "joy", "score": 0.6}, {"label": "sadness", "score": 0.3}, {"label": "fear", "score": 0.1}]
+        return {"translation_text": text}
+
+    def __call__(self, inputs: Any, **kwargs: Any) -> List[Any]:
+        batch = inputs if isinstance(inputs, list) else [inputs]
+        time.sleep((self.call_ms + self.item_ms * len(batch)) / 1000)
+        return [self._output(text) for text in batch]
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    # Must run before main is imported; main reads its configuration at import time.
+    os.environ.setdefault("MODEL_WARMUP", "lazy")
+    # Per-request INFO logs would dominate the measurement and bury the report.
+    os.environ.setdefault("PY_SERVICE_LOG_LEVEL", "WARNING")
+    os.environ.setdefault("TRANSLATION_MEMORY_PATH", "")
+    if not args.cache:
+        os.environ["RESULT_CACHE_ENTRIES"] = "0"
+        os.environ["RESULT_CACHE_PATH"] = ""
+
+
+def install_stubs(main: Any, call_ms: float, item_ms: float) -> None:
+    for name in ("summarizer", "sentiment", "emotion"):
+        main.models.register(name, lambda name=name: StubPipeline(name, call_ms, item_ms))
+    for pair_key in main.translation_ready:
+        main.hf_translators[pair_key] = StubPipeline("translation", call_ms, item_ms)
+        main.translation_backend[pair_key] = "hf"
+        main.translation_ready[pair_key] = True
+
+
+def build_payloads(args: argparse.Namespace) -> Dict[str, List[Tuple[str, str, Dict[str, Any]]]]:
+    text = generate_screenplay(args.scenes, args.cast, args.dialogue_density, "en", args.seed)
+    translated = generate_screenplay(args.scenes, args.cast, args.dialogue_density, args.language, args.seed)
+    scenes = parse_scenes(text)
+    scene_texts = [scene["raw_text"] for scene in scenes]
+    interactions = [scene["characters"] for scene in scenes]
+    source_language = args.language if args.language != "en" else "hi"
+
+    payloads: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {
+        "parse": [("POST", "/parse", {"text": text})],
+        "analyze_scene": [
+            ("POST", "/analyze_scene", {"id": f"scene-{i}", "text": t}) for i, t in enumerate(scene_texts)
+        ],
+        "analyze_scenes": [
+            ("POST", "/analyze_scenes", {
+                "scenes": [{"id": f"scene-{i + j}", "text": t} for j, t in enumerate(scene_texts[i:i + 8])]
+            })
+            for i in range(0, len(scene_texts), 8)
+        ],
+        "analyze_emotion": [("POST", "/analyze_emotion", {"text": t}) for t in scene_texts],
+        "translate": [
+            ("POST", "/translate", {"text": scene["raw_text"], "sourceLanguage": source_language})
+            for scene in parse_scenes(translated)
+        ],
+        "analyze_network": [("POST", "/analyze_network", {"interactions": interactions})],
+        "analyze_script": [("POST", "/analyze_script", {"text": text})],
+    }
+    return {name: payloads[name] for name in args.endpoints}
+
+
+async def run_load(app: Any, payloads: Dict[str, List[Tuple[str, str, Dict[str, Any]]]], args: argparse.Namespace):
+    import httpx
+
+    # Endpoints are interleaved round-robin; each one cycles through its payload pool.
+    schedule = []
+    names = list(payloads)
+    for i in range(args.requests):
+        name = names[i % len(names)]
+        pool = payloads[name]
+        schedule.append((name, pool[(i // len(names)) % len(pool)]))
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    position = {"next": 0}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def worker(record: bool, items: List[Tuple[str, Tuple[str, str, Dict[str, Any]]]]):
+            while position["next"] < len(items):
+                name, (method, path, body) = items[position["next"]]
+                position["next"] += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, path, json=body)
+                    status = str(response.status_code)
+                except Exception as exc:
+                    status = type(exc).__name__
+                if record:
+                    latencies[name].append(time.perf_counter() - start)
+                    statuses[name][status] += 1
+
+        # Warmup loads lazy models and fills the executors before timing starts.
+        warmup = [(name, pool[0]) for name, pool in payloads.items()] * args.warmup
+        await asyncio.gather(*(worker(False, warmup) for _ in range(args.concurrency)))
+
+        position["next"] = 0
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(True, schedule) for _ in range(args.concurrency)))
+        duration = time.perf_counter() - start
+
+    by_endpoint = {}
+    for name in payloads:
+        errors = sum(count for status, count in statuses[name].items() if not status.startswith("2"))
+        by_endpoint[name] = {
+            "requests": len(latencies[name]),
+            "errors": errors,
+            "statuses": dict(statuses[name]),
+            "throughputRps": round(len(latencies[name]) / duration, 2) if duration else None,
+            **summarize_ms(latencies[name]),
+        }
+    all_latencies = [value for values in latencies.values() for value in values]
+    overall = {
+        "requests": len(all_latencies),
+        "errors": sum(entry["errors"] for entry in by_endpoint.values()),
+        "durationS": round(duration, 3),
+        "throughputRps": round(len(all_latencies) / duration, 2) if duration else None,
+        **summarize_ms(all_latencies),
+    }
+    return overall, by_endpoint
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process load test of the AI service.")
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests across all endpoints")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed rounds over every endpoint first")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="Comma-separated subset of endpoints")
+    parser.add_argument("--scenes", type=int, default=60)
+    parser.add_argument("--cast", type=int, default=12)
+    parser.add_argument("--dialogue-density", type=float, default=0.6)
+    parser.add_argument("--language", choices=("hi", "kn"), default="hi", help="Source language for /translate")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--stub-call-ms", type=float, default=20.0, help="Fixed delay per stubbed model call")
+    parser.add_argument("--stub-item-ms", type=float, default=2.0, help="Extra delay per input in a stubbed batch")
+    parser.add_argument("--real-models", action="store_true", help="Load the configured models instead of stubs")
+    parser.add_argument("--cache", action="store_true", help="Keep the result cache enabled")
+    parser.add_argument("--output", default="", help="Also write the JSON report to this path")
+    args = parser.parse_args()
+    args.endpoints = [name for name in args.endpoints.split(",") if name]
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+
+    configure_environment(args)
+    import main as service
+
+    if not args.real_models:
+        install_stubs(service, args.stub_call_ms, args.stub_item_ms)
+
+    payloads = build_payloads(args)
+    overall, by_endpoint = asyncio.run(run_load(service.app, payloads, args))
+    for executor in service.executors.values():
+        executor.shutdown()
+
+    write_report(
+        "load",
+        vars(args),
+        {
+            "overall": overall,
+            "endpoints": by_endpoint,
+            "cache": service.result_cache.status(),
+            "translationMemory": service.translation_memory.status(),
+            "executors": {name: executor.status() for name, executor in service.executors.items()},
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
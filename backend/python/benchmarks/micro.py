@@ -0,0 +1,137 @@
+"""
+Microbenchmarks for the CPU-only stages: scene parsing (/parse), the
+frontend block parser, translation chunking and network metrics
+(/analyze_network). No models are loaded.
+
+Run from backend/python:
+    python -m benchmarks.micro
+    python -m benchmarks.micro --scenes 400 --cast 60 --language hi --output results/micro.json
+"""
+import argparse
+import importlib.util
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.report import REPO_ROOT, write_report  # noqa: E402
+from benchmarks.screenplay_gen import LANGUAGES, generate_screenplay  # noqa: E402
+from network import NetworkStore, build_network  # noqa: E402
+from screenplay import parse_scenes  # noqa: E402
+from translation_chunks import chunk_text_for_translation  # noqa: E402
+
+FRONTEND_PARSER = REPO_ROOT / "frontend" / "scripts" / "parse.py"
+
+
+def load_frontend_parser():
+    # Loaded by path: the frontend scripts are not a package, and "parse" is too generic a module name.
+    spec = importlib.util.spec_from_file_location("frontend_parse", FRONTEND_PARSER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def time_case(fn: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    fn()  # warm caches and regex compilation
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        "bestMs": round(min(timings) * 1000, 4),
+        "medianMs": round(statistics.median(timings) * 1000, 4),
+        "meanMs": round(statistics.fmean(timings) * 1000, 4),
+    }
+
+
+def network_cases(interactions: List[List[str]]) -> Dict[str, Callable[[], Any]]:
+    def exact():
+        network = build_network(interactions)
+        network.degree_centrality()
+        network.betweenness_centrality()
+
+    def pivots():
+        network = build_network(interactions)
+        network.degree_centrality()
+        network.betweenness_centrality(k=min(64, max(1, network.node_count - 1)))
+
+    # One edited scene against a script the store has already seen
+    store = NetworkStore(max_scripts=2)
+    edited = list(interactions)
+    if edited:
+        edited[-1] = edited[-1][:-1] or edited[-1]
+    versions = [interactions, edited]
+    state = {"version": 0}
+
+    def incremental():
+        state["version"] ^= 1
+        network, _, _ = store.sync("bench", versions[state["version"]])
+        network.degree_centrality()
+        network.betweenness_centrality()
+
+    store.sync("bench", interactions)
+    return {
+        "analyze_network.exact": exact,
+        "analyze_network.pivots": pivots,
+        "analyze_network.incremental": incremental,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks for parsing, chunking and network metrics.")
+    parser.add_argument("--scenes", type=int, default=200)
+    parser.add_argument("--cast", type=int, default=30, help="Number of distinct characters")
+    parser.add_argument("--dialogue-density", type=float, default=0.6, help="Share of blocks that are dialogue")
+    parser.add_argument("--language", choices=LANGUAGES, default="en", help="Dialogue language")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--max-tokens", type=int, default=200, help="Token budget for translation chunks")
+    parser.add_argument("--only", default="", help="Comma-separated case name prefixes to run")
+    parser.add_argument("--output", default="", help="Also write the JSON report to this path")
+    args = parser.parse_args()
+
+    text = generate_screenplay(args.scenes, args.cast, args.dialogue_density, args.language, args.seed)
+    lines = text.splitlines(keepends=True)
+    scenes = parse_scenes(text)
+    interactions = [scene["characters"] for scene in scenes if scene["characters"]]
+    frontend_parser = load_frontend_parser()
+    # Worst case for chunking: a whole script pasted as one paragraph.
+    one_paragraph = " ".join(line.strip() for line in lines if line.strip())
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "parse_structure": lambda: parse_scenes(text),
+        "parse_script_lines": lambda: frontend_parser.parse_script_lines(lines),
+        "chunk_text_for_translation.lines": lambda: [
+            chunk_text_for_translation(line, args.max_tokens) for line in lines
+        ],
+        "chunk_text_for_translation.paragraph": lambda: chunk_text_for_translation(one_paragraph, args.max_tokens),
+        **network_cases(interactions),
+    }
+    prefixes = [p for p in args.only.split(",") if p]
+
+    results = {}
+    for name, fn in cases.items():
+        if prefixes and not any(name.startswith(p) for p in prefixes):
+            continue
+        results[name] = time_case(fn, args.repeats)
+
+    write_report(
+        "micro",
+        {
+            **vars(args),
+            "chars": len(text),
+            "lines": len(lines),
+            "parsedScenes": len(scenes),
+            "characters": len({name for names in interactions for name in names}),
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Times `parse_scenes` on synthetic screenplays of increasing length and
+reports per-line cost, which should stay flat if parsing is linear.
+
+Run from backend/python:  python -m benchmarks.parse_scaling
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.report import write_report  # noqa: E402
+from benchmarks.screenplay_gen import LANGUAGES, generate_screenplay  # noqa: E402
+from screenplay import SCENE_HEADING_RE, parse_scenes  # noqa: E402
+
+
+def merge_scenes(text: str) -> str:
+    """Drops every scene heading after the first, leaving one long scene."""
+    lines = text.split("\n")
+    first = next((i for i, line in enumerate(lines) if SCENE_HEADING_RE.match(line)), 0)
+    return "\n".join(lines[:first + 1] + [line for line in lines[first + 1:] if not SCENE_HEADING_RE.match(line)])
+
+
+def time_parse(text: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parse_scenes(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse_scenes scaling on synthetic scripts.")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated scene counts")
+    parser.add_argument("--cast", type=int, default=30, help="Number of distinct characters")
+    parser.add_argument("--dialogue-density", type=float, default=0.6, help="Share of blocks that are dialogue")
+    parser.add_argument("--language", choices=LANGUAGES, default="en", help="Dialogue language")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeats", type=int, default=5, help="Best-of repeats per size")
+    parser.add_argument(
+        "--single-scene",
+        action="store_true",
+        help="Put every line in one scene (worst case for per-scene text building)",
+    )
+    parser.add_argument("--output", default="", help="Also write the JSON report to this path")
+    args = parser.parse_args()
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = generate_screenplay(size, args.cast, args.dialogue_density, args.language, args.seed)
+        if args.single_scene:
+            text = merge_scenes(text)
+        line_count = text.count("\n") + 1
+        seconds = time_parse(text, args.repeats)
+        results.append({
+            "scenes": size,
+            "lines": line_count,
+            "chars": len(text),
+            "seconds": round(seconds, 6),
+            "usPerLine": round(seconds / line_count * 1e6, 3),
+        })
+    write_report("parse_scenes", vars(args), results, args.output)
+
+
+if __name__ == "__main__":
+    main()
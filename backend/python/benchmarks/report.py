@@ -0,0 +1,66 @@
+"""
+Shared helpers for benchmark JSON reports, so runs from different commits
+can be diffed field by field.
+"""
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_ms(seconds: List[float]) -> Dict[str, float]:
+    values = sorted(s * 1000 for s in seconds)
+    if not values:
+        return {}
+    return {
+        "p50Ms": round(percentile(values, 50), 3),
+        "p95Ms": round(percentile(values, 95), 3),
+        "p99Ms": round(percentile(values, 99), 3),
+        "meanMs": round(statistics.fmean(values), 3),
+        "minMs": round(values[0], 3),
+        "maxMs": round(values[-1], 3),
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_metadata() -> Dict[str, Any]:
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def write_report(benchmark: str, params: Dict[str, Any], results: Any, output: str = "") -> Dict[str, Any]:
+    """Prints the report and, when `output` is set, also writes it there."""
+    report = {"benchmark": benchmark, "run": run_metadata(), "params": params, "results": results}
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return report
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("py-ai-service")
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\f\v]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for cache keys: NFC, unified line endings, runs of
+    inline whitespace collapsed and each line stripped. Line breaks are kept
+    because translation output preserves them.
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(_INLINE_WHITESPACE.sub(" ", line).strip() for line in text.strip().split("\n"))
+
+
+def make_cache_key(endpoint: str, model_name: str, text: str) -> str:
+    digest = hashlib.sha256()
+    for part in (endpoint, model_name, normalize_text(text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache for JSON-serializable inference results. The memory tier is
+    an LRU bounded by entry count. The optional SQLite tier survives restarts
+    and evicts least recently used rows once it grows past `disk_max_bytes`.
+    """
+
+    def __init__(self, memory_entries: int, disk_path: str = "", disk_max_bytes: int = 0):
+        self.memory_entries = max(0, memory_entries)
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        self.stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "memoryHits": 0, "diskHits": 0}
+        )
+
+        if disk_path:
+            self._open_disk(disk_path)
+
+    def _open_disk(self, disk_path: str) -> None:
+        try:
+            Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)")
+            self._db.commit()
+            row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+            self._disk_bytes = row[0]
+            logger.info("Result cache disk tier ready path=%s bytes=%s", disk_path, self._disk_bytes)
+        except sqlite3.Error:
+            logger.exception("Result cache disk tier unavailable path=%s; using memory only", disk_path)
+            self._db = None
+
+    def get(self, endpoint: str, model_name: str, text: str) -> Optional[Any]:
+        key = make_cache_key(endpoint, model_name, text)
+        with self._lock:
+            stats = self.stats[endpoint]
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                stats["hits"] += 1
+                stats["memoryHits"] += 1
+                return self._memory[key]
+
+            value = self._disk_get(key)
+            if value is not None:
+                self._memory_put(key, value)
+                stats["hits"] += 1
+                stats["diskHits"] += 1
+                return value
+
+            stats["misses"] += 1
+            return None
+
+    def put(self, endpoint: str, model_name: str, text: str, value: Any) -> None:
+        key = make_cache_key(endpoint, model_name, text)
+        with self._lock:
+            self._memory_put(key, value)
+            self._disk_put(key, value)
+
+    def _memory_put(self, key: str, value: Any) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            logger.exception("Result cache disk read failed")
+            return None
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        if self._db is None:
+            return
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+            size = len(encoded.encode("utf-8"))
+            previous = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, encoded, size, time.time()),
+            )
+            self._disk_bytes += size - (previous[0] if previous else 0)
+            self._evict_disk()
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError):
+            logger.exception("Result cache disk write failed")
+
+    def _evict_disk(self) -> None:
+        if not self.disk_max_bytes or self._disk_bytes <= self.disk_max_bytes:
+            return
+        # Drop least recently used rows until we are back under 90% of the budget.
+        target = int(self.disk_max_bytes * 0.9)
+        rows = self._db.execute("SELECT key, size FROM results ORDER BY accessed ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if self._disk_bytes <= target:
+                break
+            evicted.append((key,))
+            self._disk_bytes -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
+        logger.info("Result cache evicted disk rows=%s bytes=%s", len(evicted), self._disk_bytes)
+
+    def status(self) -> Dict[str, Any]:
+        hits = sum(s["hits"] for s in self.stats.values())
+        misses = sum(s["misses"] for s in self.stats.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "memoryEntries": len(self._memory),
+            "diskEnabled": self._db is not None,
+            "diskBytes": self._disk_bytes,
+            "byEndpoint": {name: dict(s) for name, s in self.stats.items()},
+        }
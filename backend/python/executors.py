@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger("py-ai-service")
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a model executor has no free worker and its wait queue is full."""
+
+    def __init__(self, name: str, retry_after_s: int):
+        super().__init__(f"Inference executor '{name}' is at capacity")
+        self.name = name
+        self.retry_after_s = retry_after_s
+
+
+class ModelExecutor:
+    """
+    Runs blocking model calls on a dedicated thread pool so the event loop
+    stays free for cheap endpoints. At most `workers` calls run at once and
+    at most `max_queue` more wait; anything beyond that is rejected.
+    """
+
+    def __init__(self, name: str, workers: int, max_queue: int, retry_after_s: int = 1):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.retry_after_s = retry_after_s
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"infer-{name}")
+        # Only touched from the event loop thread, so no lock is needed.
+        self._in_flight = 0
+        self.rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return max(0, self._in_flight - self.workers)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            logger.warning(
+                "[Executor][%s] saturated inFlight=%s workers=%s maxQueue=%s",
+                self.name,
+                self._in_flight,
+                self.workers,
+                self.max_queue,
+            )
+            raise ExecutorSaturated(self.name, self.retry_after_s)
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, partial(fn, *args, **kwargs))
+        finally:
+            self._in_flight -= 1
+
+    def status(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "maxQueue": self.max_queue,
+            "inFlight": self._in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
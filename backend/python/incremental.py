@@ -0,0 +1,94 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def scene_fingerprint(raw_text: str) -> str:
+    return hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+
+
+class ScriptState:
+    def __init__(self, fingerprints: List[str], results: Dict[str, Any]):
+        self.fingerprints = fingerprints
+        # fingerprint -> stored analysis for that scene text
+        self.results = results
+
+
+class ScriptSceneStore:
+    """
+    Keeps the scene fingerprints and analysis results of recently edited
+    scripts so a new version only re-analyzes scenes whose text changed.
+    Bounded to `max_scripts` scripts, least recently used dropped first.
+    """
+
+    def __init__(self, max_scripts: int):
+        self.max_scripts = max(1, max_scripts)
+        self._scripts: "OrderedDict[str, ScriptState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def diff(self, script_id: str, fingerprints: List[str]) -> Tuple[List[int], Dict[str, Any], int]:
+        """
+        Returns (indices of scenes that need analysis, reusable results by
+        fingerprint, number of previous scenes that no longer exist).
+        """
+        with self._lock:
+            state: Optional[ScriptState] = self._scripts.get(script_id)
+            if state is not None:
+                self._scripts.move_to_end(script_id)
+
+        previous = state.results if state else {}
+        changed = [i for i, fingerprint in enumerate(fingerprints) if fingerprint not in previous]
+        current = set(fingerprints)
+        removed = len([f for f in (state.fingerprints if state else []) if f not in current])
+        return changed, previous, removed
+
+    def update(self, script_id: str, fingerprints: List[str], results: Dict[str, Any]) -> None:
+        # Keep only results for scenes present in this version.
+        kept = {fingerprint: results[fingerprint] for fingerprint in fingerprints if fingerprint in results}
+        with self._lock:
+            self._scripts[script_id] = ScriptState(list(fingerprints), kept)
+            self._scripts.move_to_end(script_id)
+            while len(self._scripts) > self.max_scripts:
+                self._scripts.popitem(last=False)
+
+    def forget(self, script_id: str) -> bool:
+        with self._lock:
+            return self._scripts.pop(script_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+
+class ScriptTextStore:
+    """
+    Full text of recently parsed scripts by script ID, so analysis requests
+    can send offsets into a script instead of the text itself. Bounded to
+    `max_scripts` scripts, least recently used dropped first.
+    """
+
+    def __init__(self, max_scripts: int):
+        self.max_scripts = max(1, max_scripts)
+        self._texts: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, script_id: str, text: str) -> None:
+        with self._lock:
+            self._texts[script_id] = text
+            self._texts.move_to_end(script_id)
+            while len(self._texts) > self.max_scripts:
+                self._texts.popitem(last=False)
+
+    def get(self, script_id: str) -> Optional[str]:
+        with self._lock:
+            text = self._texts.get(script_id)
+            if text is not None:
+                self._texts.move_to_end(script_id)
+        return text
+
+    def forget(self, script_id: str) -> bool:
+        with self._lock:
+            return self._texts.pop(script_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._texts)
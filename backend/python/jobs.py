@@ -0,0 +1,334 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+logger = logging.getLogger("py-ai-service")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TERMINAL = {DONE, FAILED, CANCELLED}
+
+# handler(job_id, payload, report_progress) -> JSON-serializable result
+JobHandler = Callable[[str, Dict[str, Any], Callable[[Dict[str, Any]], None]], Awaitable[Any]]
+
+
+class JobStore:
+    """
+    SQLite-backed job records. Every state change is committed immediately,
+    so a restarted service sees exactly which jobs were queued or running.
+    An empty path keeps jobs in-process only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path or ":memory:"
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, "
+            "progress TEXT, result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+            "retries INTEGER NOT NULL DEFAULT 0, "
+            "created REAL NOT NULL, started REAL, finished REAL, expires REAL)"
+        )
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        if "retries" not in columns:  # job databases from before retries were capped
+            self._db.execute("ALTER TABLE jobs ADD COLUMN retries INTEGER NOT NULL DEFAULT 0")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs(status, created)")
+        self._db.commit()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row, with_result: bool) -> Dict[str, Any]:
+        job = {
+            "jobId": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "progress": json.loads(row["progress"]) if row["progress"] else None,
+            "error": row["error"],
+            "attempts": row["attempts"],
+            "retries": row["retries"],
+            "createdAt": row["created"],
+            "startedAt": row["started"],
+            "finishedAt": row["finished"],
+            "expiresAt": row["expires"],
+        }
+        if with_result:
+            job["result"] = json.loads(row["result"]) if row["result"] else None
+        return job
+
+    def create(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, payload, status, created) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload, ensure_ascii=False), QUEUED, time.time()),
+            )
+            self._db.commit()
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row, with_result=False)
+
+    def get(self, job_id: str, with_result: bool = True) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row, with_result) if row else None
+
+    def claim_next(self) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """Marks the oldest queued job running. Returns (id, kind, payload)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, kind, payload FROM jobs WHERE status = ? ORDER BY created LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE jobs SET status = ?, started = ?, attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, time.time(), row["id"]),
+            )
+            self._db.commit()
+        return row["id"], row["kind"], json.loads(row["payload"])
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._db.commit()
+
+    def set_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        self._update(job_id, progress=json.dumps(progress, ensure_ascii=False))
+
+    def finish(self, job_id: str, status: str, ttl_s: float, result: Any = None, error: Optional[str] = None) -> None:
+        now = time.time()
+        self._update(
+            job_id,
+            status=status,
+            result=json.dumps(result, ensure_ascii=False) if result is not None else None,
+            error=error,
+            finished=now,
+            expires=now + ttl_s,
+        )
+
+    def requeue(self, job_id: str, max_retries: int, ttl_s: float) -> bool:
+        """
+        Back to the queue without counting the attempt (e.g. executors were
+        saturated), counted as a retry instead. A job that has already been
+        retried `max_retries` times fails. Returns whether it was requeued.
+        """
+        now = time.time()
+        with self._lock:
+            requeued = self._db.execute(
+                "UPDATE jobs SET status = ?, started = NULL, attempts = MAX(0, attempts - 1), retries = retries + 1 "
+                "WHERE id = ? AND retries < ?",
+                (QUEUED, job_id, max_retries),
+            ).rowcount
+            if not requeued:
+                self._db.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished = ?, expires = ? WHERE id = ?",
+                    (FAILED, f"Executors still saturated after {max_retries} retries", now, now + ttl_s, job_id),
+                )
+            self._db.commit()
+        return bool(requeued)
+
+    def recover_interrupted(self, max_attempts: int, ttl_s: float) -> Tuple[int, int]:
+        """
+        Jobs left running by a previous process go back to the queue, unless
+        they have already been attempted `max_attempts` times. Returns
+        (requeued, failed).
+        """
+        now = time.time()
+        with self._lock:
+            failed = self._db.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished = ?, expires = ? "
+                "WHERE status = ? AND attempts >= ?",
+                (FAILED, "Interrupted too many times", now, now + ttl_s, RUNNING, max_attempts),
+            ).rowcount
+            requeued = self._db.execute(
+                "UPDATE jobs SET status = ?, started = NULL WHERE status = ?", (QUEUED, RUNNING)
+            ).rowcount
+            self._db.commit()
+        return requeued, failed
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            deleted = self._db.execute(
+                "DELETE FROM jobs WHERE expires IS NOT NULL AND expires < ?", (time.time(),)
+            ).rowcount
+            self._db.commit()
+        return deleted
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+
+class JobQueue:
+    """
+    Runs stored jobs on `workers` asyncio tasks in the service's event loop;
+    handlers await the model executors like any endpoint does. Exceptions in
+    `retryable` (e.g. saturated executors) put the job back in the queue
+    after the exception's `retry_after_s`, at most `max_retries` times;
+    anything else fails the job.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handlers: Dict[str, JobHandler],
+        workers: int,
+        result_ttl_s: float,
+        max_queued: int,
+        max_attempts: int = 3,
+        max_retries: int = 20,
+        retryable: Tuple[Type[BaseException], ...] = (),
+    ):
+        self.store = store
+        self.handlers = handlers
+        self.workers = max(1, workers)
+        self.result_ttl_s = result_ttl_s
+        self.max_queued = max_queued
+        self.max_attempts = max(1, max_attempts)
+        self.max_retries = max(0, max_retries)
+        self.retryable = retryable
+        self._tasks: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancel_requested: Set[str] = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        self._wake = asyncio.Event()
+        self._changed = asyncio.Event()
+        requeued, failed = self.store.recover_interrupted(self.max_attempts, self.result_ttl_s)
+        purged = self.store.purge_expired()
+        logger.info(
+            "[Jobs] starting workers=%s requeued=%s failed=%s purged=%s", self.workers, requeued, failed, purged
+        )
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(loop.create_task(self._purge_loop()))
+
+    async def stop(self) -> None:
+        # Running jobs stay marked running in the store and are resumed on the next start.
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if kind not in self.handlers:
+            raise KeyError(kind)
+        if self.store.counts().get(QUEUED, 0) >= self.max_queued:
+            raise OverflowError("job queue is full")
+        job = self.store.create(kind, payload)
+        logger.info("[Jobs][%s] queued kind=%s", job["jobId"], kind)
+        self._notify()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get(job_id, with_result=False)
+        if job is None or job["status"] in TERMINAL:
+            return job
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancel_requested.add(job_id)
+            task.cancel()  # the worker records the cancellation
+        else:
+            self.store.finish(job_id, CANCELLED, self.result_ttl_s)
+            self._notify()
+        return self.store.get(job_id, with_result=False)
+
+    async def wait_for_change(self, timeout: float) -> None:
+        changed = self._changed
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _notify(self) -> None:
+        # Waking every waiter and handing out a fresh event is cheaper than per-job listeners.
+        if self._wake is not None:
+            self._wake.set()
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            self._wake.clear()
+            claimed = self.store.claim_next()
+            if claimed is None:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(*claimed)
+
+    async def _run(self, job_id: str, kind: str, payload: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        logger.info("[Jobs][%s] running kind=%s", job_id, kind)
+        self._notify()
+
+        def report_progress(progress: Dict[str, Any]) -> None:
+            self.store.set_progress(job_id, progress)
+            self._notify()
+
+        task = asyncio.ensure_future(self.handlers[kind](job_id, payload, report_progress))
+        self._running[job_id] = task
+        retry_after_s = 0
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if job_id not in self._cancel_requested:
+                raise  # the service is shutting down; the job resumes on restart
+            self.store.finish(job_id, CANCELLED, self.result_ttl_s)
+            logger.info("[Jobs][%s] cancelled", job_id)
+        except self.retryable as exc:
+            if not self.store.requeue(job_id, self.max_retries, self.result_ttl_s):
+                logger.error("[Jobs][%s] failed after %s retries reason=%s", job_id, self.max_retries, exc)
+            else:
+                retry_after_s = getattr(exc, "retry_after_s", 1)
+                logger.warning("[Jobs][%s] requeued retryAfterS=%s reason=%s", job_id, retry_after_s, exc)
+        except Exception as exc:
+            logger.exception("[Jobs][%s] failed kind=%s", job_id, kind)
+            self.store.finish(job_id, FAILED, self.result_ttl_s, error=str(exc))
+        else:
+            self.store.finish(job_id, DONE, self.result_ttl_s, result=result)
+            logger.info(
+                "[Jobs][%s] done kind=%s durationMs=%.2f", job_id, kind, (time.perf_counter() - start) * 1000
+            )
+        finally:
+            self._running.pop(job_id, None)
+            self._cancel_requested.discard(job_id)
+            self._notify()
+        # Back off only once the job is queued and no longer tracked as running,
+        # so a cancel during the wait cancels the queued job, not this worker.
+        if retry_after_s:
+            await asyncio.sleep(retry_after_s)
+
+    async def _purge_loop(self) -> None:
+        while True:
+            await asyncio.sleep(min(3600, max(60, self.result_ttl_s / 10)))
+            purged = self.store.purge_expired()
+            if purged:
+                logger.info("[Jobs] purged expired jobs=%s", purged)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": len(self._running),
+            "resultTtlS": self.result_ttl_s,
+            "byStatus": self.store.counts(),
+        }
@@ -1,20 +1,39 @@
+import asyncio
+import json
 import logging
 import os
 from pathlib import Path
-import re
+import threading
 import time
 import uuid
 
-import networkx as nx
 import torch
 from argostranslate import package as argos_package
 from argostranslate import translate as argos_translate
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, ValidationError
 from transformers import pipeline
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from backends import backend_for, build_pipeline, loaded_backend
+from batching import MicroBatcher
+from cache import ResultCache, normalize_text
+from executors import ExecutorSaturated, ModelExecutor
+from incremental import ScriptSceneStore, ScriptTextStore, scene_fingerprint
+from jobs import TERMINAL, JobQueue, JobStore
+from metrics import METRICS_CONTENT_TYPE, SIZE_BUCKETS, MetricsRegistry
+from network import NetworkStore, build_network
+from registry import FAILED, READY, ModelRegistry, ModelUnavailable
+from responses import CompressionMiddleware, FastJSONResponse, dumps_json
+from screenplay import parse_scenes, scene_text
+from tokenization import SharedEncodings, classify_encoded, tokenizer_fingerprint
+from translation_chunks import approximate_token_count, chunk_text_for_translation
+from translation_memory import TranslationMemory
+from windowing import aggregate_label_scores, split_windows, weighted_mean
 
 LOG_LEVEL = os.getenv("PY_SERVICE_LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -39,7 +58,8 @@ def load_service_env() -> None:
 
 load_service_env()
 
-app = FastAPI(title="Modular Script Intelligence")
+# Responses are serialized with orjson when it is installed.
+app = FastAPI(title="Modular Script Intelligence", default_response_class=FastJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],  # Allow your React app
@@ -49,9 +69,13 @@ app.add_middleware(
 )
 
 # --- CONFIGURATION ---
+# JSON/text responses at least this large are sent with brotli or gzip when the client accepts it; 0 disables.
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
 SUMMARIZATION_MODEL = "sshleifer/distilbart-cnn-12-6"
-EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
-SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+# Sentiment and emotion share one tokenization pass when their tokenizers match.
+EMOTION_MODEL = os.getenv("EMOTION_MODEL", "j-hartmann/emotion-english-distilroberta-base")
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+SHARED_ENCODING_ENTRIES = int(os.getenv("SHARED_ENCODING_ENTRIES", "4096"))
 SUPPORTED_TRANSLATION_LANGUAGES = {"en", "hi", "kn"}
 REQUIRED_TRANSLATION_PAIRS = [("hi", "en"), ("kn", "en")]
 TRANSLATION_DEVICE = int(os.getenv("TRANSLATION_DEVICE", "-1"))
@@ -59,6 +83,95 @@ HF_TRANSLATION_MODELS = {
     "hi": "Helsinki-NLP/opus-mt-hi-en",
     "kn": "Helsinki-NLP/opus-mt-kn-en",
 }
+# HF fallback: sentence-aware chunks of at most this many tokens, translated as one batch.
+TRANSLATION_MAX_TOKENS = int(os.getenv("TRANSLATION_MAX_TOKENS", "200"))
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "16"))
+# Segment-level translation memory; set to an empty string to keep it in-process only.
+TRANSLATION_MEMORY_PATH = os.getenv(
+    "TRANSLATION_MEMORY_PATH",
+    str(Path(__file__).resolve().parent / ".cache" / "translation-memory.sqlite"),
+)
+# Long inputs are covered by overlapping token windows instead of being cut off.
+# Every window is run, so cost grows linearly with text length; multi-window
+# summaries are reduced until they fit one window.
+SUMMARY_WINDOW_TOKENS = int(os.getenv("SUMMARY_WINDOW_TOKENS", "1000"))
+CLASSIFIER_WINDOW_TOKENS = int(os.getenv("CLASSIFIER_WINDOW_TOKENS", "510"))
+WINDOW_OVERLAP_TOKENS = int(os.getenv("WINDOW_OVERLAP_TOKENS", "64"))
+WINDOW_BATCH_SIZE = int(os.getenv("WINDOW_BATCH_SIZE", "16"))
+# Scenes from concurrent requests are collected for this long and run as one padded batch.
+SCENE_BATCH_WINDOW_MS = float(os.getenv("SCENE_BATCH_WINDOW_MS", "10"))
+SCENE_BATCH_MAX_SIZE = int(os.getenv("SCENE_BATCH_MAX_SIZE", "16"))
+# Inference runs on per-model thread pools; calls beyond workers + queue get a 429.
+INFERENCE_WORKERS = {
+    "summarizer": int(os.getenv("SUMMARIZER_WORKERS", "1")),
+    "sentiment": int(os.getenv("SENTIMENT_WORKERS", "1")),
+    "emotion": int(os.getenv("EMOTION_WORKERS", "1")),
+    "translation": int(os.getenv("TRANSLATION_WORKERS", "1")),
+}
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "32"))
+INFERENCE_RETRY_AFTER_S = int(os.getenv("INFERENCE_RETRY_AFTER_S", "2"))
+# Inference results are cached by (endpoint, model, normalized text).
+# RESULT_CACHE_PATH enables a SQLite tier that survives restarts.
+RESULT_CACHE_ENTRIES = int(os.getenv("RESULT_CACHE_ENTRIES", "4096"))
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", "")
+RESULT_CACHE_MAX_MB = float(os.getenv("RESULT_CACHE_MAX_MB", "256"))
+# Number of scripts whose per-scene fingerprints are kept for incremental analysis.
+INCREMENTAL_MAX_SCRIPTS = int(os.getenv("INCREMENTAL_MAX_SCRIPTS", "256"))
+# Scripts sent to /parse with a scriptId are kept so analysis requests can send offsets instead of text.
+SCRIPT_TEXT_MAX_SCRIPTS = int(os.getenv("SCRIPT_TEXT_MAX_SCRIPTS", "256"))
+# Streamed analysis starts with a single scene so the first result arrives fast,
+# then doubles the chunk size up to the batch size.
+STREAM_FIRST_CHUNK = int(os.getenv("STREAM_FIRST_CHUNK", "1"))
+# Betweenness is exact up to this many characters, then estimated from k pivot sources.
+NETWORK_EXACT_MAX_NODES = int(os.getenv("NETWORK_EXACT_MAX_NODES", "200"))
+NETWORK_PIVOTS = max(1, int(os.getenv("NETWORK_PIVOTS", "64")))
+NETWORK_MAX_SCRIPTS = int(os.getenv("NETWORK_MAX_SCRIPTS", "256"))
+# Background jobs (POST /jobs) survive restarts; finished results are kept for JOB_RESULT_TTL_S.
+JOB_DB_PATH = os.getenv(
+    "JOB_DB_PATH",
+    str(Path(__file__).resolve().parent / ".cache" / "jobs.sqlite"),
+)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_RESULT_TTL_S = float(os.getenv("JOB_RESULT_TTL_S", str(24 * 3600)))
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "1000"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Saturated executors requeue a job without using an attempt, up to this many times
+JOB_MAX_RETRIES = int(os.getenv("JOB_MAX_RETRIES", "20"))
+# /analyze_script runs character emotion only for characters with at least this many dialogue lines.
+CHARACTER_EMOTION_MIN_LINES = int(os.getenv("CHARACTER_EMOTION_MIN_LINES", "3"))
+# background: serve immediately and load models in parallel threads
+# lazy: load each model on its first request
+# blocking: load everything (in parallel) before serving
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "background").lower()
+MODEL_RETRY_AFTER_S = int(os.getenv("MODEL_RETRY_AFTER_S", "30"))
+# torch | torch-int8 (dynamic quantization, CPU) | onnx (ONNX Runtime via optimum).
+# Per-model override: SENTIMENT_BACKEND, EMOTION_BACKEND, SUMMARIZER_BACKEND.
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch").lower()
+MODEL_BACKENDS = {
+    name: backend_for(name, INFERENCE_BACKEND)
+    for name in ("sentiment", "emotion", "summarizer")
+}
+# Cached results are only reused for the same model, backend and windowing.
+WINDOW_CACHE_TAG = (
+    f"w{SUMMARY_WINDOW_TOKENS}/{CLASSIFIER_WINDOW_TOKENS}/{WINDOW_OVERLAP_TOKENS}:all"
+)
+# Backend each model actually runs on: MODEL_BACKENDS until the model loads,
+# then whatever build_pipeline ended up using (e.g. torch after an ONNX failure).
+loaded_backends = dict(MODEL_BACKENDS)
+
+
+def scene_cache_model() -> str:
+    return (
+        f"{SUMMARIZATION_MODEL}:{loaded_backends['summarizer']}"
+        f"+{SENTIMENT_MODEL}:{loaded_backends['sentiment']}:{WINDOW_CACHE_TAG}"
+    )
+
+
+def emotion_cache_model() -> str:
+    return f"{EMOTION_MODEL}:{loaded_backends['emotion']}:{WINDOW_CACHE_TAG}"
+
+if RESPONSE_COMPRESSION_MIN_BYTES > 0:
+    app.add_middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESSION_MIN_BYTES)
 
 device = 0 if torch.cuda.is_available() else -1
 logger.info("Service booting on %s", "GPU" if device == 0 else "CPU")
@@ -66,11 +179,118 @@ logger.info(
     "HF translation fallback device=%s",
     "GPU" if TRANSLATION_DEVICE == 0 else "CPU",
 )
+logger.info("Inference backends: %s", MODEL_BACKENDS)
 
-models = {}
+def load_model(name: str, task: str, model_name: str, **kwargs: Any) -> Any:
+    pipe = build_pipeline(task, model_name, MODEL_BACKENDS[name], device, **kwargs)
+    loaded_backends[name] = loaded_backend(pipe)
+    if loaded_backends[name] != MODEL_BACKENDS[name]:
+        logger.warning(
+            "Model %s runs on %s instead of the configured %s", name, loaded_backends[name], MODEL_BACKENDS[name]
+        )
+    return pipe
+
+
+models = ModelRegistry(retry_after_s=MODEL_RETRY_AFTER_S)
+models.register("sentiment", lambda: load_model("sentiment", "text-classification", SENTIMENT_MODEL))
+models.register(
+    "emotion",
+    lambda: load_model("emotion", "text-classification", EMOTION_MODEL, return_all_scores=True),
+)
+models.register("summarizer", lambda: load_model("summarizer", "summarization", SUMMARIZATION_MODEL))
 translation_ready = {f"{src}->{dst}": False for src, dst in REQUIRED_TRANSLATION_PAIRS}
 translation_backend = {f"{src}->{dst}": "unavailable" for src, dst in REQUIRED_TRANSLATION_PAIRS}
 hf_translators: Dict[str, Any] = {}
+argos_model_names: Dict[str, str] = {}
+# Startup warmup and /translate can both try to initialize a pair
+translation_init_lock = threading.Lock()
+translation_memory = TranslationMemory(TRANSLATION_MEMORY_PATH)
+executors = {
+    name: ModelExecutor(name, workers, INFERENCE_QUEUE_SIZE, INFERENCE_RETRY_AFTER_S)
+    for name, workers in INFERENCE_WORKERS.items()
+}
+result_cache = ResultCache(
+    RESULT_CACHE_ENTRIES,
+    disk_path=RESULT_CACHE_PATH,
+    disk_max_bytes=int(RESULT_CACHE_MAX_MB * 1024 * 1024),
+)
+script_scene_store = ScriptSceneStore(INCREMENTAL_MAX_SCRIPTS)
+script_texts = ScriptTextStore(SCRIPT_TEXT_MAX_SCRIPTS)
+shared_encodings = SharedEncodings(SHARED_ENCODING_ENTRIES)
+# None until both classifiers are loaded and their tokenizers have been compared
+classifier_tokenizers_shared: Optional[bool] = None
+network_store = NetworkStore(NETWORK_MAX_SCRIPTS)
+# Stored networks are updated and their CSR/betweenness caches filled on worker threads
+network_lock = threading.Lock()
+
+# --- METRICS ---
+# Request-path metrics are a dict update under a lock; gauges and cache
+# counters are read from existing state only when /metrics is scraped.
+metrics = MetricsRegistry("py_ai")
+REQUEST_LATENCY = metrics.histogram(
+    "http_request_duration_seconds", "Request latency by route template.", ("method", "route", "status")
+)
+STAGE_LATENCY = metrics.histogram(
+    "inference_stage_duration_seconds", "Time spent in one model call or CPU stage.", ("stage",)
+)
+STAGE_BATCH_SIZE = metrics.histogram(
+    "inference_batch_size", "Inputs per model call.", ("stage",), buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
+INPUT_CHARS = metrics.histogram(
+    "input_chars", "Request text size in characters.", ("route",), buckets=SIZE_BUCKETS
+)
+INPUT_TOKENS = metrics.histogram(
+    "input_tokens", "Request text size in approximate model tokens.", ("route",), buckets=SIZE_BUCKETS
+)
+TRANSLATIONS = metrics.counter("translations_total", "Translated requests by backend.", ("backend", "pair"))
+TRANSLATION_SEGMENTS = metrics.counter(
+    "translation_segments_total", "Translation segments by where the result came from.", ("source",)
+)
+metrics.gauge_callback(
+    "executor_in_flight", "Calls running or queued on an inference executor.", ("executor",),
+    lambda: {(name,): executor.in_flight for name, executor in executors.items()},
+)
+metrics.gauge_callback(
+    "executor_queued", "Calls waiting for a free inference worker.", ("executor",),
+    lambda: {(name,): executor.queued for name, executor in executors.items()},
+)
+metrics.counter_callback(
+    "executor_rejected_total", "Calls rejected with 429 because the executor was saturated.", ("executor",),
+    lambda: {(name,): executor.rejected for name, executor in executors.items()},
+)
+metrics.gauge_callback(
+    "batcher_pending", "Items waiting for the micro-batch window to close or for a free batch slot.", ("batcher",),
+    lambda: {(scene_batcher.name,): scene_batcher.pending},
+)
+metrics.counter_callback(
+    "batcher_rejected_total", "Requests rejected with 429 because earlier requests filled the batcher.", ("batcher",),
+    lambda: {(scene_batcher.name,): scene_batcher.rejected},
+)
+metrics.counter_callback(
+    "cache_requests_total", "Result cache lookups by endpoint and outcome.", ("endpoint", "result"),
+    lambda: {
+        (endpoint, result): stats[key]
+        for endpoint, stats in list(result_cache.stats.items())
+        for result, key in (("memory_hit", "memoryHits"), ("disk_hit", "diskHits"), ("miss", "misses"))
+    },
+)
+metrics.counter_callback(
+    "translation_memory_lookups_total", "Translation memory segment lookups by outcome.", ("result",),
+    lambda: {("hit",): translation_memory.hits, ("miss",): translation_memory.misses},
+)
+metrics.gauge_callback(
+    "jobs", "Stored background jobs by status.", ("status",),
+    lambda: {(status,): count for status, count in job_queue.store.counts().items()},
+)
+metrics.gauge_callback(
+    "model_ready", "1 when the model is loaded and serving.", ("model",),
+    lambda: {(name,): int(state["state"] == READY) for name, state in models.status().items()},
+)
+
+
+def observe_input(route: str, text: str) -> None:
+    INPUT_CHARS.observe(len(text), route)
+    INPUT_TOKENS.observe(approximate_token_count(text), route)
 
 
 def get_hf_token() -> str:
@@ -203,8 +423,17 @@ def ensure_hf_translation_backend(source: str, target: str) -> bool:
 
 
 def ensure_translation_backend(source: str, target: str) -> bool:
+    with translation_init_lock:
+        return _ensure_translation_backend(source, target)
+
+
+def _ensure_translation_backend(source: str, target: str) -> bool:
     pair_key = f"{source}->{target}"
+    if translation_ready.get(pair_key):
+        return True
+
     if ensure_translation_pair(source, target):
+        translation_model_name(source, target, "argos")
         translation_ready[pair_key] = True
         translation_backend[pair_key] = "argos"
         return True
@@ -223,51 +452,123 @@ def ensure_translation_backend(source: str, target: str) -> bool:
     return False
 
 
-def chunk_text_for_translation(text: str, max_chars: int = 350) -> List[str]:
-    if len(text) <= max_chars:
-        return [text]
-
-    chunks = []
-    current_lines = []
-    current_len = 0
-    for line in text.split("\n"):
-        next_len = len(line) + 1
-        if current_lines and (current_len + next_len > max_chars):
-            chunks.append("\n".join(current_lines))
-            current_lines = [line]
-            current_len = next_len
-        else:
-            current_lines.append(line)
-            current_len += next_len
-
-    if current_lines:
-        chunks.append("\n".join(current_lines))
-
-    return chunks
+def translation_model_name(source: str, target: str, backend: str) -> str:
+    """
+    Names the model behind a backend so stored translations stay tied to it:
+    the HF checkpoint, or the installed Argos package and its version. Argos
+    names are resolved once, while the pair is set up.
+    """
+    if backend == "hf":
+        return HF_TRANSLATION_MODELS.get(source, "")
+    pair_key = f"{source}->{target}"
+    if pair_key not in argos_model_names:
+        package = next(
+            (
+                pkg
+                for pkg in argos_package.get_installed_packages()
+                if pkg.from_code == source and pkg.to_code == target
+            ),
+            None,
+        )
+        version = getattr(package, "package_version", "") if package else ""
+        argos_model_names[pair_key] = f"argos-{source}-{target}-{version}" if version else f"argos-{source}-{target}"
+    return argos_model_names[pair_key]
 
 
 def translate_with_hf(text: str, source: str, target: str) -> str:
+    """
+    Translates line by line so the script layout survives. Each distinct line
+    is chunked on sentence boundaries within the token budget, and every
+    distinct chunk in the text is sent to the pipeline as one batch, so
+    repeated cues and transitions are translated once.
+    """
     pair_key = f"{source}->{target}"
     translator = hf_translators.get(pair_key)
     if translator is None:
         raise RuntimeError(f"HF translator for {pair_key} not initialized")
 
-    chunks = chunk_text_for_translation(text)
-    translated_chunks = []
-    for index, chunk in enumerate(chunks):
-        result = translator(chunk)
-        translated_chunk = result[0].get("translation_text", chunk) if result else chunk
-        translated_chunks.append(translated_chunk)
-        logger.info(
-            "[Translate][HF] pair=%s chunk=%s/%s inChars=%s outChars=%s",
-            pair_key,
-            index + 1,
-            len(chunks),
-            len(chunk),
-            len(translated_chunk),
-        )
+    tokenizer = getattr(translator, "tokenizer", None)
+    count_tokens = (
+        (lambda segment: len(tokenizer(segment, add_special_tokens=False)["input_ids"]))
+        if tokenizer is not None
+        else None
+    )
 
-    return "\n".join(translated_chunks)
+    lines = text.split("\n")
+    line_chunks = {
+        line: chunk_text_for_translation(line, TRANSLATION_MAX_TOKENS, count_tokens)
+        for line in dict.fromkeys(line.strip() for line in lines)
+        if line
+    }
+    unique_chunks = list(dict.fromkeys(chunk for chunks in line_chunks.values() for chunk in chunks))
+
+    translated: Dict[str, str] = {}
+    if unique_chunks:
+        STAGE_BATCH_SIZE.observe(len(unique_chunks), "translate_hf")
+        with STAGE_LATENCY.time("translate_hf"):
+            results = translator(unique_chunks, batch_size=TRANSLATION_BATCH_SIZE, truncation=True)
+        for chunk, result in zip(unique_chunks, results):
+            translated[chunk] = result.get("translation_text", chunk) if result else chunk
+
+    logger.info(
+        "[Translate][HF] pair=%s lines=%s uniqueLines=%s chunks=%s inChars=%s",
+        pair_key,
+        len(lines),
+        len(line_chunks),
+        len(unique_chunks),
+        len(text),
+    )
+    translated_lines = {
+        line: " ".join(translated[chunk] for chunk in chunks)
+        for line, chunks in line_chunks.items()
+    }
+    return "\n".join(translated_lines.get(line.strip(), "") for line in lines)
+
+
+def translate_missing_with_argos(segments: List[str], source: str, target: str) -> List[str]:
+    # Argos translates newline-separated paragraphs independently, so one call
+    # covers every segment; fall back to per-segment calls if lines drift.
+    with STAGE_LATENCY.time("translate_argos"):
+        translated = argos_translate.translate("\n".join(segments), source, target).split("\n")
+    if len(translated) == len(segments):
+        return translated
+    logger.warning("[Translate][Argos] line count changed; translating %s segments individually", len(segments))
+    with STAGE_LATENCY.time("translate_argos"):
+        return [argos_translate.translate(segment, source, target) for segment in segments]
+
+
+def translate_with_memory(text: str, source: str, target: str, backend: str, model: str):
+    """
+    Splits text into line segments, serves every segment already in the
+    translation memory for this backend and model and sends only the missing
+    ones to the backend. Returns (translated text, segment stats).
+    """
+    lines = text.split("\n")
+    keys = [normalize_text(line) for line in lines]
+    unique = [key for key in dict.fromkeys(keys) if key]
+    with STAGE_LATENCY.time("translation_memory"):
+        found = translation_memory.lookup(source, target, backend, model, unique)
+    missing = [key for key in unique if key not in found]
+
+    if missing:
+        if backend == "argos":
+            translated = translate_missing_with_argos(missing, source, target)
+        elif backend == "hf":
+            translated = translate_with_hf("\n".join(missing), source, target).split("\n")
+        else:
+            raise RuntimeError(f"No translation backend is ready for {source}->{target}")
+        new_segments = dict(zip(missing, translated))
+        translation_memory.store(source, target, backend, model, new_segments)
+        found.update(new_segments)
+
+    stats = {
+        "segments": len(unique),
+        "fromMemory": len(unique) - len(missing),
+        "translated": len(missing),
+    }
+    TRANSLATION_SEGMENTS.inc("memory", amount=stats["fromMemory"])
+    TRANSLATION_SEGMENTS.inc(backend, amount=stats["translated"])
+    return "\n".join(found[key] if key else "" for key in keys), stats
 
 
 def bootstrap_translation_pairs() -> None:
@@ -285,19 +586,43 @@ def get_request_id(request: Request) -> str:
 # Load models on startup
 @app.on_event("startup")
 async def load_models():
-    logger.info("Startup sequence started")
-    # Load lighter models first
-    models["sentiment"] = pipeline("text-classification", model=SENTIMENT_MODEL, device=device)
-    logger.info("Sentiment model loaded")
-    models["emotion"] = pipeline("text-classification", model=EMOTION_MODEL, return_all_scores=True, device=device)
-    logger.info("Emotion model loaded")
-    # Summarizer is heaviest, load last
-    models["summarizer"] = pipeline("summarization", model=SUMMARIZATION_MODEL, device=device)
-    logger.info("Summarizer model loaded")
-    bootstrap_translation_pairs()
+    logger.info("Startup sequence started warmup=%s", MODEL_WARMUP)
+    if MODEL_WARMUP == "lazy":
+        logger.info("Models will load on first use")
+    elif MODEL_WARMUP == "blocking":
+        warmup = models.warm_in_background(bootstrap_translation_pairs)
+        await asyncio.to_thread(warmup.join)
+    else:
+        models.warm_in_background(bootstrap_translation_pairs)
     logger.info("Startup sequence completed")
 
 
+@app.on_event("shutdown")
+async def shutdown_executors():
+    for executor in executors.values():
+        executor.shutdown()
+
+
+@app.exception_handler(ModelUnavailable)
+async def model_unavailable_handler(request: Request, exc: ModelUnavailable):
+    logger.warning("[REQ][%s] model unavailable name=%s", get_request_id(request), exc.name)
+    return FastJSONResponse(
+        status_code=503,
+        content={"detail": f"Model '{exc.name}' is not available: {exc.error}"},
+        headers={"Retry-After": str(exc.retry_after_s)},
+    )
+
+
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturated):
+    logger.warning("[REQ][%s] rejected executor=%s", get_request_id(request), exc.name)
+    return FastJSONResponse(
+        status_code=429,
+        content={"detail": f"Inference for '{exc.name}' is busy. Retry later."},
+        headers={"Retry-After": str(exc.retry_after_s)},
+    )
+
+
 @app.middleware("http")
 async def request_logging_middleware(request: Request, call_next):
     request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
@@ -323,7 +648,13 @@ async def request_logging_middleware(request: Request, call_next):
         )
         raise
 
-    elapsed_ms = (time.perf_counter() - start) * 1000
+    elapsed = time.perf_counter() - start
+    elapsed_ms = elapsed * 1000
+    # Route templates keep label cardinality bounded (e.g. /analyze_incremental/{script_id}).
+    route = request.scope.get("route")
+    REQUEST_LATENCY.observe(
+        elapsed, request.method, route.path if route is not None else "unmatched", str(response.status_code)
+    )
     response.headers["x-request-id"] = request_id
     logger.info(
         "[REQ][%s] END method=%s path=%s status=%s durationMs=%.2f",
@@ -337,17 +668,62 @@ async def request_logging_middleware(request: Request, call_next):
 
 # --- DATA SCHEMAS ---
 
-class TextPayload(BaseModel):
-    text: str
+class StreamPayload(BaseModel):
+    # Defaults to the text stored for scriptId by /parse
+    text: Optional[str] = None
+    scriptId: Optional[str] = None
 
-class SceneData(BaseModel):
-    id: str
+class ParsePayload(BaseModel):
     text: str
+    # When set, the text is kept so later requests can refer to it by scriptId and offsets
+    scriptId: Optional[str] = None
+    # Return start/end offsets into text instead of each scene's raw_text
+    offsets: bool = False
+
+class TextSpan(BaseModel):
+    # Either text, or scriptId plus start/end offsets into a script stored by /parse
+    text: Optional[str] = None
+    scriptId: Optional[str] = None
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+class SceneData(TextSpan):
+    id: str
+
+class ScenesPayload(BaseModel):
+    scenes: List[SceneData]
 
 class NetworkPayload(BaseModel):
     # List of sets of characters per scene
     # e.g. [["Shepard", "Garrus"], ["Liara", "Wrex"], ...]
-    interactions: List[List[str]] 
+    interactions: List[List[str]]
+    # When set, the script's network is kept and only changed scenes are applied
+    scriptId: Optional[str] = None
+    # None = exact up to NETWORK_EXACT_MAX_NODES characters, sampled above
+    exact: Optional[bool] = None
+    # Pivot sources for sampled betweenness; defaults to NETWORK_PIVOTS
+    pivots: Optional[int] = Field(None, ge=1)
+
+
+class ScriptPayload(BaseModel):
+    scriptId: str
+    # Defaults to the text stored for scriptId by /parse
+    text: Optional[str] = None
+
+
+class JobPayload(BaseModel):
+    kind: str
+    payload: Dict[str, Any]
+
+
+class ScriptAnalysisPayload(BaseModel):
+    # Defaults to the text stored for scriptId by /parse
+    text: Optional[str] = None
+    # When set, the script's network is kept and only changed scenes are applied
+    scriptId: Optional[str] = None
+    exact: Optional[bool] = None
+    # Pivot sources for sampled betweenness; defaults to NETWORK_PIVOTS
+    pivots: Optional[int] = Field(None, ge=1)
 
 
 class TranslatePayload(BaseModel):
@@ -355,136 +731,587 @@ class TranslatePayload(BaseModel):
     sourceLanguage: str
     targetLanguage: str = "en"
 
+def stored_script(script_id: str) -> str:
+    text = script_texts.get(script_id)
+    if text is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Script {script_id} is not stored (or was evicted); send it to /parse with scriptId first",
+        )
+    return text
+
+
+def resolve_text(span: TextSpan) -> str:
+    """The request's text, or the span's scene text from the stored script."""
+    if span.text is not None:
+        return span.text
+    if span.scriptId is None or span.start is None or span.end is None:
+        raise HTTPException(status_code=422, detail="Provide text, or scriptId with start and end offsets")
+    script = stored_script(span.scriptId)
+    if not 0 <= span.start <= span.end <= len(script):
+        raise HTTPException(
+            status_code=422,
+            detail=f"Offsets {span.start}:{span.end} are outside script {span.scriptId} ({len(script)} chars)",
+        )
+    return scene_text(script, span.start, span.end)
+
+
+def resolve_scenes(scenes: List[SceneData]) -> List[SceneData]:
+    return [scene if scene.text is not None else SceneData(id=scene.id, text=resolve_text(scene)) for scene in scenes]
+
+
+def resolve_script_text(text: Optional[str], script_id: Optional[str]) -> str:
+    if text is not None:
+        return text
+    if script_id is None:
+        raise HTTPException(status_code=422, detail="Provide text, or the scriptId of a script stored by /parse")
+    return stored_script(script_id)
+
+
 # --- ENDPOINT 1: PARSING (Fast, CPU only) ---
 # Used when loading a file to get the basic structure
 @app.post("/parse")
-async def parse_structure(payload: TextPayload, request: Request):
+async def parse_structure(payload: ParsePayload, request: Request):
     """
     Fast Regex parse. Returns scenes and characters structures 
     WITHOUT running heavy AI models.
+    With offsets, scenes carry start/end into the text instead of raw_text;
+    with scriptId, the text is stored so analysis endpoints accept
+    scriptId + start/end in place of text.
     """
     request_id = get_request_id(request)
-    logger.info("[Parse][%s] chars=%s", request_id, len(payload.text))
-    scenes = []
-    current_scene = None
-    
-    # Simple screenplay regex
-    scene_heading = re.compile(r'^\s*(INT\.|EXT\.|INT\./EXT\.|I/E)(.*)$', re.MULTILINE)
-    
-    lines = payload.text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line: continue
-        
-        if scene_heading.match(line):
-            if current_scene: scenes.append(current_scene)
-            current_scene = {
-                "name": line,
-                "raw_text": "",
-                "characters": set(),
-                "action_lines": 0, 
-                "dialogue_lines": 0
-            }
-        
-        if current_scene:
-            current_scene["raw_text"] += line + "\n"
-            # Detect Character (All caps, no numbers, short)
-            if line.isupper() and len(line) < 30 and not scene_heading.match(line):
-                char_name = line.split('(')[0].strip()
-                if char_name not in ["CUT TO:", "FADE TO:"]:
-                    current_scene["characters"].add(char_name)
-                    current_scene["dialogue_lines"] += 1
-            else:
-                current_scene["action_lines"] += 1
-
-    if current_scene: scenes.append(current_scene)
-    
-    # Format for JSON
-    results = []
-    for i, s in enumerate(scenes):
-        results.append({
-            "id": f"scene-{i}",
-            "name": s["name"],
-            "raw_text": s["raw_text"],
-            "characters": list(s["characters"]),
-            # Basic math metrics
-            "metrics": {
-                "actionRatio": (s["action_lines"] / max(1, s["action_lines"] + s["dialogue_lines"])) * 100,
-                "pacing": 50 # Default, to be filled by AI later
-            }
-        })
-        
+    logger.info(
+        "[Parse][%s] chars=%s scriptId=%s offsets=%s", request_id, len(payload.text), payload.scriptId, payload.offsets
+    )
+    observe_input("/parse", payload.text)
+    with STAGE_LATENCY.time("parse"):
+        results = parse_scenes(payload.text, offsets=payload.offsets)
+    if payload.scriptId:
+        script_texts.put(payload.scriptId, payload.text)
     logger.info("[Parse][%s] extracted_scenes=%s", request_id, len(results))
-    return {"scenes": results}
+    response = {"scenes": results}
+    if payload.scriptId:
+        response["scriptId"] = payload.scriptId
+    # Plain dicts and lists: skip FastAPI's jsonable_encoder pass
+    return FastJSONResponse(response)
 
 # --- ENDPOINT 2: SCENE ANALYSIS (Medium cost) ---
+def tokenizers_shared() -> bool:
+    """
+    True once sentiment and emotion are both loaded with identical tokenizers;
+    their inputs are then tokenized once and cached in `shared_encodings`.
+    """
+    global classifier_tokenizers_shared
+    if classifier_tokenizers_shared is None and "sentiment" in models and "emotion" in models:
+        try:
+            classifier_tokenizers_shared = tokenizer_fingerprint(models["sentiment"].tokenizer) == (
+                tokenizer_fingerprint(models["emotion"].tokenizer)
+            )
+        except Exception as e:
+            logger.warning("Tokenizer comparison failed (%s); tokenizing per model", e)
+            classifier_tokenizers_shared = False
+        logger.info("Sentiment and emotion tokenizers shared=%s", classifier_tokenizers_shared)
+    return bool(classifier_tokenizers_shared)
+
+
+def split_into_windows(texts: List[str], pipe: Any, window_tokens: int):
+    """
+    Flattens every text's token windows (cut with the model's own tokenizer)
+    into one list for a single batched call. Returns (window texts, groups)
+    where groups[i] lists text i's (window index, token count) pairs.
+    """
+    tokenizer = getattr(pipe, "tokenizer", None)
+    flat: List[str] = []
+    groups = []
+    for text in texts:
+        windows = split_windows(text, tokenizer, window_tokens, WINDOW_OVERLAP_TOKENS)
+        groups.append([(len(flat) + i, window.tokens) for i, window in enumerate(windows)])
+        flat.extend(window.text for window in windows)
+    return flat, groups
+
+
+def run_summarizer(summarizer: Any, texts: List[str]) -> List[str]:
+    STAGE_BATCH_SIZE.observe(len(texts), "summarizer")
+    with STAGE_LATENCY.time("summarizer"):
+        sum_res = summarizer(
+            texts,
+            max_length=60,
+            min_length=5,
+            do_sample=False,
+            truncation=True,
+            batch_size=min(len(texts), WINDOW_BATCH_SIZE),
+        )
+    return [res["summary_text"] for res in sum_res]
+
+
+def summarize_texts(texts: List[str]) -> List[str]:
+    """
+    Map-reduce summary: every window of every text is summarized in one
+    batched call. Texts that spanned several windows have their joined
+    window summaries summarized the same way, pass after pass, until the
+    joined summaries fit in one window.
+    """
+    summarizer = models["summarizer"]
+    summaries = list(texts)
+    window_counts = [float("inf")] * len(texts)
+    remaining = list(range(len(texts)))
+    while remaining:
+        windows, groups = split_into_windows([summaries[i] for i in remaining], summarizer, SUMMARY_WINDOW_TOKENS)
+        partial = run_summarizer(summarizer, windows)
+        reduced = []
+        for i, group in zip(remaining, groups):
+            summaries[i] = " ".join(partial[j] for j, _ in group)
+            # Stop if a pass did not shrink the text (windows barely longer than a summary)
+            if 1 < len(group) < window_counts[i]:
+                reduced.append(i)
+            window_counts[i] = len(group)
+        remaining = reduced
+    return summaries
+
+
+def run_classifier(pipe: Any, stage: str, texts: List[str], return_all_scores: bool) -> List[Any]:
+    STAGE_BATCH_SIZE.observe(len(texts), stage)
+    with STAGE_LATENCY.time(stage):
+        if not tokenizers_shared():
+            return pipe(texts, batch_size=min(len(texts), WINDOW_BATCH_SIZE), truncation=True)
+        results = []
+        for start in range(0, len(texts), WINDOW_BATCH_SIZE):
+            batch = texts[start:start + WINDOW_BATCH_SIZE]
+            results.extend(classify_encoded(pipe, shared_encodings.encode(pipe.tokenizer, batch), return_all_scores))
+        return results
+
+
+def score_sentiment(texts: List[str]) -> List[float]:
+    """Signed sentiment per text, the token-weighted mean over its windows."""
+    sentiment = models["sentiment"]
+    windows, groups = split_into_windows(texts, sentiment, CLASSIFIER_WINDOW_TOKENS)
+    sent_res = run_classifier(sentiment, "sentiment", windows, return_all_scores=False)
+    signed = [
+        res["score"] if res["label"] == "POSITIVE" else -res["score"]
+        for res in sent_res
+    ]
+    return [weighted_mean([signed[i] for i, _ in group], [tokens for _, tokens in group]) for group in groups]
+
+
+async def analyze_scene_batch(scenes: List[SceneData]) -> List[Dict[str, Any]]:
+    """
+    Generates Summary, Sentiment, and Pacing for a batch of scenes using one
+    padded forward pass per model. Both models run concurrently on their own
+    executors.
+    """
+    texts = [scene.text for scene in scenes]
+
+    # 1. Summary (short scenes are their own synopsis)
+    # 2. Sentiment / Pacing - we use sentiment to detect "Intensity" or Vibe
+    to_summarize = [i for i, text in enumerate(texts) if len(text) > 100]
+    summary_call = (
+        executors["summarizer"].run(summarize_texts, [texts[i] for i in to_summarize])
+        if to_summarize
+        else asyncio.sleep(0, result=[])
+    )
+    sentiment_call = executors["sentiment"].run(score_sentiment, texts)
+    sum_res, sent_res = await asyncio.gather(summary_call, sentiment_call, return_exceptions=True)
+
+    for res in (sum_res, sent_res):
+        if isinstance(res, (ExecutorSaturated, ModelUnavailable)):
+            raise res
+
+    synopses = list(texts)
+    summary_failed = isinstance(sum_res, Exception)
+    if summary_failed:
+        logger.error("[AnalyzeScene] summarization failed batch=%s", len(to_summarize), exc_info=sum_res)
+        for i in to_summarize:
+            synopses[i] = "Analysis failed."
+    else:
+        for i, synopsis in zip(to_summarize, sum_res):
+            synopses[i] = synopsis
+
+    sentiment_failed = isinstance(sent_res, Exception)
+    if sentiment_failed:
+        logger.error("[AnalyzeScene] sentiment failed batch=%s", len(texts), exc_info=sent_res)
+        scores = [0] * len(texts)
+    else:
+        scores = sent_res
+
+    failed = [stage for stage, stage_failed in (("summary", summary_failed), ("sentiment", sentiment_failed)) if stage_failed]
+    results = []
+    for scene, text, synopsis, score in zip(scenes, texts, synopses, scores):
+        analysis = {
+            "synopsis": synopsis,
+            "metrics": {
+                "sentiment": score,
+                # In a real app, linguistic density = syllables / second.
+                # Here we proxy it via text length vs lines (first 1024 chars, so
+                # values stay on the scale they had before windowing)
+                "linguisticDensity": min(100, len(text[:1024]) / 20),
+            },
+        }
+        # Only cache complete results so failures are retried next time.
+        if failed:
+            analysis["failed"] = failed
+        else:
+            result_cache.put("analyze_scene", scene_cache_model(), scene.text, analysis)
+        results.append({"id": scene.id, **analysis})
+    return results
+
+
+# Each batch makes one summarizer and one sentiment call, and nothing else uses those
+# executors, so running no more batches than both can hold keeps any request (or job)
+# from being rejected by them. Requests are turned away only while earlier ones still
+# hold a full queue of scenes.
+SCENE_BATCH_CONCURRENCY = min(
+    max(INFERENCE_WORKERS["summarizer"], INFERENCE_WORKERS["sentiment"]),
+    min(INFERENCE_WORKERS["summarizer"], INFERENCE_WORKERS["sentiment"]) + INFERENCE_QUEUE_SIZE,
+)
+scene_batcher = MicroBatcher(
+    "scenes",
+    analyze_scene_batch,
+    max_batch_size=SCENE_BATCH_MAX_SIZE,
+    max_wait_ms=SCENE_BATCH_WINDOW_MS,
+    max_concurrency=SCENE_BATCH_CONCURRENCY,
+    max_queued_items=(SCENE_BATCH_CONCURRENCY + INFERENCE_QUEUE_SIZE) * SCENE_BATCH_MAX_SIZE,
+    retry_after_s=INFERENCE_RETRY_AFTER_S,
+)
+
+
+async def analyze_scenes_cached(scenes: List[SceneData]) -> List[Dict[str, Any]]:
+    """
+    Serves scenes from the result cache and sends only the misses to the batcher.
+    """
+    results: List[Any] = [None] * len(scenes)
+    misses = []
+    for i, scene in enumerate(scenes):
+        cached = result_cache.get("analyze_scene", scene_cache_model(), scene.text)
+        if cached is None:
+            misses.append(i)
+        else:
+            results[i] = {"id": scene.id, **cached}
+
+    if misses:
+        computed = await scene_batcher.submit_many([scenes[i] for i in misses])
+        for i, result in zip(misses, computed):
+            results[i] = result
+    return results
+
+
 # Call this when a user finishes editing a specific scene, or lazy-load it
 @app.post("/analyze_scene")
 async def analyze_scene(payload: SceneData, request: Request):
     """
     Generates Summary, Sentiment, and Pacing for ONE scene.
+    Concurrent calls are micro-batched together.
     """
     request_id = get_request_id(request)
-    text = payload.text[:1024] # Limit length
-    logger.info("[AnalyzeScene][%s] id=%s chars=%s", request_id, payload.id, len(text))
-    
-    # 1. Summary
-    try:
-        if len(text) > 100:
-            sum_res = models["summarizer"](text, max_length=60, min_length=5, do_sample=False)
-            synopsis = sum_res[0]['summary_text']
-        else:
-            synopsis = text
-    except Exception:
-        logger.exception("[AnalyzeScene][%s] summarization failed id=%s", request_id, payload.id)
-        synopsis = "Analysis failed."
+    scene = resolve_scenes([payload])[0]
+    logger.info("[AnalyzeScene][%s] id=%s chars=%s", request_id, scene.id, len(scene.text))
+    observe_input("/analyze_scene", scene.text)
+    return (await analyze_scenes_cached([scene]))[0]
 
-    # 2. Sentiment / Pacing
-    # We use sentiment to detect "Intensity" or Vibe
-    try:
-        sent_res = models["sentiment"](text[:512])[0]
-        score = sent_res['score'] if sent_res['label'] == 'POSITIVE' else -sent_res['score']
-    except Exception:
-        logger.exception("[AnalyzeScene][%s] sentiment failed id=%s", request_id, payload.id)
-        score = 0
-        
-    return {
-        "id": payload.id,
-        "synopsis": synopsis,
-        "metrics": {
-            "sentiment": score,
-            # In a real app, linguistic density = syllables / second. 
-            # Here we proxy it via text length vs lines
-            "linguisticDensity": min(100, len(text) / 20) 
-        }
-    }
+
+# Call this to analyze many scenes (e.g. a whole script) in one round-trip
+@app.post("/analyze_scenes")
+async def analyze_scenes(payload: ScenesPayload, request: Request):
+    """
+    Generates Summary, Sentiment, and Pacing for a list of scenes.
+    """
+    request_id = get_request_id(request)
+    start = time.perf_counter()
+    logger.info("[AnalyzeScenes][%s] scenes=%s", request_id, len(payload.scenes))
+    scenes = resolve_scenes(payload.scenes)
+    for scene in scenes:
+        observe_input("/analyze_scenes", scene.text)
+    results = await analyze_scenes_cached(scenes)
+    logger.info(
+        "[AnalyzeScenes][%s] done scenes=%s durationMs=%.2f",
+        request_id,
+        len(results),
+        (time.perf_counter() - start) * 1000,
+    )
+    return {"scenes": results}
 
 # --- ENDPOINT 3: CHARACTER EMOTION (Heavy cost) ---
+def classify_emotions(texts: List[str]) -> List[Dict[str, Any]]:
+    emotion = models["emotion"]
+    windows, groups = split_into_windows(texts, emotion, CLASSIFIER_WINDOW_TOKENS)
+    window_scores = run_classifier(emotion, "emotion", windows, return_all_scores=True)
+    results = [
+        window_scores[group[0][0]] if len(group) == 1
+        else aggregate_label_scores([window_scores[i] for i, _ in group], [tokens for _, tokens in group])
+        for group in groups
+    ]
+    emotions = []
+    for scores in results:
+        # Sort by score
+        sorted_emotions = sorted(scores, key=lambda x: x['score'], reverse=True)
+        emotions.append({
+            "dominant": sorted_emotions[0]['label'],
+            "breakdown": {x['label']: x['score'] for x in scores}
+        })
+    return emotions
+
+
+async def infer_emotions(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Returns the dominant emotion and vector for each text, serving repeats
+    from the result cache and running the misses as one batch.
+    """
+    results: List[Any] = [None] * len(texts)
+    misses = []
+    for i, text in enumerate(texts):
+        cached = result_cache.get("analyze_emotion", emotion_cache_model(), text)
+        if cached is None:
+            misses.append(i)
+        else:
+            results[i] = cached
+
+    if misses:
+        computed = await executors["emotion"].run(classify_emotions, [texts[i] for i in misses])
+        for i, emotion in zip(misses, computed):
+            result_cache.put("analyze_emotion", emotion_cache_model(), texts[i], emotion)
+            results[i] = emotion
+    return results
+
+
 # Call this on specific dialogue blocks or aggregated character text
 @app.post("/analyze_emotion")
-async def analyze_emotion(payload: TextPayload, request: Request):
+async def analyze_emotion(payload: TextSpan, request: Request):
     """
     Returns the dominant emotion and vector for a block of text.
     """
     request_id = get_request_id(request)
-    logger.info("[AnalyzeEmotion][%s] chars=%s", request_id, len(payload.text))
+    text = resolve_text(payload)
+    logger.info("[AnalyzeEmotion][%s] chars=%s", request_id, len(text))
+    observe_input("/analyze_emotion", text)
     try:
         # Get probabilities for all emotions
-        results = models["emotion"](payload.text[:512])[0]
-        # Sort by score
-        sorted_emotions = sorted(results, key=lambda x: x['score'], reverse=True)
-        dominant = sorted_emotions[0]['label']
-        
-        return {
-            "dominant": dominant,
-            "breakdown": {x['label']: x['score'] for x in results}
-        }
+        return (await infer_emotions([text]))[0]
+    except (ExecutorSaturated, ModelUnavailable):
+        raise
     except Exception as e:
         logger.exception("[AnalyzeEmotion][%s] failed", request_id)
         raise HTTPException(500, str(e))
 
 
+def with_emotions(scene_results: List[Dict[str, Any]], emotions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    analyses = []
+    for scene_result, emotion in zip(scene_results, emotions):
+        analysis = {
+            "synopsis": scene_result["synopsis"],
+            "metrics": scene_result["metrics"],
+            "emotion": emotion,
+        }
+        # Placeholder synopsis or sentiment; see analyze_scene_batch
+        if "failed" in scene_result:
+            analysis["failed"] = scene_result["failed"]
+        analyses.append(analysis)
+    return analyses
+
+
+async def analyze_scenes_full(scenes: List[SceneData]) -> List[Dict[str, Any]]:
+    """
+    Summary, sentiment and emotion for each scene, run concurrently.
+    """
+    scene_results, emotions = await asyncio.gather(
+        analyze_scenes_cached(scenes),
+        infer_emotions([scene.text for scene in scenes]),
+    )
+    return with_emotions(scene_results, emotions)
+
+
+# --- ENDPOINT 3b: INCREMENTAL SCRIPT ANALYSIS ---
+# Call this with every saved version of a script; only edited scenes hit the models
+@app.post("/analyze_incremental")
+async def analyze_incremental(payload: ScriptPayload, request: Request):
+    """
+    Parses a new script version, diffs its scenes against the previous version
+    by fingerprint and runs summary, sentiment and emotion only for changed scenes.
+    """
+    request_id = get_request_id(request)
+    start = time.perf_counter()
+    text = resolve_script_text(payload.text, payload.scriptId)
+    observe_input("/analyze_incremental", text)
+    with STAGE_LATENCY.time("parse"):
+        scenes = parse_scenes(text)
+    fingerprints = [scene_fingerprint(scene["raw_text"]) for scene in scenes]
+    changed, previous, removed = script_scene_store.diff(payload.scriptId, fingerprints)
+    logger.info(
+        "[AnalyzeIncremental][%s] script=%s scenes=%s changed=%s removed=%s",
+        request_id,
+        payload.scriptId,
+        len(scenes),
+        len(changed),
+        removed,
+    )
+
+    results = dict(previous)
+    # Like the result cache, the store only keeps complete results, so failed scenes are retried next time
+    complete = dict(previous)
+    if changed:
+        changed_scenes = [SceneData(id=scenes[i]["id"], text=scenes[i]["raw_text"]) for i in changed]
+        analyses = await analyze_scenes_full(changed_scenes)
+        for i, analysis in zip(changed, analyses):
+            results[fingerprints[i]] = analysis
+            if "failed" not in analysis:
+                complete[fingerprints[i]] = analysis
+    script_scene_store.update(payload.scriptId, fingerprints, complete)
+
+    changed_set = set(changed)
+    response_scenes = []
+    for i, (scene, fingerprint) in enumerate(zip(scenes, fingerprints)):
+        analysis = results[fingerprint]
+        response_scene = {
+            "id": scene["id"],
+            "name": scene["name"],
+            "fingerprint": fingerprint,
+            "changed": i in changed_set,
+            "characters": scene["characters"],
+            "synopsis": analysis["synopsis"],
+            "metrics": {**scene["metrics"], **analysis["metrics"]},
+            "emotion": analysis["emotion"],
+        }
+        if "failed" in analysis:
+            response_scene["failed"] = analysis["failed"]
+        response_scenes.append(response_scene)
+
+    logger.info(
+        "[AnalyzeIncremental][%s] done script=%s durationMs=%.2f",
+        request_id,
+        payload.scriptId,
+        (time.perf_counter() - start) * 1000,
+    )
+    return {
+        "scriptId": payload.scriptId,
+        "changed": [scenes[i]["id"] for i in changed],
+        "reused": len(scenes) - len(changed),
+        "removed": removed,
+        "scenes": response_scenes,
+    }
+
+
+@app.delete("/analyze_incremental/{script_id}")
+async def forget_incremental(script_id: str):
+    return {"scriptId": script_id, "forgotten": script_scene_store.forget(script_id)}
+
+
+# --- ENDPOINT 3c: STREAMED SCRIPT ANALYSIS ---
+def format_stream_event(event: Dict[str, Any], sse: bool) -> bytes:
+    data = dumps_json(event)
+    if sse:
+        return b"event: " + event["type"].encode() + b"\ndata: " + data + b"\n\n"
+    return data + b"\n"
+
+
+async def stream_script_analysis(
+    text: str, script_id: Optional[str], request_id: str, sse: bool
+) -> AsyncIterator[bytes]:
+    start = time.perf_counter()
+
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - start) * 1000, 2)
+
+    scenes = parse_scenes(text)
+    total = len(scenes)
+    yield format_stream_event(
+        {"type": "start", "scriptId": script_id, "scenes": total, "parseMs": elapsed_ms()}, sse
+    )
+
+    # Chunks grow 1, 2, 4, ... up to the batch size; the next chunk is started
+    # before the current one is emitted so the executors stay busy.
+    chunks = []
+    index, size = 0, max(1, STREAM_FIRST_CHUNK)
+    while index < total:
+        chunks.append(range(index, min(total, index + size)))
+        index += size
+        size = min(size * 2, SCENE_BATCH_MAX_SIZE)
+
+    def run_chunk(chunk: range) -> asyncio.Task:
+        return asyncio.ensure_future(analyze_scenes_full(
+            [SceneData(id=scenes[i]["id"], text=scenes[i]["raw_text"]) for i in chunk]
+        ))
+
+    completed = 0
+    first_result_ms = None
+    pending = run_chunk(chunks[0]) if chunks else None
+    try:
+        for chunk_index, chunk in enumerate(chunks):
+            current = pending
+            pending = run_chunk(chunks[chunk_index + 1]) if chunk_index + 1 < len(chunks) else None
+            chunk_start = time.perf_counter()
+            analyses = await current
+            chunk_ms = round((time.perf_counter() - chunk_start) * 1000, 2)
+
+            for i, analysis in zip(chunk, analyses):
+                scene = scenes[i]
+                completed += 1
+                if first_result_ms is None:
+                    first_result_ms = elapsed_ms()
+                yield format_stream_event({
+                    "type": "scene",
+                    "index": i,
+                    "id": scene["id"],
+                    "name": scene["name"],
+                    "characters": scene["characters"],
+                    "synopsis": analysis["synopsis"],
+                    "metrics": {**scene["metrics"], **analysis["metrics"]},
+                    "emotion": analysis["emotion"],
+                    "elapsedMs": elapsed_ms(),
+                }, sse)
+
+            yield format_stream_event({
+                "type": "progress",
+                "completed": completed,
+                "total": total,
+                "chunkSize": len(chunk),
+                "chunkMs": chunk_ms,
+                "elapsedMs": elapsed_ms(),
+            }, sse)
+    except Exception as exc:
+        logger.exception("[AnalyzeStream][%s] failed completed=%s/%s", request_id, completed, total)
+        yield format_stream_event({"type": "error", "detail": str(exc), "completed": completed}, sse)
+        return
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+    logger.info(
+        "[AnalyzeStream][%s] done scenes=%s firstResultMs=%s durationMs=%s",
+        request_id,
+        total,
+        first_result_ms,
+        elapsed_ms(),
+    )
+    yield format_stream_event({
+        "type": "done",
+        "scenes": total,
+        "firstResultMs": first_result_ms,
+        "elapsedMs": elapsed_ms(),
+    }, sse)
+
+
+# Call this to analyze a whole script and render scenes as they finish
+@app.post("/analyze_stream")
+async def analyze_stream(payload: StreamPayload, request: Request):
+    """
+    Parses a whole script and streams each scene's synopsis, sentiment and
+    emotion as soon as it is ready, with progress and timing events.
+    Send text, or the scriptId of a script stored by /parse.
+    Sends Server-Sent Events when the client accepts text/event-stream,
+    NDJSON otherwise.
+    """
+    request_id = get_request_id(request)
+    text = resolve_script_text(payload.text, payload.scriptId)
+    sse = "text/event-stream" in request.headers.get("accept", "")
+    logger.info(
+        "[AnalyzeStream][%s] chars=%s scriptId=%s sse=%s", request_id, len(text), payload.scriptId, sse
+    )
+    observe_input("/analyze_stream", text)
+    return StreamingResponse(
+        stream_script_analysis(text, payload.scriptId, request_id, sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/translate")
 async def translate_text(payload: TranslatePayload, request: Request):
     """
@@ -502,6 +1329,7 @@ async def translate_text(payload: TranslatePayload, request: Request):
         target_language,
         len(text),
     )
+    observe_input("/translate", text)
 
     if source_language not in SUPPORTED_TRANSLATION_LANGUAGES:
         raise HTTPException(
@@ -528,7 +1356,7 @@ async def translate_text(payload: TranslatePayload, request: Request):
     pair_key = f"{source_language}->{target_language}"
     if not translation_ready.get(pair_key):
         logger.warning("[Translate][%s] pair not ready for %s, retrying init", request_id, pair_key)
-        ensure_translation_backend(source_language, target_language)
+        await executors["translation"].run(ensure_translation_backend, source_language, target_language)
 
     if not translation_ready.get(pair_key):
         raise HTTPException(
@@ -541,20 +1369,34 @@ async def translate_text(payload: TranslatePayload, request: Request):
 
     try:
         backend = translation_backend.get(pair_key, "unavailable")
-        if backend == "argos":
-            translated_text = argos_translate.translate(text, source_language, target_language)
-        elif backend == "hf":
-            translated_text = translate_with_hf(text, source_language, target_language)
+        model = translation_model_name(source_language, target_language, backend)
+        # Entries hold the translation and the memory stats of the run that produced it
+        cache_model = f"{backend}:{model}:{pair_key}:with-stats"
+        cached = result_cache.get("translate", cache_model, text)
+        if cached is not None:
+            logger.info("[Translate][%s] cache hit backend=%s", request_id, backend)
+            translated_text, memory_stats = cached["translatedText"], cached["translationMemory"]
         else:
-            raise RuntimeError(f"No translation backend is ready for {pair_key}")
+            translated_text, memory_stats = await executors["translation"].run(
+                translate_with_memory, text, source_language, target_language, backend, model
+            )
+            result_cache.put(
+                "translate",
+                cache_model,
+                text,
+                {"translatedText": translated_text, "translationMemory": memory_stats},
+            )
+        TRANSLATIONS.inc(backend, pair_key)
 
         logger.info(
-            "[Translate][%s] success source=%s target=%s backend=%s outChars=%s",
+            "[Translate][%s] success source=%s target=%s backend=%s outChars=%s segments=%s fromMemory=%s",
             request_id,
             source_language,
             target_language,
             backend,
             len(translated_text),
+            memory_stats["segments"],
+            memory_stats["fromMemory"],
         )
         return {
             "sourceLanguage": source_language,
@@ -563,63 +1405,360 @@ async def translate_text(payload: TranslatePayload, request: Request):
             "didTranslate": True,
             "originalText": text,
             "translatedText": translated_text,
+            "translationMemory": memory_stats,
+            "cached": cached is not None,
         }
+    except (ExecutorSaturated, ModelUnavailable):
+        raise
     except Exception as e:
         logger.exception("[Translate][%s] failed", request_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 # --- ENDPOINT 4: NETWORK METRICS (Cheap) ---
-# Call this whenever the character lists in scenes change
-@app.post("/analyze_network")
-async def analyze_network(payload: NetworkPayload, request: Request):
+def network_metrics(network, exact: Optional[bool], pivots: Optional[int], request_id: str):
     """
-    Calculates Influence (Centrality) based on who appears in scenes together.
+    Degree and betweenness per character. Betweenness is exact up to
+    NETWORK_EXACT_MAX_NODES characters unless `exact` says otherwise.
+    Returns (metrics by name, pivots used or None when exact).
     """
-    request_id = get_request_id(request)
-    logger.info("[AnalyzeNetwork][%s] interaction_sets=%s", request_id, len(payload.interactions))
-    G = nx.Graph()
-    
-    # Build Graph
-    for char_list in payload.interactions:
-        # Add nodes
-        for char in char_list:
-            if not G.has_node(char): G.add_node(char)
-            
-        # Add edges (clique expansion)
-        for i in range(len(char_list)):
-            for j in range(i + 1, len(char_list)):
-                u, v = char_list[i], char_list[j]
-                if G.has_edge(u, v):
-                    G[u][v]['weight'] += 1
-                else:
-                    G.add_edge(u, v, weight=1)
-                    
-    # Calculate Metrics
+    n = network.node_count
+    exact = exact if exact is not None else n <= NETWORK_EXACT_MAX_NODES
+    pivots = None if exact else (pivots or NETWORK_PIVOTS)
     try:
-        deg = nx.degree_centrality(G)
-        bet = nx.betweenness_centrality(G)
+        with STAGE_LATENCY.time("network"):
+            deg = network.degree_centrality()
+            bet = network.betweenness_centrality(k=pivots)
     except Exception:
         logger.exception("[AnalyzeNetwork][%s] metric computation failed", request_id)
         deg = {}
         bet = {}
-        
+
     # Format for frontend
     results = {}
-    for node in G.nodes():
+    for node in deg:
         results[node] = {
             "degreeCentrality": deg.get(node, 0),
             "betweenness": bet.get(node, 0)
         }
-        
-    logger.info("[AnalyzeNetwork][%s] nodes=%s", request_id, len(results))
+    return results, pivots
+
+
+def compute_network(
+    script_id: Optional[str],
+    interactions: List[List[str]],
+    exact: Optional[bool],
+    pivots: Optional[int],
+    request_id: str,
+):
+    """
+    Builds the network (or syncs the stored one for `script_id`) and computes
+    its metrics. CPU-bound, so callers run it off the event loop.
+    Returns (metrics by name, pivots used, scenes added, scenes removed).
+    """
+    if not script_id:
+        network = build_network(interactions)
+        results, pivots = network_metrics(network, exact, pivots, request_id)
+        return results, pivots, len(interactions), 0
+
+    with network_lock:
+        network, added, removed = network_store.sync(script_id, interactions)
+        results, pivots = network_metrics(network, exact, pivots, request_id)
+    return results, pivots, added, removed
+
+
+# Call this whenever the character lists in scenes change
+@app.post("/analyze_network")
+async def analyze_network(payload: NetworkPayload, request: Request):
+    """
+    Calculates Influence (Centrality) based on who appears in scenes together.
+    """
+    request_id = get_request_id(request)
+    logger.info("[AnalyzeNetwork][%s] interaction_sets=%s", request_id, len(payload.interactions))
+    start = time.perf_counter()
+
+    results, pivots, added, removed = await run_in_threadpool(
+        compute_network, payload.scriptId, payload.interactions, payload.exact, payload.pivots, request_id
+    )
+    logger.info(
+        "[AnalyzeNetwork][%s] nodes=%s added=%s removed=%s pivots=%s durationMs=%.2f",
+        request_id,
+        len(results),
+        added,
+        removed,
+        pivots or "exact",
+        (time.perf_counter() - start) * 1000,
+    )
     return results
 
+# --- ENDPOINT 5: WHOLE-SCRIPT ANALYSIS ---
+# Call this once per script instead of /parse + /analyze_scene + /analyze_emotion + /analyze_network
+async def run_script_analysis(
+    payload: ScriptAnalysisPayload,
+    request_id: str,
+    report_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Parses the script once, then runs scene summaries, sentiment and emotion
+    plus per-character emotion as batches, and builds the character network
+    from the parsed scenes. Shared by /analyze_script and analyze_script jobs.
+    """
+    start = time.perf_counter()
+    report_progress = report_progress or (lambda progress: None)
+
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - start) * 1000, 2)
+
+    with STAGE_LATENCY.time("parse"):
+        scenes = parse_scenes(payload.text, with_dialogue=True)
+    parse_ms = elapsed_ms()
+
+    characters: Dict[str, Dict[str, Any]] = {}
+    interactions = []
+    for scene in scenes:
+        names = [name for name in scene["characters"] if name]
+        interactions.append(names)
+        for name in names:
+            characters.setdefault(name, {"scenes": 0, "lines": []})["scenes"] += 1
+        for name, lines in scene["dialogue"].items():
+            characters[name]["lines"].extend(lines)
+    emotion_names = [name for name, entry in characters.items() if len(entry["lines"]) >= CHARACTER_EMOTION_MIN_LINES]
+    logger.info(
+        "[AnalyzeScript][%s] chars=%s scenes=%s characters=%s emotionCharacters=%s",
+        request_id,
+        len(payload.text),
+        len(scenes),
+        len(characters),
+        len(emotion_names),
+    )
+
+    # Models run on their executors while the network is computed on a worker thread. Scene
+    # and character emotions share one executor call, so a script takes a single emotion slot.
+    analysis = asyncio.gather(
+        analyze_scenes_cached([SceneData(id=scene["id"], text=scene["raw_text"]) for scene in scenes]),
+        infer_emotions(
+            [scene["raw_text"] for scene in scenes] + [" ".join(characters[name]["lines"]) for name in emotion_names]
+        ),
+    )
+    network_results, pivots, _, _ = await run_in_threadpool(
+        compute_network, payload.scriptId, interactions, payload.exact, payload.pivots, request_id
+    )
+    network_ms = round(elapsed_ms() - parse_ms, 2)
+    report_progress({"stage": "models", "scenes": len(scenes), "characters": len(characters)})
+
+    scene_results, emotions = await analysis
+    scene_analyses = with_emotions(scene_results, emotions[:len(scenes)])
+    emotion_by_name = dict(zip(emotion_names, emotions[len(scenes):]))
+
+    response_scenes = []
+    for scene, result in zip(scenes, scene_analyses):
+        response_scenes.append({
+            "id": scene["id"],
+            "name": scene["name"],
+            "characters": [name for name in scene["characters"] if name],
+            "synopsis": result["synopsis"],
+            "metrics": {**scene["metrics"], **result["metrics"]},
+            "emotion": result["emotion"],
+        })
+
+    response_characters = []
+    for name, entry in characters.items():
+        response_characters.append({
+            "name": name,
+            "scenes": entry["scenes"],
+            "dialogueLines": len(entry["lines"]),
+            "emotion": emotion_by_name.get(name),
+            "metrics": network_results.get(name, {"degreeCentrality": 0, "betweenness": 0}),
+        })
+
+    timings = {"parseMs": parse_ms, "networkMs": network_ms, "totalMs": elapsed_ms()}
+    logger.info(
+        "[AnalyzeScript][%s] done scenes=%s characters=%s pivots=%s durationMs=%s",
+        request_id,
+        len(response_scenes),
+        len(response_characters),
+        pivots or "exact",
+        timings["totalMs"],
+    )
+    return {
+        "scriptId": payload.scriptId,
+        "scenes": response_scenes,
+        "characters": response_characters,
+        "timings": timings,
+    }
+
+
+@app.post("/analyze_script")
+async def analyze_script(payload: ScriptAnalysisPayload, request: Request):
+    """
+    Whole-script analysis in one request: scenes, characters and network.
+    Sentiment and emotion share tokenized inputs only when both models load
+    with identical tokenizers (see /health); otherwise each model tokenizes
+    its own inputs.
+    Use POST /jobs with kind "analyze_script" for scripts too long to wait on.
+    """
+    payload = payload.model_copy(update={"text": resolve_script_text(payload.text, payload.scriptId)})
+    observe_input("/analyze_script", payload.text)
+    return await run_script_analysis(payload, get_request_id(request))
+
+
+# --- ENDPOINT 6: BACKGROUND JOBS ---
+# Submit long analyses, then poll GET /jobs/{id} or stream GET /jobs/{id}/events
+async def run_script_job(job_id: str, payload: Dict[str, Any], report_progress) -> Dict[str, Any]:
+    return await run_script_analysis(ScriptAnalysisPayload(**payload), job_id, report_progress)
+
+
+async def run_scenes_job(job_id: str, payload: Dict[str, Any], report_progress) -> Dict[str, Any]:
+    # Batch-sized chunks so progress moves; after a restart, finished scenes come from the result cache.
+    scenes = ScenesPayload(**payload).scenes
+    results: List[Dict[str, Any]] = []
+    report_progress({"completed": 0, "total": len(scenes)})
+    for start in range(0, len(scenes), SCENE_BATCH_MAX_SIZE):
+        results.extend(await analyze_scenes_cached(scenes[start:start + SCENE_BATCH_MAX_SIZE]))
+        report_progress({"completed": len(results), "total": len(scenes)})
+    return {"scenes": results}
+
+
+JOB_KINDS = {
+    "analyze_script": (ScriptAnalysisPayload, run_script_job),
+    "analyze_scenes": (ScenesPayload, run_scenes_job),
+}
+job_queue = JobQueue(
+    JobStore(JOB_DB_PATH),
+    {kind: handler for kind, (_, handler) in JOB_KINDS.items()},
+    workers=JOB_WORKERS,
+    result_ttl_s=JOB_RESULT_TTL_S,
+    max_queued=JOB_MAX_QUEUED,
+    max_attempts=JOB_MAX_ATTEMPTS,
+    max_retries=JOB_MAX_RETRIES,
+    retryable=(ExecutorSaturated, ModelUnavailable),
+)
+
+
+@app.on_event("startup")
+async def start_jobs():
+    job_queue.start()
+
+
+@app.on_event("shutdown")
+async def stop_jobs():
+    await job_queue.stop()
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(payload: JobPayload, request: Request):
+    """
+    Queues a long analysis and returns its job ID immediately.
+    Kinds: analyze_script (ScriptAnalysisPayload), analyze_scenes (ScenesPayload).
+    """
+    request_id = get_request_id(request)
+    if payload.kind not in JOB_KINDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown job kind '{payload.kind}'. Supported: {', '.join(JOB_KINDS)}",
+        )
+    schema, _ = JOB_KINDS[payload.kind]
+    try:
+        validated = schema(**payload.payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=json.loads(e.json()))
+    # Stored scripts are not persisted, so jobs keep the resolved text to survive restarts
+    if isinstance(validated, ScenesPayload):
+        validated = ScenesPayload(scenes=resolve_scenes(validated.scenes))
+    else:
+        validated = validated.model_copy(update={"text": resolve_script_text(validated.text, validated.scriptId)})
+    job_payload = validated.model_dump()
+
+    try:
+        job = job_queue.submit(payload.kind, job_payload)
+    except OverflowError:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Job queue is full ({JOB_MAX_QUEUED} queued)",
+            headers={"Retry-After": "30"},
+        )
+    logger.info("[Jobs][%s] submitted job=%s kind=%s", request_id, job["jobId"], payload.kind)
+    return {**job, "statusUrl": f"/jobs/{job['jobId']}", "eventsUrl": f"/jobs/{job['jobId']}/events"}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_queue.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or expired")
+    return job
+
+
+async def stream_job_events(job_id: str, sse: bool) -> AsyncIterator[bytes]:
+    last = None
+    while True:
+        job = job_queue.store.get(job_id, with_result=False)
+        if job is None:
+            yield format_stream_event({"type": "error", "detail": f"Job {job_id} not found or expired"}, sse)
+            return
+        if job != last:
+            last = job
+            if job["status"] in TERMINAL:
+                yield format_stream_event({"type": "done", **job_queue.store.get(job_id)}, sse)
+                return
+            yield format_stream_event({"type": "status", **job}, sse)
+        elif sse:
+            yield b": keepalive\n\n"
+        await job_queue.wait_for_change(timeout=15)
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, request: Request):
+    """
+    Streams status and progress changes until the job finishes; the final
+    "done" event carries the result. SSE or NDJSON, as for /analyze_stream.
+    """
+    sse = "text/event-stream" in request.headers.get("accept", "")
+    return StreamingResponse(
+        stream_job_events(job_id, sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or expired")
+    return job
+
+
 @app.get("/health")
 def health():
+    model_status = models.status()
+    states = {model["state"] for model in model_status.values()}
+    if states == {READY}:
+        status = "ready"
+    elif FAILED in states:
+        status = "degraded"
+    else:
+        status = "starting"
     return {
-        "status": "ready",
+        "status": status,
+        "models": model_status,
+        "inferenceBackends": loaded_backends,
+        "configuredInferenceBackends": MODEL_BACKENDS,
+        # None until both classifiers have loaded
+        "classifierTokenizersShared": classifier_tokenizers_shared,
         "device": device,
         "translationReady": translation_ready,
         "translationBackend": translation_backend,
         "supportedLanguages": sorted(SUPPORTED_TRANSLATION_LANGUAGES),
-    }
\ No newline at end of file
+        "executors": {name: executor.status() for name, executor in executors.items()},
+        "cache": result_cache.status(),
+        "translationMemory": translation_memory.status(),
+        "jobs": job_queue.status(),
+    }
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """
+    Prometheus text exposition: request and per-stage latency histograms,
+    input sizes, executor queue depth, cache and translation counters.
+    """
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
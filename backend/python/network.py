@@ -0,0 +1,252 @@
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Sources are processed in blocks so the dense path-count matrices stay small.
+_BETWEENNESS_SOURCE_BLOCK = 256
+
+
+def scene_key(char_list: Iterable[str]) -> Tuple[str, ...]:
+    """Order-insensitive key for one scene's cast, duplicates removed."""
+    return tuple(sorted(set(char_list)))
+
+
+class CooccurrenceNetwork:
+    """
+    Character co-occurrence graph kept as sparse edge weights plus per-node
+    degree arrays, updated in place as scenes are added or removed.
+
+    Degree centrality is a vectorized read of the degree array. Betweenness
+    uses a batched, matrix-based Brandes pass over a CSR adjacency matrix,
+    optionally sampling `k` pivot sources, and is cached until the graph's
+    structure (not just its weights) changes.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._free: List[int] = []
+        # scenes each node appears in; a node is dropped when this reaches 0
+        self._appearances = np.zeros(0, dtype=np.int64)
+        # number of distinct neighbours per node
+        self._degree = np.zeros(0, dtype=np.int64)
+        # (i, j) with i < j -> number of shared scenes
+        self._weights: Dict[Tuple[int, int], int] = {}
+        self._structure_version = 0
+        self._csr_cache: Optional[Tuple[int, sparse.csr_matrix]] = None
+        self._betweenness_cache: Dict[Tuple[int, Optional[int], int], np.ndarray] = {}
+
+    # --- updates ---
+
+    def _node_id(self, name: str) -> int:
+        node = self._index.get(name)
+        if node is not None:
+            return node
+
+        if self._free:
+            node = self._free.pop()
+            self._names[node] = name
+        else:
+            node = len(self._names)
+            self._names.append(name)
+            if node >= len(self._appearances):
+                capacity = max(16, 2 * len(self._appearances))
+                self._appearances = np.resize(self._appearances, capacity)
+                self._degree = np.resize(self._degree, capacity)
+                self._appearances[node:] = 0
+                self._degree[node:] = 0
+        self._index[name] = node
+        self._structure_version += 1
+        return node
+
+    def add_scene(self, char_list: Iterable[str]) -> None:
+        nodes = sorted(self._node_id(name) for name in set(char_list))
+        self._appearances[nodes] += 1
+        for a in range(len(nodes)):
+            for b in range(a + 1, len(nodes)):
+                edge = (nodes[a], nodes[b])
+                weight = self._weights.get(edge, 0)
+                if weight == 0:
+                    self._degree[list(edge)] += 1
+                    self._structure_version += 1
+                self._weights[edge] = weight + 1
+
+    def remove_scene(self, char_list: Iterable[str]) -> None:
+        nodes = sorted(self._index[name] for name in set(char_list) if name in self._index)
+        for a in range(len(nodes)):
+            for b in range(a + 1, len(nodes)):
+                edge = (nodes[a], nodes[b])
+                weight = self._weights.get(edge, 0)
+                if weight <= 1:
+                    if weight == 1:
+                        del self._weights[edge]
+                        self._degree[list(edge)] -= 1
+                        self._structure_version += 1
+                else:
+                    self._weights[edge] = weight - 1
+
+        for node in nodes:
+            self._appearances[node] -= 1
+            if self._appearances[node] <= 0:
+                self._appearances[node] = 0
+                del self._index[self._names[node]]
+                self._names[node] = None
+                self._free.append(node)
+                self._structure_version += 1
+
+    # --- metrics ---
+
+    @property
+    def node_count(self) -> int:
+        return len(self._index)
+
+    def _active_nodes(self) -> np.ndarray:
+        return np.fromiter(sorted(self._index.values()), dtype=np.int64, count=len(self._index))
+
+    def _adjacency(self) -> sparse.csr_matrix:
+        """Unweighted symmetric adjacency over all slots (inactive slots are isolated)."""
+        if self._csr_cache and self._csr_cache[0] == self._structure_version:
+            return self._csr_cache[1]
+
+        size = len(self._names)
+        if self._weights:
+            edges = np.fromiter(
+                chain.from_iterable(self._weights), dtype=np.int64, count=2 * len(self._weights)
+            ).reshape(-1, 2)
+            rows = np.concatenate([edges[:, 0], edges[:, 1]])
+            cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        else:
+            rows = cols = np.zeros(0, dtype=np.int64)
+        data = np.ones(len(rows), dtype=np.float64)
+        matrix = sparse.csr_matrix((data, (rows, cols)), shape=(size, size))
+        self._csr_cache = (self._structure_version, matrix)
+        return matrix
+
+    def degree_centrality(self) -> Dict[str, float]:
+        n = self.node_count
+        if n == 0:
+            return {}
+        if n == 1:
+            return {name: 1.0 for name in self._index}
+        active = self._active_nodes()
+        values = self._degree[active] / (n - 1)
+        return {self._names[node]: float(value) for node, value in zip(active, values)}
+
+    def betweenness_centrality(self, k: Optional[int] = None, seed: int = 0) -> Dict[str, float]:
+        """
+        Normalized shortest-path betweenness, matching networkx on the
+        unweighted graph. With `k` pivots the result is an unbiased estimate.
+        """
+        n = self.node_count
+        if n == 0:
+            return {}
+        active = self._active_nodes()
+        if k is not None and k >= n:
+            k = None
+
+        cache_key = (self._structure_version, k, seed)
+        scores = self._betweenness_cache.get(cache_key)
+        if scores is None:
+            if k is None:
+                sources = active
+            else:
+                sources = np.random.default_rng(seed).choice(active, size=k, replace=False)
+            scores = self._brandes(self._adjacency(), sources)
+            if n > 2:
+                scale = 1 / ((n - 1) * (n - 2))
+                if k is not None:
+                    scale *= n / k
+                scores = scores * scale
+            self._betweenness_cache = {cache_key: scores}
+
+        return {self._names[node]: float(scores[node]) for node in active}
+
+    @staticmethod
+    def _brandes(adjacency: sparse.csr_matrix, sources: np.ndarray) -> np.ndarray:
+        # The adjacency is symmetric, so it propagates both forward and
+        # backward; matrices are laid out (node, source) so each step is one
+        # sparse-times-dense product on contiguous memory.
+        size = adjacency.shape[0]
+        totals = np.zeros(size, dtype=np.float64)
+
+        for block_start in range(0, len(sources), _BETWEENNESS_SOURCE_BLOCK):
+            block = sources[block_start:block_start + _BETWEENNESS_SOURCE_BLOCK]
+
+            # Forward BFS for all sources in the block at once: frontier[v, s]
+            # holds the number of shortest paths from s reaching v at this depth.
+            frontier = np.zeros((size, len(block)), dtype=np.float64)
+            frontier[block, np.arange(len(block))] = 1.0
+            sigma = frontier.copy()
+            visited = frontier > 0
+            levels = [visited.copy()]
+            while True:
+                frontier = adjacency @ frontier
+                frontier[visited] = 0.0
+                reached = frontier > 0
+                if not reached.any():
+                    break
+                sigma += frontier
+                visited |= reached
+                levels.append(reached)
+
+            # Backward dependency accumulation, deepest level first; sources
+            # (level 0) never receive a dependency.
+            inverse_sigma = 1.0 / np.where(sigma > 0, sigma, 1.0)
+            delta = np.zeros_like(sigma)
+            for depth in range(len(levels) - 1, 1, -1):
+                weight = (1.0 + delta) * inverse_sigma
+                weight *= levels[depth]
+                contribution = adjacency @ weight
+                contribution *= sigma
+                contribution *= levels[depth - 1]
+                delta += contribution
+            totals += delta.sum(axis=1)
+
+        return totals
+
+
+class NetworkStore:
+    """
+    Per-script co-occurrence networks. A new interaction list is diffed
+    against the scenes already applied so only added and removed scenes
+    touch the graph. Bounded to `max_scripts`, least recently used dropped.
+    """
+
+    def __init__(self, max_scripts: int):
+        self.max_scripts = max(1, max_scripts)
+        self._scripts: "OrderedDict[str, Tuple[CooccurrenceNetwork, Counter]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sync(self, script_id: str, interactions: List[List[str]]) -> Tuple[CooccurrenceNetwork, int, int]:
+        """Returns (network, scenes added, scenes removed)."""
+        target = Counter(scene_key(char_list) for char_list in interactions)
+        with self._lock:
+            network, applied = self._scripts.get(script_id) or (CooccurrenceNetwork(), Counter())
+            # One pass over each side instead of two Counter subtractions
+            changes = {key: count - applied.get(key, 0) for key, count in target.items()}
+            changes.update((key, -count) for key, count in applied.items() if key not in target)
+            added = removed = 0
+            for key, change in changes.items():
+                for _ in range(-change):
+                    network.remove_scene(key)
+                removed += max(0, -change)
+            for key, change in changes.items():
+                for _ in range(change):
+                    network.add_scene(key)
+                added += max(0, change)
+            self._scripts[script_id] = (network, target)
+            self._scripts.move_to_end(script_id)
+            while len(self._scripts) > self.max_scripts:
+                self._scripts.popitem(last=False)
+        return network, added, removed
+
+
+def build_network(interactions: List[List[str]]) -> CooccurrenceNetwork:
+    network = CooccurrenceNetwork()
+    for char_list in interactions:
+        network.add_scene(char_list)
+    return network
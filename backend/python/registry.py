@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("py-ai-service")
+
+NOT_LOADED = "not_loaded"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class ModelUnavailable(Exception):
+    """Raised when a model failed to load and is still inside its retry backoff."""
+
+    def __init__(self, name: str, error: str, retry_after_s: int):
+        super().__init__(f"Model '{name}' is unavailable: {error}")
+        self.name = name
+        self.error = error
+        self.retry_after_s = retry_after_s
+
+
+class _ModelSlot:
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.state = NOT_LOADED
+        self.model: Any = None
+        self.error: Optional[str] = None
+        self.load_ms: Optional[float] = None
+        self.failed_at = 0.0
+
+
+class ModelRegistry:
+    """
+    Loads models on first use instead of at startup. `registry[name]` blocks
+    the calling (executor) thread until the model is ready; concurrent
+    callers share one load. `warm` loads models in parallel background
+    threads so they are usually ready before the first request.
+    """
+
+    def __init__(self, retry_after_s: int = 30):
+        self.retry_after_s = retry_after_s
+        self._slots: Dict[str, _ModelSlot] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        self._slots[name] = _ModelSlot(loader)
+
+    def names(self):
+        return list(self._slots)
+
+    def __contains__(self, name: str) -> bool:
+        slot = self._slots.get(name)
+        return slot is not None and slot.state == READY
+
+    def __getitem__(self, name: str) -> Any:
+        slot = self._slots[name]
+        if slot.state == READY:
+            return slot.model
+
+        with slot.lock:
+            if slot.state == READY:
+                return slot.model
+            if slot.state == FAILED and time.monotonic() - slot.failed_at < self.retry_after_s:
+                remaining = int(self.retry_after_s - (time.monotonic() - slot.failed_at)) + 1
+                raise ModelUnavailable(name, slot.error or "load failed", remaining)
+
+            slot.state = LOADING
+            logger.info("Model loading name=%s", name)
+            start = time.perf_counter()
+            try:
+                slot.model = slot.loader()
+            except Exception as exc:
+                slot.state = FAILED
+                slot.error = str(exc)
+                slot.failed_at = time.monotonic()
+                logger.exception("Model load failed name=%s", name)
+                raise ModelUnavailable(name, slot.error, self.retry_after_s) from exc
+
+            slot.load_ms = (time.perf_counter() - start) * 1000
+            slot.error = None
+            slot.state = READY
+            logger.info("Model ready name=%s loadMs=%.0f", name, slot.load_ms)
+            return slot.model
+
+    def warm(self, name: str) -> None:
+        try:
+            self[name]
+        except ModelUnavailable:
+            pass  # already logged; state is reported on /health
+
+    def warm_in_background(self, *extra_tasks: Callable[[], None]) -> threading.Thread:
+        """
+        Loads every registered model (plus any extra startup tasks) in parallel
+        daemon threads. Returns a thread that finishes when all of them have.
+        """
+        tasks = [lambda name=name: self.warm(name) for name in self._slots] + list(extra_tasks)
+
+        def run_all():
+            start = time.perf_counter()
+            threads = [threading.Thread(target=task, daemon=True) for task in tasks]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            logger.info("Model warmup finished durationMs=%.0f", (time.perf_counter() - start) * 1000)
+
+        supervisor = threading.Thread(target=run_all, name="model-warmup", daemon=True)
+        supervisor.start()
+        return supervisor
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "state": slot.state,
+                "error": slot.error,
+                "loadMs": round(slot.load_ms, 1) if slot.load_ms is not None else None,
+            }
+            for name, slot in self._slots.items()
+        }
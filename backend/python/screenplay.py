@@ -0,0 +1,104 @@
+import re
+from typing import Any, Dict, List
+
+# Simple screenplay regex, compiled once at import
+SCENE_HEADING_RE = re.compile(r'^\s*(INT\.|EXT\.|INT\./EXT\.|I/E)(.*)$')
+TRANSITION_CUES = {"CUT TO:", "FADE TO:"}
+
+
+def scene_text(text: str, start: int, end: int) -> str:
+    """
+    The `raw_text` of the span text[start:end]: its non-blank lines, stripped.
+    For a scene's start/end offsets this equals the scene's own `raw_text`.
+    """
+    return "".join(stripped + "\n" for stripped in (line.strip() for line in text[start:end].split("\n")) if stripped)
+
+
+def parse_scenes(text: str, with_dialogue: bool = False, offsets: bool = False) -> List[Dict[str, Any]]:
+    """
+    Fast Regex parse. Returns scenes and characters structures
+    WITHOUT running heavy AI models.
+
+    Single pass over the text: each line is stripped and classified once,
+    scenes record their start/end offsets into `text` and collect their lines
+    so `raw_text` is joined once per scene instead of grown with `+=`.
+
+    With `with_dialogue`, each scene also gets a `dialogue` map of character
+    name -> spoken lines (the lines under a cue up to the next blank line,
+    parentheticals skipped).
+
+    With `offsets`, scenes carry `start`/`end` character offsets into `text`
+    instead of a copy of their `raw_text` (see scene_text).
+    """
+    scenes = []
+    current_scene = None
+    offset = 0
+    speaker = None
+
+    for line in text.split('\n'):
+        line_start = offset
+        offset += len(line) + 1
+        stripped = line.strip()
+        if not stripped:
+            speaker = None
+            continue
+
+        # Headings start with I or E once stripped; skip the regex for everything else
+        is_heading = stripped[0] in "IE" and SCENE_HEADING_RE.match(stripped) is not None
+
+        if is_heading:
+            if current_scene: scenes.append(current_scene)
+            current_scene = {
+                "name": stripped,
+                "start": line_start + line.find(stripped[0]),
+                "lines": [],
+                # dict keeps first-seen order for stable output
+                "characters": {},
+                "dialogue": {},
+                "action_lines": 0,
+                "dialogue_lines": 0
+            }
+
+        if current_scene:
+            current_scene["lines"].append(stripped)
+            current_scene["end"] = offset - 1
+            # Detect Character (All caps, no numbers, short)
+            if not is_heading and len(stripped) < 30 and stripped.isupper():
+                char_name = stripped.split('(')[0].strip()
+                if char_name not in TRANSITION_CUES:
+                    current_scene["characters"][char_name] = None
+                    current_scene["dialogue_lines"] += 1
+                    # An all-caps parenthetical such as "(V.O.)" keeps the current speaker
+                    speaker = char_name or speaker
+            else:
+                current_scene["action_lines"] += 1
+                if is_heading:
+                    speaker = None
+                elif with_dialogue and speaker is not None and stripped[0] != "(":
+                    current_scene["dialogue"].setdefault(speaker, []).append(stripped)
+
+    if current_scene: scenes.append(current_scene)
+
+    # Format for JSON
+    results = []
+    for i, s in enumerate(scenes):
+        if offsets:
+            span = {"start": s["start"], "end": s["end"]}
+        else:
+            span = {"raw_text": "\n".join(s["lines"]) + "\n"}
+        result = {
+            "id": f"scene-{i}",
+            "name": s["name"],
+            **span,
+            "characters": list(s["characters"]),
+            # Basic math metrics
+            "metrics": {
+                "actionRatio": (s["action_lines"] / max(1, s["action_lines"] + s["dialogue_lines"])) * 100,
+                "pacing": 50 # Default, to be filled by AI later
+            }
+        }
+        if with_dialogue:
+            result["dialogue"] = s["dialogue"]
+        results.append(result)
+
+    return results
@@ -0,0 +1,38 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The service modules are imported flat (e.g. `from cache import ResultCache`), as main.py does.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def service(tmp_path_factory):
+    """main.py with stub models; skipped where the model libraries are not installed."""
+    for module in ("torch", "transformers", "argostranslate"):
+        pytest.importorskip(module)
+    # Tiny queues so a modest script is far past the per-request budget
+    os.environ.update({
+        "INFERENCE_QUEUE_SIZE": "1",
+        "SCENE_BATCH_MAX_SIZE": "4",
+        "RESULT_CACHE_ENTRIES": "0",
+        "MODEL_WARMUP": "lazy",
+        "TRANSLATION_MEMORY_PATH": "",
+        "JOB_DB_PATH": str(tmp_path_factory.mktemp("jobs") / "jobs.sqlite"),
+    })
+    import main
+    from benchmarks.load import install_stubs
+
+    install_stubs(main, 1, 0)
+    return main
+
+
+@pytest.fixture(scope="session")
+def client(service):
+    # One app lifetime for the whole session: shutdown stops the executors for good
+    from fastapi.testclient import TestClient
+
+    with TestClient(service.app) as test_client:
+        yield test_client
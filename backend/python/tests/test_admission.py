@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from batching import MicroBatcher
+from executors import ExecutorSaturated
+
+
+def test_batcher_admits_request_larger_than_queue_budget():
+    async def run():
+        active = []
+        peak = []
+
+        async def handler(items):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.001)
+            active.pop()
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher("test", handler, max_batch_size=4, max_wait_ms=1, max_concurrency=2, max_queued_items=8)
+        results = await batcher.submit_many(list(range(50)))
+        return batcher, results, max(peak)
+
+    batcher, results, peak = asyncio.run(run())
+    assert results == [item * 2 for item in range(50)]
+    assert peak <= 2
+    assert batcher.rejected == 0
+
+
+def test_batcher_rejects_while_earlier_requests_fill_the_queue():
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(items):
+            await release.wait()
+            return items
+
+        batcher = MicroBatcher("test", handler, max_batch_size=4, max_wait_ms=1, max_concurrency=1, max_queued_items=8)
+        first = asyncio.ensure_future(batcher.submit_many(list(range(8))))
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturated):
+            await batcher.submit(99)
+        release.set()
+        assert await first == list(range(8))
+        # Capacity is back once the first request has finished
+        assert await batcher.submit(7) == 7
+
+    asyncio.run(run())
+
+
+def test_failed_request_keeps_its_queued_items_counted():
+    async def run():
+        release = asyncio.Event()
+
+        async def handler(items):
+            if 0 in items:
+                raise RuntimeError("model error")
+            await release.wait()
+            return items
+
+        batcher = MicroBatcher("test", handler, max_batch_size=2, max_wait_ms=1, max_concurrency=1, max_queued_items=4)
+        with pytest.raises(RuntimeError):
+            await batcher.submit_many(list(range(6)))
+        # Four items of the failed request are still queued or running
+        with pytest.raises(ExecutorSaturated):
+            await asyncio.wait_for(batcher.submit(99), 1)
+        release.set()
+        while batcher._unfinished:
+            await asyncio.sleep(0.001)
+        assert await batcher.submit(7) == 7
+
+    asyncio.run(run())
+
+
+def test_analyze_script_longer_than_queue_budget(service, client):
+    from benchmarks.screenplay_gen import generate_screenplay
+
+    text = generate_screenplay(scenes=40, cast_size=8, seed=3)
+    assert service.scene_batcher.max_queued_items < 40
+
+    response = client.post("/analyze_script", json={"text": text})
+
+    assert response.status_code == 200
+    assert len(response.json()["scenes"]) == 40
+    assert service.scene_batcher.rejected == 0
@@ -0,0 +1,41 @@
+from cache import ResultCache, make_cache_key
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResultCache(memory_entries=2)
+    cache.put("analyze_scene", "m", "one", {"v": 1})
+    cache.put("analyze_scene", "m", "two", {"v": 2})
+    assert cache.get("analyze_scene", "m", "one") == {"v": 1}  # "two" is now least recent
+    cache.put("analyze_scene", "m", "three", {"v": 3})
+
+    assert cache.get("analyze_scene", "m", "two") is None
+    assert cache.get("analyze_scene", "m", "one") == {"v": 1}
+    assert cache.get("analyze_scene", "m", "three") == {"v": 3}
+    assert cache.status()["memoryEntries"] == 2
+
+
+def test_keys_ignore_whitespace_but_not_model():
+    assert make_cache_key("e", "m", "A  line \r\nnext ") == make_cache_key("e", "m", "A line\nnext")
+    assert make_cache_key("e", "m", "text") != make_cache_key("e", "other", "text")
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    ResultCache(memory_entries=8, disk_path=path).put("analyze_emotion", "m", "text", {"emotion": "joy"})
+
+    restarted = ResultCache(memory_entries=8, disk_path=path)
+    assert restarted.get("analyze_emotion", "m", "text") == {"emotion": "joy"}
+    assert restarted.stats["analyze_emotion"]["diskHits"] == 1
+    # Promoted to memory on the first hit
+    assert restarted.get("analyze_emotion", "m", "text") == {"emotion": "joy"}
+    assert restarted.stats["analyze_emotion"]["memoryHits"] == 1
+
+
+def test_disk_tier_evicts_down_to_budget(tmp_path):
+    cache = ResultCache(memory_entries=0, disk_path=str(tmp_path / "results.sqlite"), disk_max_bytes=1000)
+    for i in range(20):
+        cache.put("analyze_scene", "m", f"scene {i}", {"synopsis": "x" * 90})
+
+    assert cache.status()["diskBytes"] <= 1000
+    assert cache.get("analyze_scene", "m", "scene 19") is not None
+    assert cache.get("analyze_scene", "m", "scene 0") is None
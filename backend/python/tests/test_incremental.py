@@ -0,0 +1,40 @@
+from incremental import ScriptSceneStore
+
+
+def test_store_reuses_unchanged_scenes_and_counts_removed():
+    store = ScriptSceneStore(max_scripts=2)
+    assert store.diff("s", ["a", "b"]) == ([0, 1], {}, 0)
+    store.update("s", ["a", "b"], {"a": 1, "b": 2})
+
+    changed, previous, removed = store.diff("s", ["a", "c"])
+    assert (changed, removed) == ([1], 1)
+    assert previous["a"] == 1
+
+
+def test_scenes_without_results_are_analyzed_again():
+    store = ScriptSceneStore(max_scripts=2)
+    store.update("s", ["a", "b"], {"a": 1})
+    assert store.diff("s", ["a", "b"])[0] == [1]
+
+
+def test_failed_batch_is_retried_on_the_next_version(service, client, monkeypatch):
+    from benchmarks.screenplay_gen import generate_screenplay
+
+    text = generate_screenplay(scenes=3, cast_size=4, seed=5)
+
+    def summarizer_down(texts):
+        raise RuntimeError("summarizer crashed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(service, "summarize_texts", summarizer_down)
+        failed = client.post("/analyze_incremental", json={"scriptId": "retry-test", "text": text}).json()
+    assert all(scene["failed"] == ["summary"] for scene in failed["scenes"])
+
+    retried = client.post("/analyze_incremental", json={"scriptId": "retry-test", "text": text}).json()
+    assert retried["reused"] == 0
+    assert len(retried["changed"]) == 3
+    assert all("failed" not in scene for scene in retried["scenes"])
+    assert all(scene["synopsis"] != "Analysis failed." for scene in retried["scenes"])
+
+    unchanged = client.post("/analyze_incremental", json={"scriptId": "retry-test", "text": text}).json()
+    assert unchanged["reused"] == 3
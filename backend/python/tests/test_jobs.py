@@ -0,0 +1,144 @@
+import asyncio
+import sqlite3
+import time
+
+from executors import ExecutorSaturated
+from jobs import CANCELLED, DONE, FAILED, QUEUED, RUNNING, JobQueue, JobStore
+
+
+def test_recover_requeues_interrupted_jobs_until_max_attempts(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    store = JobStore(path)
+    fresh = store.create("analyze_script", {"text": "a"})["jobId"]
+    worn = store.create("analyze_script", {"text": "b"})["jobId"]
+    store.claim_next()
+    store.claim_next()
+    store._update(worn, attempts=3)
+
+    restarted = JobStore(path)
+    assert restarted.recover_interrupted(max_attempts=3, ttl_s=60) == (1, 1)
+    assert restarted.get(fresh)["status"] == QUEUED
+    assert restarted.get(fresh)["attempts"] == 1
+    assert restarted.get(worn)["status"] == FAILED
+    assert restarted.get(worn)["expiresAt"] is not None
+
+
+def test_requeue_does_not_use_an_attempt_but_is_capped():
+    store = JobStore("")
+    job_id = store.create("analyze_scenes", {"scenes": []})["jobId"]
+    for retry in range(2):
+        assert store.claim_next()[0] == job_id
+        assert store.requeue(job_id, max_retries=2, ttl_s=60)
+        job = store.get(job_id)
+        assert (job["status"], job["attempts"], job["retries"]) == (QUEUED, 0, retry + 1)
+
+    store.claim_next()
+    assert not store.requeue(job_id, max_retries=2, ttl_s=60)
+    job = store.get(job_id)
+    assert job["status"] == FAILED
+    assert "2 retries" in job["error"]
+    assert store.claim_next() is None
+
+
+def test_purge_removes_only_expired_jobs():
+    store = JobStore("")
+    expired = store.create("analyze_script", {})["jobId"]
+    kept = store.create("analyze_script", {})["jobId"]
+    queued = store.create("analyze_script", {})["jobId"]
+    store.finish(expired, DONE, ttl_s=-1, result={"ok": True})
+    store.finish(kept, DONE, ttl_s=60, result={"ok": True})
+
+    assert store.purge_expired() == 1
+    assert store.get(expired) is None
+    assert store.get(kept)["result"] == {"ok": True}
+    assert store.get(queued)["status"] == QUEUED
+
+
+def test_existing_databases_gain_the_retries_column(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, "
+        "progress TEXT, result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+        "created REAL NOT NULL, started REAL, finished REAL, expires REAL)"
+    )
+    db.execute(
+        "INSERT INTO jobs (id, kind, payload, status, created) VALUES ('old', 'analyze_script', '{}', ?, ?)",
+        (RUNNING, time.time()),
+    )
+    db.commit()
+    db.close()
+
+    store = JobStore(path)
+    assert store.get("old")["retries"] == 0
+    assert store.requeue("old", max_retries=1, ttl_s=60)
+
+
+def test_queue_fails_a_job_that_stays_saturated():
+    calls = []
+
+    async def saturated(job_id, payload, report_progress):
+        calls.append(job_id)
+        raise ExecutorSaturated("emotion", retry_after_s=0)
+
+    async def run():
+        queue = JobQueue(
+            JobStore(""),
+            {"analyze_script": saturated},
+            workers=1,
+            result_ttl_s=60,
+            max_queued=10,
+            max_retries=3,
+            retryable=(ExecutorSaturated,),
+        )
+        queue.start()
+        job_id = queue.submit("analyze_script", {})["jobId"]
+        try:
+            for _ in range(200):
+                if queue.store.get(job_id)["status"] == FAILED:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.stop()
+        return queue.store.get(job_id)
+
+    job = asyncio.run(run())
+    assert job["status"] == FAILED
+    assert job["retries"] == 3
+    assert len(calls) == 4
+
+
+def test_cancel_during_retry_backoff_cancels_the_queued_job():
+    calls = []
+
+    async def saturated_once(job_id, payload, report_progress):
+        calls.append(job_id)
+        raise ExecutorSaturated("emotion", retry_after_s=0.2)
+
+    async def run():
+        queue = JobQueue(
+            JobStore(""),
+            {"analyze_script": saturated_once},
+            workers=1,
+            result_ttl_s=60,
+            max_queued=10,
+            retryable=(ExecutorSaturated,),
+        )
+        queue.start()
+        job_id = queue.submit("analyze_script", {})["jobId"]
+        try:
+            for _ in range(100):
+                if calls and queue.store.get(job_id)["status"] == QUEUED:
+                    break
+                await asyncio.sleep(0.01)
+            # The worker is now waiting out retry_after_s
+            cancelled = queue.cancel(job_id)
+            await asyncio.sleep(0.4)
+        finally:
+            await queue.stop()
+        return cancelled, queue.store.get(job_id)
+
+    cancelled, job = asyncio.run(run())
+    assert cancelled["status"] == CANCELLED
+    assert job["status"] == CANCELLED
+    assert len(calls) == 1
@@ -0,0 +1,102 @@
+import random
+
+import networkx as nx
+import pytest
+
+from network import NetworkStore, build_network
+
+
+def networkx_graph(interactions):
+    graph = nx.Graph()
+    for char_list in interactions:
+        graph.add_nodes_from(char_list)
+        names = sorted(set(char_list))
+        for a in range(len(names)):
+            for b in range(a + 1, len(names)):
+                graph.add_edge(names[a], names[b])
+    return graph
+
+
+def assert_matches_networkx(network, interactions):
+    graph = networkx_graph(interactions)
+    expected_degree = nx.degree_centrality(graph)
+    expected_betweenness = nx.betweenness_centrality(graph)
+    degree = network.degree_centrality()
+    betweenness = network.betweenness_centrality()
+    assert set(degree) == set(expected_degree)
+    for name in expected_degree:
+        assert degree[name] == pytest.approx(expected_degree[name])
+        assert betweenness[name] == pytest.approx(expected_betweenness[name], abs=1e-9)
+
+
+def random_interactions(rng, names, scenes):
+    return [rng.sample(names, rng.randint(1, 5)) for _ in range(scenes)]
+
+
+def test_build_network_matches_networkx():
+    rng = random.Random(1)
+    interactions = random_interactions(rng, [f"C{i}" for i in range(40)], 60)
+    assert_matches_networkx(build_network(interactions), interactions)
+
+
+def test_sync_applies_only_changed_scenes_and_matches_networkx():
+    rng = random.Random(2)
+    names = [f"C{i}" for i in range(30)]
+    interactions = random_interactions(rng, names, 50)
+    store = NetworkStore(max_scripts=4)
+    network, added, removed = store.sync("script", interactions)
+    assert (added, removed) == (50, 0)
+
+    for step in range(10):
+        interactions[step] = rng.sample(names, rng.randint(1, 5))
+        if step % 3 == 0:
+            interactions.pop()
+        network, added, removed = store.sync("script", interactions)
+        assert added <= 1 and removed <= 2
+        assert_matches_networkx(network, interactions)
+
+
+def test_sync_drops_characters_that_leave_the_script():
+    store = NetworkStore(max_scripts=4)
+    store.sync("script", [["ANA", "BEN"], ["BEN", "CARA"]])
+    network, added, removed = store.sync("script", [["ANA", "BEN"]])
+    assert (added, removed) == (0, 1)
+    assert set(network.degree_centrality()) == {"ANA", "BEN"}
+
+
+def test_store_evicts_least_recently_used_script():
+    store = NetworkStore(max_scripts=1)
+    first, _, _ = store.sync("a", [["ANA", "BEN"]])
+    store.sync("b", [["CARA", "DEV"]])
+    again, added, _ = store.sync("a", [["ANA", "BEN"]])
+    assert again is not first and added == 1
+
+
+def test_pivot_estimate_with_every_node_as_pivot_is_exact():
+    rng = random.Random(3)
+    interactions = random_interactions(rng, [f"C{i}" for i in range(25)], 40)
+    network = build_network(interactions)
+    assert network.betweenness_centrality(k=network.node_count) == network.betweenness_centrality()
+
+
+def test_network_endpoint_computes_off_the_event_loop(service, client, monkeypatch):
+    import asyncio
+
+    threads = []
+    network_metrics = service.network_metrics
+
+    def recording(*args):
+        try:
+            asyncio.get_running_loop()
+            threads.append("event loop")
+        except RuntimeError:
+            threads.append("worker")
+        return network_metrics(*args)
+
+    monkeypatch.setattr(service, "network_metrics", recording)
+    interactions = [["ANNA", "BEN"], ["BEN", "CARA"]]
+    response = client.post("/analyze_network", json={"scriptId": "threads", "interactions": interactions})
+
+    assert response.status_code == 200
+    assert response.json()["BEN"]["betweenness"] == pytest.approx(1.0)
+    assert threads == ["worker"]
@@ -0,0 +1,37 @@
+from translation_chunks import approximate_token_count, chunk_text_for_translation
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def test_short_and_blank_lines():
+    assert chunk_text_for_translation("  नमस्ते दोस्त।  ") == ["नमस्ते दोस्त।"]
+    assert chunk_text_for_translation("   ") == []
+
+
+def test_sentences_are_packed_up_to_the_budget():
+    text = "One two three. Four five six! Seven eight nine? Ten eleven."
+    chunks = chunk_text_for_translation(text, max_tokens=6, count_tokens=word_count)
+    assert chunks == ["One two three. Four five six!", "Seven eight nine? Ten eleven."]
+
+
+def test_danda_ends_a_sentence():
+    text = "राम घर गया। सीता बाज़ार गई। वे शाम को मिले।"
+    chunks = chunk_text_for_translation(text, max_tokens=4, count_tokens=word_count)
+    assert chunks == ["राम घर गया।", "सीता बाज़ार गई।", "वे शाम को मिले।"]
+
+
+def test_oversized_sentence_is_split_on_words():
+    sentence = " ".join(f"w{i}" for i in range(25)) + "."
+    chunks = chunk_text_for_translation("Short one. " + sentence, max_tokens=10, count_tokens=word_count)
+    assert all(word_count(chunk) <= 10 for chunk in chunks)
+    assert " ".join(chunks) == "Short one. " + sentence
+
+
+def test_default_budget_uses_the_character_estimate():
+    text = " ".join(["This sentence is about sixty characters long, give or take."] * 40)
+    chunks = chunk_text_for_translation(text)
+    assert len(chunks) > 1
+    assert all(approximate_token_count(chunk) <= 200 for chunk in chunks)
+    assert " ".join(chunks) == text
@@ -0,0 +1,34 @@
+import sqlite3
+
+from translation_memory import TranslationMemory
+
+
+def test_segments_are_kept_apart_per_backend_and_model():
+    memory = TranslationMemory("")
+    memory.store("hi", "en", "argos", "argos-hi-en-1.1", {"namaste": "hello"})
+
+    assert memory.lookup("hi", "en", "argos", "argos-hi-en-1.1", ["namaste"]) == {"namaste": "hello"}
+    assert memory.lookup("hi", "en", "hf", "Helsinki-NLP/opus-mt-hi-en", ["namaste"]) == {}
+    assert memory.lookup("hi", "en", "argos", "argos-hi-en-1.2", ["namaste"]) == {}
+
+    memory.store("hi", "en", "hf", "Helsinki-NLP/opus-mt-hi-en", {"namaste": "greetings"})
+    assert memory.lookup("hi", "en", "hf", "Helsinki-NLP/opus-mt-hi-en", ["namaste"]) == {"namaste": "greetings"}
+    assert memory.entries() == 2
+
+
+def test_memories_without_model_keys_are_dropped(tmp_path):
+    path = str(tmp_path / "memory.sqlite")
+    db = sqlite3.connect(path)
+    db.execute(
+        "CREATE TABLE segments (source TEXT NOT NULL, target TEXT NOT NULL, segment TEXT NOT NULL, "
+        "translation TEXT NOT NULL, backend TEXT NOT NULL, updated REAL NOT NULL, "
+        "PRIMARY KEY (source, target, segment))"
+    )
+    db.execute("INSERT INTO segments VALUES ('hi', 'en', 'namaste', 'hello', 'argos', 0)")
+    db.commit()
+    db.close()
+
+    memory = TranslationMemory(path)
+    assert memory.entries() == 0
+    memory.store("hi", "en", "argos", "argos-hi-en", {"namaste": "hello"})
+    assert memory.lookup("hi", "en", "argos", "argos-hi-en", ["namaste"]) == {"namaste": "hello"}
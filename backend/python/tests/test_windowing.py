@@ -0,0 +1,67 @@
+import re
+
+import pytest
+
+from windowing import CHARS_PER_TOKEN, aggregate_label_scores, split_windows, weighted_mean
+
+
+class WhitespaceTokenizer:
+    """Fast-tokenizer stand-in: one token per word, with character offsets."""
+
+    is_fast = True
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False):
+        return {"offset_mapping": [match.span() for match in re.finditer(r"\S+", text)]}
+
+
+def words(count):
+    return " ".join(f"w{i}" for i in range(count))
+
+
+def test_short_text_is_one_window():
+    text = words(20)
+    assert split_windows(text, WhitespaceTokenizer(), 50, 8) == [(text, 20)]
+    assert split_windows("short", None, 50, 8) == [("short", 2)]
+
+
+def test_token_windows_cover_every_token_with_overlap():
+    text = words(1000)
+    windows = split_windows(text, WhitespaceTokenizer(), 100, 10)
+
+    assert len(windows) == 11
+    assert all(window.tokens <= 100 for window in windows)
+    assert windows[0].text.split()[0] == "w0"
+    assert windows[-1].text.split()[-1] == "w999"
+    covered = {word for window in windows for word in window.text.split()}
+    assert covered == set(text.split())
+    # Consecutive windows share exactly the overlap
+    for previous, current in zip(windows, windows[1:]):
+        assert previous.text.split()[-10:] == current.text.split()[:10]
+
+
+def test_windows_without_offsets_cover_the_text_by_characters():
+    text = "x" * 10_000
+    windows = split_windows(text, None, 100, 10)
+
+    size, step = 100 * CHARS_PER_TOKEN, 90 * CHARS_PER_TOKEN
+    assert len(windows) > 8
+    assert all(len(window.text) <= size for window in windows)
+    assert sum(len(window.text) for window in windows) - (len(windows) - 1) * (size - step) == len(text)
+
+
+def test_overlap_is_capped_at_half_a_window():
+    windows = split_windows(words(100), WhitespaceTokenizer(), 10, 50)
+    assert [window.tokens for window in windows[:2]] == [10, 10]
+    assert windows[1].text.split()[0] == "w5"
+
+
+def test_weighted_mean_and_label_aggregation():
+    assert weighted_mean([1.0, -1.0], [3, 1]) == 0.5
+    assert weighted_mean([1.0, 0.0], [0, 0]) == 0.5
+
+    per_window = [
+        [{"label": "joy", "score": 0.9}, {"label": "anger", "score": 0.1}],
+        [{"label": "anger", "score": 0.7}, {"label": "joy", "score": 0.3}],
+    ]
+    aggregated = {item["label"]: item["score"] for item in aggregate_label_scores(per_window, [1, 3])}
+    assert aggregated == pytest.approx({"joy": 0.45, "anger": 0.55})
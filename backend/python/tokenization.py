@@ -0,0 +1,82 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import torch
+
+logger = logging.getLogger("py-ai-service")
+
+# Classifier inputs are capped at 512 tokens, the limit of the BERT-family models we use.
+MAX_CLASSIFIER_TOKENS = 512
+
+
+def tokenizer_fingerprint(tokenizer: Any) -> str:
+    """Two tokenizers with the same fingerprint produce identical input ids."""
+    digest = hashlib.sha256(type(tokenizer).__name__.encode("utf-8"))
+    for token, index in sorted(tokenizer.get_vocab().items(), key=lambda item: item[1]):
+        digest.update(f"{index}:{token}\x00".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SharedEncodings:
+    """
+    Per-text token ids shared by every classifier that uses the same
+    tokenizer, so a scene scored for sentiment and then for emotion is only
+    tokenized once. Bounded LRU; batches are padded on demand.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._ids: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, tokenizer: Any, texts: List[str]) -> Dict[str, torch.Tensor]:
+        with self._lock:
+            known = {text: self._ids[text] for text in texts if text in self._ids}
+            for text in known:
+                self._ids.move_to_end(text)
+            missing = [text for text in dict.fromkeys(texts) if text not in known]
+            self.hits += len(known)
+            self.misses += len(missing)
+
+        if missing:
+            max_length = min(MAX_CLASSIFIER_TOKENS, getattr(tokenizer, "model_max_length", MAX_CLASSIFIER_TOKENS))
+            encoded = tokenizer(missing, truncation=True, max_length=max_length)["input_ids"]
+            with self._lock:
+                for text, ids in zip(missing, encoded):
+                    known[text] = ids
+                    self._ids[text] = ids
+                while len(self._ids) > self.max_entries:
+                    self._ids.popitem(last=False)
+
+        return tokenizer.pad({"input_ids": [known[text] for text in texts]}, return_tensors="pt")
+
+
+def classify_encoded(pipe: Any, encodings: Dict[str, torch.Tensor], return_all_scores: bool) -> List[Any]:
+    """
+    Runs a text-classification pipeline's model on pre-tokenized inputs and
+    returns the same structure the pipeline would: the top label per text,
+    or every label's score when `return_all_scores` is set.
+    """
+    model = pipe.model
+    config = model.config
+    device = getattr(model, "device", None)
+    if device is not None:
+        encodings = {key: value.to(device) for key, value in encodings.items()}
+
+    with torch.no_grad():
+        logits = model(**encodings).logits
+    if config.problem_type == "multi_label_classification" or config.num_labels == 1:
+        scores = torch.sigmoid(logits)
+    else:
+        scores = torch.softmax(logits, dim=-1)
+
+    results = []
+    for row in scores.float().cpu().tolist():
+        labelled = [{"label": config.id2label[i], "score": score} for i, score in enumerate(row)]
+        results.append(labelled if return_all_scores else max(labelled, key=lambda item: item["score"]))
+    return results
@@ -0,0 +1,69 @@
+import re
+from typing import Callable, List, Optional
+
+# Opus-MT models accept 512 tokens; leave room for special tokens and growth.
+DEFAULT_MAX_TOKENS = 200
+
+# Sentence ends in Latin script plus the Devanagari danda used in Hindi and Kannada text
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?\u0964\u0965])\s+")
+
+
+def approximate_token_count(text: str) -> int:
+    return len(text) // 3 + 1
+
+
+def split_oversized_sentence(sentence: str, max_tokens: int, count_tokens: Callable[[str], int]) -> List[str]:
+    pieces = []
+    current: List[str] = []
+    current_tokens = 0
+    for word in sentence.split():
+        word_tokens = count_tokens(word)
+        if current and current_tokens + word_tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(word)
+        current_tokens += word_tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text_for_translation(
+    text: str,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    count_tokens: Optional[Callable[[str], int]] = None,
+) -> List[str]:
+    """
+    Splits one line of text into chunks of whole sentences that each fit the
+    token budget. A sentence longer than the budget is split on word
+    boundaries. `count_tokens` defaults to a character-based estimate; pass
+    the translator's tokenizer for exact budgets.
+    """
+    count_tokens = count_tokens or approximate_token_count
+    text = text.strip()
+    if not text:
+        return []
+    if count_tokens(text) <= max_tokens:
+        return [text]
+
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in SENTENCE_BOUNDARY_RE.split(text):
+        sentence_tokens = count_tokens(sentence)
+        if sentence_tokens > max_tokens:
+            pieces = split_oversized_sentence(sentence, max_tokens, count_tokens)
+        else:
+            pieces = [sentence]
+
+        for piece in pieces:
+            piece_tokens = sentence_tokens if len(pieces) == 1 else count_tokens(piece)
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -0,0 +1,87 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable
+
+logger = logging.getLogger("py-ai-service")
+
+# SQLite's default limit on bound parameters is 999; stay well under it.
+_LOOKUP_BATCH = 500
+
+
+class TranslationMemory:
+    """
+    Persistent (source, target, backend, model, normalized segment) ->
+    translation store. Segments are looked up in bulk so only unseen ones go
+    to a translator, and a segment translated by one backend or model is
+    never served for another. An empty path keeps the memory in-process only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path or ":memory:"
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(segments)")}
+        if columns and "model" not in columns:
+            # Memories from before entries were keyed by model cannot say which model produced them
+            logger.warning("Translation memory predates model keys; dropping its entries path=%s", self.path)
+            self._db.execute("DROP TABLE segments")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            "source TEXT NOT NULL, target TEXT NOT NULL, backend TEXT NOT NULL, model TEXT NOT NULL, "
+            "segment TEXT NOT NULL, translation TEXT NOT NULL, updated REAL NOT NULL, "
+            "PRIMARY KEY (source, target, backend, model, segment))"
+        )
+        self._db.commit()
+        self.hits = 0
+        self.misses = 0
+        logger.info("Translation memory ready path=%s entries=%s", self.path, self.entries())
+
+    def lookup(self, source: str, target: str, backend: str, model: str, segments: Iterable[str]) -> Dict[str, str]:
+        segments = list(segments)
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(segments), _LOOKUP_BATCH):
+                batch = segments[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._db.execute(
+                    f"SELECT segment, translation FROM segments "
+                    f"WHERE source = ? AND target = ? AND backend = ? AND model = ? AND segment IN ({placeholders})",
+                    (source, target, backend, model, *batch),
+                ).fetchall()
+                found.update(rows)
+            self.hits += len(found)
+            self.misses += len(segments) - len(found)
+        return found
+
+    def store(self, source: str, target: str, backend: str, model: str, translations: Dict[str, str]) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO segments (source, target, backend, model, segment, translation, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (source, target, backend, model, segment, translation, now)
+                    for segment, translation in translations.items()
+                ],
+            )
+            self._db.commit()
+
+    def entries(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+
+    def status(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": self.entries(),
+            "segmentHits": self.hits,
+            "segmentMisses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else None,
+        }
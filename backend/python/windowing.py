@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from translation_chunks import approximate_token_count
+
+# Used when a model has no fast tokenizer to report offsets; matches approximate_token_count.
+CHARS_PER_TOKEN = 3
+
+
+class Window(NamedTuple):
+    text: str
+    tokens: int
+
+
+def _window_starts(total: int, size: int, overlap: int) -> List[int]:
+    # Each window starts `size - overlap` after the previous one; the last one reaches the end.
+    return list(range(0, max(1, total - overlap), max(1, size - overlap)))
+
+
+def split_windows(text: str, tokenizer: Optional[Any], window_tokens: int, overlap_tokens: int) -> List[Window]:
+    """
+    Splits text into overlapping windows of at most `window_tokens` model
+    tokens (special tokens excluded), using the tokenizer's character
+    offsets so windows are cut on token boundaries. Together the windows
+    cover the whole text.
+    """
+    overlap_tokens = min(overlap_tokens, window_tokens // 2)
+    offsets = None
+    if tokenizer is not None and getattr(tokenizer, "is_fast", False):
+        offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+
+    if offsets is None:
+        total = approximate_token_count(text)
+        if total <= window_tokens:
+            return [Window(text, total)]
+        size, overlap = window_tokens * CHARS_PER_TOKEN, overlap_tokens * CHARS_PER_TOKEN
+        starts = _window_starts(len(text), size, overlap)
+        return [Window(text[s:s + size], approximate_token_count(text[s:s + size])) for s in starts]
+
+    total = len(offsets)
+    if total <= window_tokens:
+        return [Window(text, total)]
+    windows = []
+    for start in _window_starts(total, window_tokens, overlap_tokens):
+        end = min(start + window_tokens, total)
+        windows.append(Window(text[offsets[start][0]:offsets[end - 1][1]], end - start))
+    return windows
+
+
+def weighted_mean(values: List[float], weights: List[int]) -> float:
+    total = sum(weights)
+    if not total:
+        return sum(values) / max(1, len(values))
+    return sum(value * weight for value, weight in zip(values, weights)) / total
+
+
+def aggregate_label_scores(per_window: List[List[Dict[str, Any]]], weights: List[int]) -> List[Dict[str, Any]]:
+    """Token-weighted mean of each label's score across a text's windows."""
+    labels = [item["label"] for item in per_window[0]]
+    scores = [{item["label"]: item["score"] for item in window} for window in per_window]
+    return [
+        {"label": label, "score": weighted_mean([window.get(label, 0.0) for window in scores], weights)}
+        for label in labels
+    ]
@@ -158,6 +158,18 @@ export const analyzeSceneAI = async (id, text, sourceLanguage = "en") =>
 		sourceLanguage,
 	});
 
+export const analyzeScenesAI = async (scenes) =>
+	callAIService("analyze-scenes", "/analyze_scenes", { scenes });
+
+export const analyzeScriptIncrementalAI = async (scriptId, text) =>
+	callAIService("analyze-incremental", "/analyze_incremental", {
+		scriptId,
+		text,
+	});
+
+export const analyzeScriptAI = async (text, scriptId = null) =>
+	callAIService("analyze-script", "/analyze_script", { text, scriptId });
+
 export const analyzeNetworkAI = async (interactions) =>
 	callAIService("analyze-network", "/analyze_network", { interactions });
 
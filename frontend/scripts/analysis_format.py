@@ -0,0 +1,230 @@
+import json
+import struct
+import zlib
+
+# Compact, columnar storage for analyze.py results.
+#
+# Layout: MAGIC, a little-endian uint32 header length, the JSON header, then
+# zlib-compressed JSON sections. The header holds the interned tables (scene
+# labels, emotion labels), the scene list and an index of section offsets, so
+# a reader can decompress one character's section and only the sentence
+# blocks it references instead of the whole file.
+MAGIC = b"TOCCOL1\n"
+FORMAT = "toc-analysis-columnar-v1"
+SENTENCE_BLOCK_SIZE = 256
+
+
+class _Interner:
+    def __init__(self):
+        self.values = []
+        self._index = {}
+
+    def __call__(self, value):
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def _pack(obj):
+    return zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _unpack(data):
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+def _character_columns(data, labels, emotions, sentences):
+    appearances = data["appearances"]
+    columns = {
+        "appearances": {
+            "scene": [labels(a["scene"]) for a in appearances],
+            "position": [a["position"] for a in appearances],
+            "emotion": [emotions(a["emotion"]) for a in appearances],
+            "sentiment": [a["sentiment"] for a in appearances],
+            "sentence": [sentences(a["text"]) for a in appearances],
+        },
+        "emotionTimeline": {
+            "position": [e["position"] for e in data["emotionTimeline"]],
+            "emotion": [emotions(e["emotion"]) for e in data["emotionTimeline"]],
+            "scene": [labels(e["scene"]) for e in data["emotionTimeline"]],
+        },
+        "dialog": {"scene": [], "line": [], "emotion": [], "score": []},
+        "dialogStats": {"scene": [], "lineCount": [], "avgEmotionScore": []},
+    }
+    # Always empty today; only stored when something fills it in
+    if any(a["linkedCharacters"] for a in appearances):
+        columns["appearances"]["linkedCharacters"] = [a["linkedCharacters"] for a in appearances]
+    dialog = columns["dialog"]
+    for heading, lines in data.get("dialog", {}).items():
+        for entry in lines:
+            dialog["scene"].append(labels(heading))
+            dialog["line"].append(entry["line"])
+            dialog["emotion"].append(emotions(entry["emotion"]))
+            dialog["score"].append(entry["score"])
+    stats = columns["dialogStats"]
+    for heading, entry in data.get("dialog_stats", {}).items():
+        stats["scene"].append(labels(heading))
+        stats["lineCount"].append(entry["line_count"])
+        stats["avgEmotionScore"].append(entry["avg_emotion_score"])
+    return columns
+
+
+def write_compact_analysis(result, path):
+    """Writes an analyze_script_scenes result in the columnar format."""
+    labels = _Interner()
+    emotions = _Interner()
+    sentences = _Interner()
+
+    scene_columns = {
+        "label": [labels(scene["label"]) for scene in result["scenes"]],
+        "t": [scene["t"] for scene in result["scenes"]],
+    }
+    if any("page" in scene for scene in result["scenes"]):
+        scene_columns["page"] = [scene.get("page") for scene in result["scenes"]]
+
+    sections = []
+    offset = 0
+
+    def add_section(obj):
+        nonlocal offset
+        data = _pack(obj)
+        sections.append(data)
+        entry = [offset, len(data)]
+        offset += len(data)
+        return entry
+
+    characters = {}
+    for name, data in result["characters"].items():
+        entry = add_section(_character_columns(data, labels, emotions, sentences))
+        characters[name] = {
+            "color": data["color"],
+            "appearances": len(data["appearances"]),
+            "section": entry,
+        }
+    sentence_blocks = [
+        add_section(sentences.values[i:i + SENTENCE_BLOCK_SIZE])
+        for i in range(0, len(sentences.values), SENTENCE_BLOCK_SIZE)
+    ]
+
+    header = json.dumps({
+        "format": FORMAT,
+        "labels": labels.values,
+        "emotions": emotions.values,
+        "scenes": scene_columns,
+        "sentenceBlockSize": SENTENCE_BLOCK_SIZE,
+        "sentenceBlocks": sentence_blocks,
+        "characters": characters,
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        for data in sections:
+            f.write(data)
+
+
+class CompactAnalysisReader:
+    """
+    Random access to a file written by write_compact_analysis. Only the
+    header is read up front; character sections and sentence blocks are
+    read and decompressed on demand.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} is not a {FORMAT} file")
+        (header_length,) = struct.unpack('<I', self._file.read(4))
+        self.header = json.loads(self._file.read(header_length).decode('utf-8'))
+        self._data_start = len(MAGIC) + 4 + header_length
+        self._sentence_blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def character_names(self):
+        return list(self.header["characters"])
+
+    def _section(self, entry):
+        offset, length = entry
+        self._file.seek(self._data_start + offset)
+        return _unpack(self._file.read(length))
+
+    def _sentence(self, index):
+        block_size = self.header["sentenceBlockSize"]
+        block = self._sentence_blocks.get(index // block_size)
+        if block is None:
+            block = self._section(self.header["sentenceBlocks"][index // block_size])
+            self._sentence_blocks[index // block_size] = block
+        return block[index % block_size]
+
+    def scenes(self):
+        columns = self.header["scenes"]
+        labels = self.header["labels"]
+        scenes = []
+        for i, (label, t) in enumerate(zip(columns["label"], columns["t"])):
+            scene = {"label": labels[label], "t": t}
+            if "page" in columns and columns["page"][i] is not None:
+                scene["page"] = columns["page"][i]
+            scenes.append(scene)
+        return scenes
+
+    def character(self, name):
+        """One character's data, in the same shape as script-analysis.json."""
+        entry = self.header["characters"][name]
+        columns = self._section(entry["section"])
+        labels = self.header["labels"]
+        emotions = self.header["emotions"]
+
+        appearances = columns["appearances"]
+        linked = appearances.get("linkedCharacters")
+        dialog = {}
+        for scene, line, emotion, score in zip(*(columns["dialog"][key] for key in ("scene", "line", "emotion", "score"))):
+            dialog.setdefault(labels[scene], []).append({"line": line, "emotion": emotions[emotion], "score": score})
+        stats = columns["dialogStats"]
+        return {
+            "color": entry["color"],
+            "appearances": [
+                {
+                    "scene": labels[scene],
+                    "position": position,
+                    "emotion": emotions[emotion],
+                    "sentiment": sentiment,
+                    "linkedCharacters": linked[i] if linked else [],
+                    "text": self._sentence(sentence),
+                }
+                for i, (scene, position, emotion, sentiment, sentence) in enumerate(zip(
+                    appearances["scene"], appearances["position"], appearances["emotion"],
+                    appearances["sentiment"], appearances["sentence"],
+                ))
+            ],
+            "emotionTimeline": [
+                {"position": position, "emotion": emotions[emotion], "scene": labels[scene]}
+                for position, emotion, scene in zip(*(columns["emotionTimeline"][key] for key in ("position", "emotion", "scene")))
+            ],
+            "dialog": dialog,
+            "dialog_stats": {
+                labels[scene]: {"line_count": count, "avg_emotion_score": score}
+                for scene, count, score in zip(stats["scene"], stats["lineCount"], stats["avgEmotionScore"])
+            },
+        }
+
+
+def load_compact_analysis(path):
+    """Reads a whole columnar file back into the script-analysis.json structure."""
+    with CompactAnalysisReader(path) as reader:
+        return {
+            "characters": {name: reader.character(name) for name in reader.character_names},
+            "scenes": reader.scenes(),
+        }
@@ -1,21 +1,73 @@
 import argparse
+import bisect
+import hashlib
+import multiprocessing
 import os
 import json
 import re
 from collections import defaultdict
-from transformers import pipeline
-import torch
-import nltk
-nltk.download('punkt')
-from nltk.tokenize import sent_tokenize
+# torch and transformers are imported where the models are loaded, so --help,
+# PDF extraction workers and argument errors don't pay for them
+
+DEFAULT_NER_MODEL = "dbmdz/bert-large-cased-finetuned-conll03-english"
+DEFAULT_PDF_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'tunnel-of-consciousness', 'pdf-text',
+)
+# Below this many pages starting extraction processes costs more than it saves
+PDF_PARALLEL_MIN_PAGES = 24
 
 def get_device(device_str=None):
     if device_str:
         return device_str
+    import torch
     return 'cuda' if torch.cuda.is_available() else 'cpu'
 
+# A period after one of these (case-insensitive) does not end a sentence
+SENTENCE_ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'st', 'jr', 'sr', 'prof', 'vs', 'etc', 'e.g', 'i.e', 'approx',
+    # screenplay headings and extensions
+    'int', 'ext', 'est', 'int/ext', 'i/e', 'int-ext', 'ext-int', 'v.o', 'o.s', 'o.c', 'cont', "cont'd",
+}
+SENTENCE_END_RE = re.compile(r'(\S*?)([.!?\u2026]+)(["\'\u201d\u2019)\]]*)\s+')
+PARAGRAPH_BREAK_RE = re.compile(r'\n[ \t]*\n')
+INITIALS_RE = re.compile(r'(?:[A-Za-z]\.)*[A-Za-z]')
+
+def split_sentences(text):
+    """
+    Offline sentence segmentation for screenplay text. Blank lines always
+    end a sentence; otherwise a sentence ends at . ! ? or an ellipsis
+    followed by whitespace, unless the period closes an abbreviation,
+    heading prefix (INT.), extension (V.O.) or initial, or the next word
+    starts in lowercase.
+    """
+    sentences = []
+    for paragraph in PARAGRAPH_BREAK_RE.split(text):
+        start = 0
+        for m in SENTENCE_END_RE.finditer(paragraph):
+            if m.end() < len(paragraph) and paragraph[m.end()].islower():
+                continue
+            if m.group(2) == '.':
+                token = m.group(1).lstrip('(["\'\u201c\u2018').lower()
+                if token in SENTENCE_ABBREVIATIONS or INITIALS_RE.fullmatch(token):
+                    continue
+            sentence = paragraph[start:m.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = m.end()
+        sentence = paragraph[start:].strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
 def strip_front_matter(text):
-    lines = text.splitlines()
+    """
+    Drops title-page lines before the first scene heading or all-caps line.
+    Returns (text from that line on, with '\n' line breaks; the line's
+    character offset in the original text).
+    """
+    raw_lines = text.splitlines(keepends=True)
+    lines = [line.splitlines()[0] for line in raw_lines]
     # Known front matter patterns
     ignore_patterns = [
         r'^\s*$',  # blank
@@ -32,16 +84,94 @@ def strip_front_matter(text):
         if all_caps_regex.match(line) and not any(re.match(p, line) for p in ignore_patterns):
             start_idx = i
             break
-    return '\n'.join(lines[start_idx:]) if start_idx < len(lines) else text
+    if start_idx >= len(lines):
+        return text, 0
+    return '\n'.join(lines[start_idx:]), sum(len(line) for line in raw_lines[:start_idx])
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+def _extract_pdf_page_range(args):
+    pdf_path, start, end = args
     import PyPDF2
-    text = ""
     with open(pdf_path, 'rb') as f:
         reader = PyPDF2.PdfReader(f)
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-    return text
+        return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def extract_pdf_pages(pdf_path, workers=None, cache_dir=DEFAULT_PDF_CACHE_DIR):
+    """
+    Text of every page of a PDF. Page ranges are extracted in parallel
+    processes for long documents, and results are cached in `cache_dir`
+    keyed by the file's content hash (an empty cache_dir disables caching).
+    """
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, _file_sha256(pdf_path) + '.json')
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)["pages"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    import PyPDF2
+    with open(pdf_path, 'rb') as f:
+        page_count = len(PyPDF2.PdfReader(f).pages)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, page_count // (PDF_PARALLEL_MIN_PAGES // 2)))
+    if workers == 1 or page_count < PDF_PARALLEL_MIN_PAGES:
+        pages = _extract_pdf_page_range((pdf_path, 0, page_count))
+    else:
+        # Each process parses the file once and extracts one contiguous range
+        step = -(-page_count // workers)
+        ranges = [(pdf_path, i, min(i + step, page_count)) for i in range(0, page_count, step)]
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=len(ranges)) as pool:
+            pages = [page for chunk in pool.map(_extract_pdf_page_range, ranges) for page in chunk]
+
+    if cache_path:
+        # The cache is an optimization; a read-only or full disk must not lose the extracted text
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"pages": pages}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not cache PDF text in {cache_dir}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return pages
+
+# Every line boundary str.splitlines() recognizes
+LINE_BREAK_RE = re.compile(r'\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+def join_pages(pages):
+    """
+    Script text with one newline after each page, and the offset where each
+    page starts. Line breaks (\r\n, form feeds, ...) become '\n', as
+    strip_front_matter makes them, so offsets stay valid after it.
+    """
+    pages = [LINE_BREAK_RE.sub('\n', page) for page in pages]
+    page_offsets = []
+    offset = 0
+    for page in pages:
+        page_offsets.append(offset)
+        offset += len(page) + 1
+    return ''.join(page + "\n" for page in pages), page_offsets
+
+def page_for_offset(page_offsets, offset):
+    """1-based page number containing character `offset` of the joined text."""
+    return max(1, bisect.bisect_right(page_offsets, offset))
+
+def extract_text_from_pdf(pdf_path: str, workers=None, cache_dir=DEFAULT_PDF_CACHE_DIR) -> str:
+    return join_pages(extract_pdf_pages(pdf_path, workers, cache_dir))[0]
 
 def extract_text_from_txt(txt_path: str) -> str:
     with open(txt_path, 'r', encoding='utf-8') as f:
@@ -53,7 +183,81 @@ def normalize_character_name(name):
     name = ' '.join([part.capitalize() for part in name.split(' ')])
     return name
 
-def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, emotion):
+def _trie_pattern(node):
+    alternatives = []
+    is_end = False
+    for ch, child in sorted(node.items()):
+        if ch == '':
+            is_end = True
+            continue
+        alternatives.append(re.escape(ch) + _trie_pattern(child))
+    if not alternatives:
+        return ''
+    body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+    # Greedy optional: longest name first, backtracking to shorter ones
+    return '(?:' + body + ')?' if is_end else body
+
+class CharacterMatcher:
+    """
+    Finds every known character name in a sentence in one regex pass.
+    Names are compiled once per script into a trie-shaped alternation with
+    the same word-boundary and case-insensitive semantics as searching for
+    each name separately.
+    """
+    def __init__(self, names):
+        self.names = list(names)
+        self._index = {name.lower(): i for i, name in enumerate(self.names)}
+        self._pattern = None
+        # the pass reports the longest name at each position, so shorter
+        # names it contains are verified individually
+        self._nested = {}
+        if not self.names:
+            return
+        trie = {}
+        for name in self._index:
+            node = trie
+            for ch in name:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+        self._pattern = re.compile(r'(?=\b(' + _trie_pattern(trie) + r')\b)', re.IGNORECASE)
+        for i, name in enumerate(self.names):
+            lowered = name.lower()
+            nested = [
+                j for j, other in enumerate(self.names)
+                if j != i and other.lower() in lowered
+            ]
+            if nested:
+                self._nested[i] = nested
+        self._single = {}
+
+    def _name_index(self, matched):
+        index = self._index.get(matched.lower())
+        if index is None:
+            # IGNORECASE can fold non-ASCII lookalikes; resolve the slow way
+            index = next(i for i, name in enumerate(self.names) if re.fullmatch(re.escape(name), matched, re.IGNORECASE))
+        return index
+
+    def _single_pattern(self, index):
+        pattern = self._single.get(index)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(self.names[index]) + r'\b', re.IGNORECASE)
+            self._single[index] = pattern
+        return pattern
+
+    def find(self, sentence):
+        """Known names mentioned in `sentence`, in `names` order."""
+        if self._pattern is None:
+            return []
+        hits = set()
+        for m in self._pattern.finditer(sentence):
+            index = self._name_index(m.group(1))
+            hits.add(index)
+            for nested in self._nested.get(index, ()):
+                if nested not in hits and self._single_pattern(nested).search(sentence):
+                    hits.add(nested)
+        return [self.names[i] for i in sorted(hits)]
+
+def split_scene(scene_text):
     lines = scene_text.splitlines()
     char_name_regex = re.compile(r'^\s*([A-Z][A-Z0-9\-\' ]{2,})\s*$')
     scene_heading_regex = re.compile(r'^\s*(INT\.|EXT\.|EST\.|INT/EXT\.|I/E\.|INT-EXT\.|EXT-INT\.)', re.IGNORECASE)
@@ -86,16 +290,122 @@ def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, e
                 narration_lines.append(line)
     if current_char and current_dialog:
         dialog_blocks.append((current_char, current_dialog))
+    return narration_lines, dialog_blocks
+
+def extract_ner_names(ner_result):
+    used_names = []
+    current_name = []
+    last_end = -1
+    for ent in ner_result:
+        if ent['entity'].endswith('PER'):
+            word = ent['word'].strip()
+            if not word or re.match(r'^[\s\W_]*$', word):
+                continue
+            if ent['start'] == last_end + 1:
+                current_name.append(word)
+            else:
+                if current_name:
+                    full_name = normalize_character_name(' '.join(current_name))
+                    if len(full_name) > 2:
+                        used_names.append(full_name)
+                current_name = [word]
+            last_end = ent['end']
+    if current_name:
+        full_name = normalize_character_name(' '.join(current_name))
+        if len(full_name) > 2:
+            used_names.append(full_name)
+    return used_names
+
+def run_ner(ner, sentences, ner_cache, batch_size=8):
+    """
+    Person names found by the NER model in each sentence. Only sentences not
+    already in `ner_cache` (sentence text -> names) go through the model, and
+    their results are added to it. With no NER model every list is empty.
+    """
+    missing = [s for s in dict.fromkeys(sentences) if s not in ner_cache]
+    if missing:
+        if ner is None:
+            ner_cache.update((s, []) for s in missing)
+        else:
+            for s, result in zip(missing, ner(missing, batch_size=batch_size)):
+                ner_cache[s] = extract_ner_names(result)
+    return [ner_cache[s] for s in sentences]
+
+def prepare_scene(scene_text, name_matcher, ner, ner_cache=None):
+    """
+    Everything analyze_scene needs except emotion scores: narration/dialog
+    split, sentences and character mentions. Emotion inputs are collected
+    separately so they can be batched across all scenes.
+    """
+    narration_lines, dialog_blocks = split_scene(scene_text)
+    narration_lines_nonempty = [l for l in narration_lines if l.strip()]
+    narration_text = '\n'.join(narration_lines_nonempty)
+    # --- Character appearance/emotion timeline (as before) ---
+    sentences = split_sentences(scene_text)
+    max_char_length = 512
+    sentences = [s[:max_char_length] for s in sentences if len(s.strip()) > 2]
+    script_char_map = {}
+    for i, s in enumerate(sentences):
+        names = name_matcher.find(s)
+        if names:
+            script_char_map[i] = names
+    characters = set()
+    character_mentions = defaultdict(set)
+    # NER only runs where the name matcher found nobody; its output is ignored elsewhere
+    unmatched = [s for i, s in enumerate(sentences) if i not in script_char_map]
+    ner_names = dict(zip(unmatched, run_ner(ner, unmatched, {} if ner_cache is None else ner_cache)))
+    for i, s in enumerate(sentences):
+        if script_char_map.get(i):
+            used_names = script_char_map[i]
+        else:
+            used_names = ner_names[s]
+        for name in used_names:
+            characters.add(name)
+            character_mentions[name].add(i)
+    has_dialog = any(l.strip() for _, lines in dialog_blocks for l in lines)
+    return {
+        "narration_lines": narration_lines_nonempty,
+        "narration_text": narration_text,
+        "dialog_blocks": dialog_blocks,
+        "sentences": sentences,
+        "characters": characters,
+        "character_mentions": character_mentions,
+        # Sentence emotions are only needed when someone appears in the scene
+        "needs_sentence_emotion": bool(characters) or has_dialog,
+    }
+
+def emotion_inputs(prepared):
+    """Texts whose emotion scores assemble_scene will look up."""
+    inputs = []
+    if prepared["narration_text"].strip():
+        inputs.append(prepared["narration_text"][:512])
+    for _, lines in prepared["dialog_blocks"]:
+        inputs.extend(l[:512] for l in lines if l.strip())
+    if prepared["needs_sentence_emotion"]:
+        inputs.extend(prepared["sentences"])
+    return inputs
+
+def run_emotions(emotion, texts, batch_size=32):
+    """
+    Runs the emotion model once per distinct text, longest first so each
+    padded batch holds texts of similar length. Returns text -> scores.
+    """
+    unique = sorted(set(texts), key=len, reverse=True)
+    if not unique:
+        return {}
+    results = emotion(unique, batch_size=batch_size, top_k=None)
+    return dict(zip(unique, results))
+
+def assemble_scene(prepared, scene_heading, emotions):
+    narration_text = prepared["narration_text"]
+    narration_lines_nonempty = prepared["narration_lines"]
     # --- Narration analysis ---
-    narration_text = '\n'.join([l for l in narration_lines if l.strip()])
     narration_emotion = None
     narration_summary = None
     narration_stats = {}
     if narration_text.strip():
-        narration_emotion = emotion([narration_text[:512]], batch_size=1, top_k=None)[0]
-        narration_emotion = max(narration_emotion, key=lambda x: x['score'])
+        narration_emotion = max(emotions[narration_text[:512]], key=lambda x: x['score'])
         # Scene-level summary: fallback to first and last lines if no summarizer
-        narration_lines_nonempty = [l for l in narration_lines if l.strip()]
         if len(narration_lines_nonempty) > 2:
             narration_summary = narration_lines_nonempty[0] + ' ... ' + narration_lines_nonempty[-1]
         elif narration_lines_nonempty:
@@ -111,12 +421,11 @@ def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, e
     dialog_by_char = defaultdict(lambda: defaultdict(list))
     dialog_emotions = defaultdict(lambda: defaultdict(list))
     dialog_stats_by_char = defaultdict(lambda: defaultdict(dict))
-    for char, lines in dialog_blocks:
+    for char, lines in prepared["dialog_blocks"]:
         emotion_scores = []
         for l in lines:
             if l.strip():
-                emo = emotion([l[:512]], batch_size=1, top_k=None)[0]
-                emo = max(emo, key=lambda x: x['score'])
+                emo = max(emotions[l[:512]], key=lambda x: x['score'])
                 dialog_by_char[char][scene_heading].append({
                     'line': l,
                     'emotion': emo['label'].lower(),
@@ -130,49 +439,12 @@ def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, e
                 'line_count': len(emotion_scores),
                 'avg_emotion_score': float(sum(emotion_scores)) / len(emotion_scores)
             }
-    # --- Character appearance/emotion timeline (as before) ---
-    sentences = sent_tokenize(scene_text)
-    max_char_length = 512
-    sentences = [s[:max_char_length] for s in sentences if len(s.strip()) > 2]
-    script_char_map = {}
-    for i, s in enumerate(sentences):
-        for name in all_character_names:
-            if re.search(r'\b' + re.escape(name) + r'\b', s, re.IGNORECASE):
-                script_char_map.setdefault(i, []).append(name)
-    characters = set()
-    character_mentions = defaultdict(set)
-    ner_results = ner(sentences, batch_size=8)
-    for i, s in enumerate(sentences):
-        used_names = []
-        if script_char_map.get(i):
-            used_names = script_char_map[i]
-        else:
-            current_name = []
-            last_end = -1
-            for ent in ner_results[i]:
-                if ent['entity'].endswith('PER'):
-                    word = ent['word'].strip()
-                    if not word or re.match(r'^[\s\W_]*$', word):
-                        continue
-                    if ent['start'] == last_end + 1:
-                        current_name.append(word)
-                    else:
-                        if current_name:
-                            full_name = normalize_character_name(' '.join(current_name))
-                            if len(full_name) > 2:
-                                used_names.append(full_name)
-                        current_name = [word]
-                    last_end = ent['end']
-            if current_name:
-                full_name = normalize_character_name(' '.join(current_name))
-                if len(full_name) > 2:
-                    used_names.append(full_name)
-        for name in used_names:
-            characters.add(name)
-            character_mentions[name].add(i)
+    sentences = prepared["sentences"]
+    characters = prepared["characters"]
+    character_mentions = prepared["character_mentions"]
     if not characters and not dialog_by_char:
         return {"characters": {}, "scenes": [], "narration": narration_text, "narration_emotion": narration_emotion}
-    emotion_results = emotion(sentences, batch_size=8, top_k=None)
+    emotion_results = [emotions[s] for s in sentences]
     palette = [
         '#f54242', '#4287f5', '#42f554', '#f5e142', '#a142f5', '#f57e42', '#42f5e6', '#e642f5', '#f542a7', '#42f5b9', '#b9f542', '#f5b942', '#42b9f5', '#b942f5', '#f54242'
     ]
@@ -215,11 +487,101 @@ def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, e
         }
     }
 
-def analyze_script_scenes(text, device='cpu'):
+def analyze_scene(scene_text, scene_heading, all_character_names, device, ner, emotion):
+    prepared = prepare_scene(scene_text, CharacterMatcher(all_character_names), ner)
+    emotions = run_emotions(emotion, emotion_inputs(prepared))
+    return assemble_scene(prepared, scene_heading, emotions)
+
+def load_pipelines(device, emotion_batch_size=32, ner_model=DEFAULT_NER_MODEL):
+    from transformers import pipeline
+    # An empty or "none" model disables NER; only the script's own names are matched
+    ner = None
+    if ner_model and ner_model.lower() != 'none':
+        ner = pipeline(
+            "ner",
+            model=ner_model,
+            tokenizer=ner_model,
+            device=0 if device == 'cuda' else -1,
+            batch_size=8
+        )
+    emotion = pipeline(
+        "text-classification",
+        model="j-hartmann/emotion-english-distilroberta-base",
+        tokenizer="j-hartmann/emotion-english-distilroberta-base",
+        device=0 if device == 'cuda' else -1,
+        batch_size=emotion_batch_size,
+        top_k=None
+    )
+    return ner, emotion
+
+def analyze_scene_group(scene_group, name_matcher, ner, emotion, emotion_batch_size=32, ner_cache=None):
+    """
+    Analyzes (scene_text, heading) pairs: prepares every scene, runs the
+    emotion model once over all distinct inputs of the group and scatters
+    the scores back per scene. Pass the same `ner_cache` for every group of
+    a script so repeated sentences are only run through NER once.
+    """
+    if ner_cache is None:
+        ner_cache = {}
+    prepared_scenes = [prepare_scene(scene_text, name_matcher, ner, ner_cache) for scene_text, _ in scene_group]
+    all_inputs = [text for prepared in prepared_scenes for text in emotion_inputs(prepared)]
+    emotions = run_emotions(emotion, all_inputs, batch_size=emotion_batch_size)
+    return [
+        assemble_scene(prepared, heading, emotions)
+        for prepared, (_, heading) in zip(prepared_scenes, scene_group)
+    ]
+
+# Per-process state for --workers mode, set once by _init_worker
+_worker_state = {}
+
+def _init_worker(device, emotion_batch_size, all_character_names, torch_threads, ner_model):
+    import torch
+    # Split the cores between workers instead of every process using all of them
+    torch.set_num_threads(torch_threads)
+    ner, emotion = load_pipelines(device, emotion_batch_size, ner_model)
+    _worker_state.update(
+        ner=ner,
+        emotion=emotion,
+        name_matcher=CharacterMatcher(all_character_names),
+        emotion_batch_size=emotion_batch_size,
+        # The pool lives for one script, so this is a per-script cache
+        ner_cache={},
+    )
+
+def _analyze_group_in_worker(scene_group):
+    state = _worker_state
+    return analyze_scene_group(
+        scene_group, state["name_matcher"], state["ner"], state["emotion"], state["emotion_batch_size"],
+        state["ner_cache"],
+    )
+
+def analyze_scenes_parallel(scene_group, all_character_names, device, emotion_batch_size, workers, torch_threads=None,
+                            ner_model=DEFAULT_NER_MODEL):
+    """
+    Spreads scenes over a process pool; each worker loads the models once.
+    Results come back in scene order.
+    """
+    if torch_threads is None:
+        torch_threads = max(1, (os.cpu_count() or 1) // workers)
+    # Several small groups per worker keeps the pool balanced when scene sizes vary
+    group_size = max(1, -(-len(scene_group) // (workers * 4)))
+    groups = [scene_group[i:i + group_size] for i in range(0, len(scene_group), group_size)]
+    # spawn: forking a process that already initialized torch threads can deadlock
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(device, emotion_batch_size, all_character_names, torch_threads, ner_model),
+    ) as pool:
+        return [result for group_results in pool.imap(_analyze_group_in_worker, groups) for result in group_results]
+
+def analyze_script_scenes(text, device='cpu', emotion_batch_size=32, workers=1, torch_threads=None,
+                          ner_model=DEFAULT_NER_MODEL, page_offsets=None):
     # Scene recognition regex (matches App.jsx)
     scene_regex = re.compile(r'^\s*(INT\.|EXT\.|EST\.|INT/EXT\.|I/E\.|INT-EXT\.|EXT-INT\.).*$', re.MULTILINE)
     scenes = []
     scene_headings = []
+    scene_starts = []
     last_index = 0
     matches = list(scene_regex.finditer(text))
     for idx, match in enumerate(matches):
@@ -227,6 +589,7 @@ def analyze_script_scenes(text, device='cpu'):
             scene_text = text[last_index:match.start()].strip()
             if scene_text:
                 scenes.append(scene_text)
+                scene_starts.append(last_index)
         scene_headings.append(match.group(0).strip())
         last_index = match.end()
     # Add last scene
@@ -234,9 +597,11 @@ def analyze_script_scenes(text, device='cpu'):
         scene_text = text[last_index:].strip()
         if scene_text:
             scenes.append(scene_text)
+            scene_starts.append(last_index)
     if not scenes:
         scenes = [text]
         scene_headings = ["Scene 1"]
+        scene_starts = [0]
     # Extract all-caps character names from the script
     character_name_regex = re.compile(r'^\s*([A-Z][A-Z0-9\-\' ]{2,})(?=\n|,|\(|$)', re.MULTILINE)
     all_character_names = set()
@@ -245,34 +610,29 @@ def analyze_script_scenes(text, device='cpu'):
         if not re.match(r'^\s*(INT\.|EXT\.|EST\.|INT/EXT\.|I/E\.|INT-EXT\.|EXT-INT\.)', name):
             all_character_names.add(name)
     all_character_names = list(all_character_names)
-    # Load local pipelines once
-    ner = pipeline(
-        "ner",
-        model="dbmdz/bert-large-cased-finetuned-conll03-english",
-        tokenizer="dbmdz/bert-large-cased-finetuned-conll03-english",
-        device=0 if device == 'cuda' else -1,
-        batch_size=8
-    )
-    emotion = pipeline(
-        "text-classification",
-        model="j-hartmann/emotion-english-distilroberta-base",
-        tokenizer="j-hartmann/emotion-english-distilroberta-base",
-        device=0 if device == 'cuda' else -1,
-        batch_size=8,
-        top_k=None
-    )
-    # Analyze each scene
-    scene_results = []
-    for i, scene_text in enumerate(scenes):
-        heading = scene_headings[i] if i < len(scene_headings) else f"Scene {i+1}"
-        result = analyze_scene(scene_text, heading, all_character_names, device, ner, emotion)
-        scene_results.append(result)
+    scene_group = [
+        (scene_text, scene_headings[i] if i < len(scene_headings) else f"Scene {i+1}")
+        for i, scene_text in enumerate(scenes)
+    ]
+    if workers > 1 and len(scene_group) > 1:
+        scene_results = analyze_scenes_parallel(
+            scene_group, all_character_names, device, emotion_batch_size, workers, torch_threads, ner_model
+        )
+    else:
+        # Load local pipelines once
+        ner, emotion = load_pipelines(device, emotion_batch_size, ner_model)
+        scene_results = analyze_scene_group(
+            scene_group, CharacterMatcher(all_character_names), ner, emotion, emotion_batch_size
+        )
     # Merge all scene results
     merged = {"characters": {}, "scenes": []}
     merged["scenes"] = [
         {"label": scene_headings[i] if i < len(scene_headings) else f"Scene {i+1}", "t": i / max(1, len(scene_results))}
         for i in range(len(scene_results))
     ]
+    if page_offsets:
+        for scene, start in zip(merged["scenes"], scene_starts):
+            scene["page"] = page_for_offset(page_offsets, start)
     for result in scene_results:
         for char, data in result["characters"].items():
             if char not in merged["characters"]:
@@ -284,25 +644,59 @@ def analyze_script_scenes(text, device='cpu'):
 def main():
     parser = argparse.ArgumentParser(description="Analyze a script file (.txt or .pdf) and output script-analysis.json.")
     parser.add_argument('script_file', help="Path to the script file (.txt or .pdf)")
-    parser.add_argument('-o', '--output', default='script-analysis.json', help="Output JSON file name")
+    parser.add_argument('-o', '--output', default=None,
+                        help="Output file name (default: script-analysis.json, or script-analysis.toccol for --format compact)")
+    parser.add_argument('--format', choices=('json', 'compact'), default='json',
+                        help="compact writes the columnar format read by analysis_format.CompactAnalysisReader")
     parser.add_argument('--device', default=None, help="Device to use: 'cpu' or 'cuda'")
+    parser.add_argument('--batch-size', type=int, default=32, help="Emotion model batch size")
+    parser.add_argument('--workers', type=int, default=1, help="Number of worker processes to spread scenes over")
+    parser.add_argument('--threads-per-worker', type=int, default=None, help="Torch threads per worker (default: cores / workers)")
+    parser.add_argument('--pdf-workers', type=int, default=None, help="Processes for PDF page extraction (default: all cores)")
+    parser.add_argument('--pdf-cache-dir', default=DEFAULT_PDF_CACHE_DIR,
+                        help="Where extracted PDF text is cached by content hash; empty to disable")
+    parser.add_argument('--ner-model', default=DEFAULT_NER_MODEL,
+                        help="NER model for sentences that name no known character, e.g. the lighter "
+                             "dslim/bert-base-NER, or 'none' to skip NER")
     args = parser.parse_args()
 
     ext = os.path.splitext(args.script_file)[1].lower()
+    page_offsets = None
     if ext == '.pdf':
-        text = extract_text_from_pdf(args.script_file)
+        text, page_offsets = join_pages(extract_pdf_pages(args.script_file, args.pdf_workers, args.pdf_cache_dir))
     elif ext == '.txt':
         text = extract_text_from_txt(args.script_file)
     else:
         print("Unsupported file type. Please provide a .txt or .pdf file.")
         return
 
-    text = strip_front_matter(text)
+    full_text = text
+    text, shift = strip_front_matter(text)
+    if page_offsets:
+        # Front matter is cut from the start, so page offsets shift with it
+        if full_text[shift:shift + len(text)] == text:
+            page_offsets = [offset - shift for offset in page_offsets]
+        else:
+            print("Warning: could not map PDF page offsets onto the script text; scenes will have no page numbers")
+            page_offsets = None
     device = get_device(args.device)
-    result = analyze_script_scenes(text, device=device)
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2)
-    print(f"Analysis complete. Output written to {args.output}")
+    result = analyze_script_scenes(
+        text,
+        device=device,
+        emotion_batch_size=args.batch_size,
+        workers=args.workers,
+        torch_threads=args.threads_per_worker,
+        ner_model=args.ner_model,
+        page_offsets=page_offsets,
+    )
+    output = args.output or ('script-analysis.toccol' if args.format == 'compact' else 'script-analysis.json')
+    if args.format == 'compact':
+        from analysis_format import write_compact_analysis
+        write_compact_analysis(result, output)
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    print(f"Analysis complete. Output written to {output}")
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,7 @@ import argparse
 import os
 import json
 import re
+import sys
 
 
 def clean_text(text):
@@ -36,11 +37,26 @@ def is_transition(text):
     return is_all_caps(text) and text.endswith("TO:")
 
 
-def next_non_empty_line(sanitized_lines, start_index):
-    for idx in range(start_index, len(sanitized_lines)):
-        if sanitized_lines[idx]:
-            return sanitized_lines[idx]
-    return None
+def iter_sanitized_lines(lines):
+    """
+    Yields (text, next_text, blank_after) for each non-empty line, where
+    next_text is the next non-empty line (or None) and blank_after says
+    whether blank lines sit in between. Reads one line ahead at a time and
+    only counts blank runs, so memory stays constant however long they are.
+    """
+    current = None
+    blank_after = False
+    for line in lines:
+        text = clean_text(line.rstrip("\n\r"))
+        if not text:
+            blank_after = True
+            continue
+        if current is not None:
+            yield current, text, blank_after
+        current = text
+        blank_after = False
+    if current is not None:
+        yield current, None, blank_after
 
 
 def is_character_line(text, next_text):
@@ -61,15 +77,17 @@ def is_character_line(text, next_text):
     return True
 
 
-def parse_script_lines(lines):
+def iter_script_blocks(lines):
+    """
+    Generator version of parse_script_lines: consumes any iterable of lines
+    (e.g. an open file) lazily and yields blocks as soon as they are complete.
+    """
     blocks = []
     action_buffer = []
     dialogue_buffer = []
     expecting_dialogue = False
     last_emitted_type = None
 
-    sanitized_lines = [clean_text(line.rstrip("\n\r")) for line in lines]
-
     def emit_block(script_type, text):
         nonlocal last_emitted_type
         cleaned = clean_text(text)
@@ -90,35 +108,29 @@ def parse_script_lines(lines):
             emit_block("dialogue", " ".join(dialogue_buffer))
             dialogue_buffer = []
 
-    for index, text in enumerate(sanitized_lines):
-        next_text = next_non_empty_line(sanitized_lines, index + 1)
-
-        if not text:
-            flush_dialogue()
-            flush_action()
-            expecting_dialogue = False
-            continue
+    def classify(text, next_text):
+        nonlocal expecting_dialogue
 
         if is_scene_heading(text):
             flush_dialogue()
             flush_action()
             emit_block("scene", text)
             expecting_dialogue = False
-            continue
+            return
 
         if is_transition(text):
             flush_dialogue()
             flush_action()
             emit_block("transition", text)
             expecting_dialogue = False
-            continue
+            return
 
         if is_character_line(text, next_text):
             flush_dialogue()
             flush_action()
             emit_block("character", text)
             expecting_dialogue = True
-            continue
+            return
 
         if PARENTHETICAL_RE.match(text):
             if expecting_dialogue or last_emitted_type in {
@@ -133,20 +145,57 @@ def parse_script_lines(lines):
                 flush_dialogue()
                 action_buffer.append(text)
                 expecting_dialogue = False
-            continue
+            return
 
         if expecting_dialogue:
             dialogue_buffer.append(text)
-            continue
+            return
 
         flush_dialogue()
         action_buffer.append(text)
         expecting_dialogue = False
 
+    for text, next_text, blank_after in iter_sanitized_lines(lines):
+        classify(text, next_text)
+        # A run of blank lines ends any open dialogue or action block
+        if blank_after:
+            flush_dialogue()
+            flush_action()
+            expecting_dialogue = False
+        if blocks:
+            yield from blocks
+            blocks.clear()
+
     flush_dialogue()
     flush_action()
+    yield from blocks
+
+
+def parse_script_lines(lines):
+    return list(iter_script_blocks(lines))
+
+
+def write_json_blocks(blocks, f):
+    """
+    Writes the toc-script-v1 payload one block at a time. Output is
+    byte-identical to json.dump(payload, f, indent=2, ensure_ascii=False).
+    """
+    f.write('{\n  "version": 1,\n  "format": "toc-script-v1",\n  "blocks": [')
+    count = 0
+    for block in blocks:
+        encoded = json.dumps(block, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        f.write(("," if count else "") + "\n    " + encoded)
+        count += 1
+    f.write("\n  ]\n}" if count else "]\n}")
+    return count
+
 
-    return blocks
+def write_ndjson_blocks(blocks, f):
+    count = 0
+    for block in blocks:
+        f.write(json.dumps(block, ensure_ascii=False) + "\n")
+        count += 1
+    return count
 
 
 def main():
@@ -162,7 +211,16 @@ def main():
         default=None,
         help=(
             "Optional output file path. Defaults to the same folder and same basename "
-            "as the input with a .json extension."
+            "as the input with a .json (or .ndjson) extension. Use - for stdout."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help=(
+            "json writes the toc-script-v1 document; ndjson writes one block per line. "
+            "Both are written as the input is read, so memory use does not grow with the script."
         ),
     )
     args = parser.parse_args()
@@ -171,31 +229,30 @@ def main():
         print(f"File not found: {args.script_file}")
         return
 
-    with open(args.script_file, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    blocks = parse_script_lines(lines)
-    payload = {
-        "version": 1,
-        "format": "toc-script-v1",
-        "blocks": blocks,
-    }
+    write_blocks = write_ndjson_blocks if args.format == "ndjson" else write_json_blocks
 
     if args.output:
         output_path = args.output
     else:
         input_dir = os.path.dirname(os.path.abspath(args.script_file))
         base_name = os.path.splitext(os.path.basename(args.script_file))[0]
-        output_path = os.path.join(input_dir, f"{base_name}.json")
+        output_path = os.path.join(input_dir, f"{base_name}.{args.format}")
+
+    with open(args.script_file, "r", encoding="utf-8") as f:
+        blocks = iter_script_blocks(f)
+        if output_path == "-":
+            count = write_blocks(blocks, sys.stdout)
+            print(f"Parsing complete. {count} blocks written to stdout", file=sys.stderr)
+            return
 
-    output_dir = os.path.dirname(os.path.abspath(output_path))
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+        with open(output_path, "w", encoding="utf-8") as out:
+            count = write_blocks(blocks, out)
 
-    print(f"Parsing complete. Output written to {output_path}")
+    print(f"Parsing complete. {count} blocks written to {output_path}")
 
 if __name__ == "__main__":
     main()
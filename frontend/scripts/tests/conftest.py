@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The scripts import each other flat (e.g. `from analysis_format import ...`), as analyze.py does.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from analysis_format import SENTENCE_BLOCK_SIZE, CompactAnalysisReader, load_compact_analysis, write_compact_analysis
+
+EMOTIONS = ["joy", "anger", "fear", "sadness", "neutral"]
+
+
+def make_result(character_count=6, scene_count=40, pages=True, seed=3):
+    rng = random.Random(seed)
+    scenes = [{"label": f"INT. ROOM {i} - NIGHT", "t": round(i / scene_count, 4)} for i in range(scene_count)]
+    if pages:
+        for i, scene in enumerate(scenes):
+            scene["page"] = i // 4 + 1
+    characters = {}
+    for c in range(character_count):
+        appearances = []
+        timeline = []
+        dialog = {}
+        for position in range(rng.randint(60, 120)):
+            scene = rng.choice(scenes)["label"]
+            emotion = rng.choice(EMOTIONS)
+            appearances.append({
+                "scene": scene,
+                "position": position,
+                "emotion": emotion,
+                "sentiment": round(rng.uniform(-1, 1), 4),
+                "linkedCharacters": [],
+                # Some sentences repeat across characters, which the sentence table interns
+                "text": f"Sentence {rng.randint(0, 400)} from the script.",
+            })
+            timeline.append({"position": position, "emotion": emotion, "scene": scene})
+            if rng.random() < 0.3:
+                dialog.setdefault(scene, []).append({"line": f"Line {position}", "emotion": emotion, "score": 0.5})
+        characters[f"CHARACTER {c}"] = {
+            "color": f"#{c:02x}{c:02x}ff",
+            "appearances": appearances,
+            "emotionTimeline": timeline,
+            "dialog": dialog,
+            "dialog_stats": {
+                heading: {"line_count": len(lines), "avg_emotion_score": 0.5} for heading, lines in dialog.items()
+            },
+        }
+    return {"characters": characters, "scenes": scenes}
+
+
+def test_round_trip_matches_the_json_structure(tmp_path):
+    result = make_result()
+    path = tmp_path / "analysis.toccol"
+    write_compact_analysis(result, path)
+
+    assert load_compact_analysis(path) == result
+
+
+def test_round_trip_without_pages_or_characters(tmp_path):
+    result = {"characters": {}, "scenes": make_result(0, 5, pages=False)["scenes"]}
+    path = tmp_path / "analysis.toccol"
+    write_compact_analysis(result, path)
+
+    assert load_compact_analysis(path) == result
+
+
+def test_linked_characters_are_kept_when_present(tmp_path):
+    result = make_result(2, 5)
+    result["characters"]["CHARACTER 0"]["appearances"][0]["linkedCharacters"] = ["CHARACTER 1"]
+    path = tmp_path / "analysis.toccol"
+    write_compact_analysis(result, path)
+
+    assert load_compact_analysis(path) == result
+
+
+def test_reader_decompresses_only_the_blocks_a_character_needs(tmp_path):
+    result = make_result()
+    path = tmp_path / "analysis.toccol"
+    write_compact_analysis(result, path)
+
+    with CompactAnalysisReader(path) as reader:
+        assert len(reader.header["sentenceBlocks"]) > 1
+        assert reader.character_names == list(result["characters"])
+        assert reader.scenes() == result["scenes"]
+        name = reader.character_names[2]
+        assert reader.character(name) == result["characters"][name]
+        needed = {
+            index // SENTENCE_BLOCK_SIZE
+            for index in reader._section(reader.header["characters"][name]["section"])["appearances"]["sentence"]
+        }
+        assert set(reader._sentence_blocks) == needed
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "analysis.json"
+    path.write_text('{"characters": {}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        CompactAnalysisReader(path)
@@ -0,0 +1,23 @@
+from analyze import join_pages, page_for_offset, strip_front_matter
+
+
+def test_page_offsets_survive_front_matter_and_odd_line_breaks():
+    pages = [
+        "MY SCRIPT\r\n\r\nWritten by\r\nSomeone\r\n",
+        "INT. KITCHEN - NIGHT\x0cJOHN\r\nHello. ",
+        "EXT. ROAD - DAY\rMARY\nBye.",
+    ]
+    full_text, page_offsets = join_pages(pages)
+    text, shift = strip_front_matter(full_text)
+
+    assert text.startswith("INT. KITCHEN - NIGHT\nJOHN\nHello.")
+    assert full_text[shift:shift + len(text)] == text
+    offsets = [offset - shift for offset in page_offsets]
+    assert page_for_offset(offsets, text.index("INT. KITCHEN")) == 2
+    assert page_for_offset(offsets, text.index("EXT. ROAD")) == 3
+    assert page_for_offset(offsets, text.index("Bye.")) == 3
+
+
+def test_text_without_front_matter_is_kept_whole():
+    text = "INT. ROOM - DAY\nJOHN\nHi."
+    assert strip_front_matter(text) == (text, 0)